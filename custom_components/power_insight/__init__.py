@@ -3,20 +3,29 @@
 import logging
 from dataclasses import dataclass
 
-from homeassistant.config_entries import ConfigEntry
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
 from homeassistant.helpers import issue_registry as ir
 from homeassistant.core import HomeAssistant
 from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.typing import ConfigType
 
 from .const import (
     CONF_CHARGE_FROM_ADAPTERS,
+    DATA_BLUEPRINTS,
     DOMAIN,
     PLATFORMS,
 )
 from .utils import state_to_value
 from .power_insight import PowerInsight
 from .event_handler import EventHandler
-from .adapter_models import ADAPTER_MODELS
+from .checkpoint import CheckpointStore
+from .ledger import LevelizedLedger
+from .units import UnitResolver
+from .instrumentation import Instrumentation
+from .reconfigure import async_apply_hot_update, static_config
+from .adapter_models import create_power_insight
+from .profiler import async_register_profile_service
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -24,6 +33,8 @@ _LOGGER = logging.getLogger(__name__)
 
 type MyConfigEntry = ConfigEntry[MyData]
 
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
 
 @dataclass
 class MyData:
@@ -31,25 +42,24 @@ class MyData:
 
     power_insight: PowerInsight
     event_handler: EventHandler
+    checkpoints: CheckpointStore
+    ledger: LevelizedLedger
+    units: UnitResolver
+    # ``reconfigure.static_config`` at setup; a hot update must keep it.
+    static_config: str
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
-    """Init the Mygrid instance from the config entry."""
-    power_insight = PowerInsight()
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Register the integration-wide services."""
+    async_register_profile_service(hass)
+    return True
 
-    for subentry in entry.subentries.values():
-        adapter_type = subentry.data["adapter"].get("adapter_type")
-        if not adapter_type:
-            continue
 
-        model_cls = ADAPTER_MODELS.get(adapter_type)
-        if model_cls is None:
-            _LOGGER.warning("Unknown adapter type %r in subentry %s — skipping.", adapter_type, subentry.subentry_id)
-            continue
+async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
+    """Init the Mygrid instance from the config entry."""
+    power_insight = create_power_insight(entry.subentries.values())
+    power_insight.instrumentation = Instrumentation()
 
-        model = model_cls.from_subentry(subentry)
-        power_insight.register_adapter(model.create_adapter())
-    
     if power_insight.grid_adapter is None:
         # Without a grid connection nothing can be calculated; raise a repair
         # issue and set up with no tracked entities. The shared tail below still
@@ -105,7 +115,18 @@ async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
     # --- Shared setup tail (runs for both the grid and no-grid paths) ---
     event_handler = EventHandler(hass, entry.entry_id, power_insight)
     event_handler.track_entities(source_entities)
-    entry.runtime_data = MyData(power_insight, event_handler)
+    # Loaded once here so every accumulator restores from memory.
+    checkpoints = CheckpointStore(hass, entry.entry_id)
+    await checkpoints.async_load()
+    entry.runtime_data = MyData(
+        power_insight,
+        event_handler,
+        checkpoints,
+        LevelizedLedger(entry),
+        UnitResolver(hass),
+        static_config(entry),
+    )
+    entry.async_on_unload(entry.runtime_data.units.async_start())
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     entry.async_on_unload(entry.add_update_listener(async_update_listener))
 
@@ -118,7 +139,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
 async def async_update_listener(
     hass: HomeAssistant, entry: MyConfigEntry
 ) -> None:
-    """Handle config_entry updates."""
+    """Handle config_entry updates.
+
+    Adapter settings that only change how values are calculated are applied to
+    the live engine; anything else reloads the entry.
+    """
+    if entry.state is ConfigEntryState.LOADED and async_apply_hot_update(hass, entry):
+        return
     await hass.config_entries.async_reload(entry.entry_id)
 
 
@@ -131,10 +158,19 @@ async def async_unload_entry(
     data = entry.runtime_data
     event_handler = data.event_handler
     event_handler.untrack_entities()
+    await data.checkpoints.async_shutdown()
 
     return unload
 
 
+async def async_remove_entry(
+    hass: HomeAssistant, entry: MyConfigEntry
+) -> None:
+    """Delete the entry's accumulator checkpoints and cached blueprints."""
+    await CheckpointStore(hass, entry.entry_id).async_remove()
+    hass.data.get(DATA_BLUEPRINTS, {}).pop(entry.entry_id, None)
+
+
 async def async_migrate_entry(
     hass: HomeAssistant, entry: MyConfigEntry,
 ) -> bool:
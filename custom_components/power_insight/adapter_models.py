@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING
 
 from .const import (
     CONF_POWER_ENTITY, CONF_POWER_ENTITY_INVERTED,
@@ -15,16 +18,21 @@ from .const import (
     CONF_LIFETIME_COST, CONF_LIFETIME_PRODUCTION, CONF_CO2_FOOTPRINT,
 )
 from .power_insight import (
-    GridAdapter, PvAdapter, BatteryAdapter, ConsumerAdapter,
+    GridAdapter, PvAdapter, BatteryAdapter, ConsumerAdapter, PowerInsight,
 )
 
+if TYPE_CHECKING:
+    from homeassistant.config_entries import ConfigSubentry
+
+_LOGGER = logging.getLogger(__name__)
+
 
 def _lcoe_from_lifetime(data: dict) -> float | None:
     """Derive a base LCOE/LCOS (EUR/kWh) from stored lifetime values.
 
     Used to backfill the immutable base intensity when it was never computed at
     create time (e.g. lifetime data was added later via reconfigure, which does
-    not recompute the base). Mirrors ``calculate_lcoe`` in config_flow.py.
+    not recompute the base). Mirrors ``calculate_lcoe`` in flow_helpers.py.
     """
     cost = data.get(CONF_LIFETIME_COST)
     production = data.get(CONF_LIFETIME_PRODUCTION)
@@ -34,7 +42,7 @@ def _lcoe_from_lifetime(data: dict) -> float | None:
 def _co2_intensity_from_lifetime(data: dict) -> float | None:
     """Derive a base CO2 intensity (g/kWh) from stored lifetime values.
 
-    Mirrors ``calculate_co2_intensity`` in config_flow.py.
+    Mirrors ``calculate_co2_intensity`` in flow_helpers.py.
     """
     footprint = data.get(CONF_CO2_FOOTPRINT)
     production = data.get(CONF_LIFETIME_PRODUCTION)
@@ -231,3 +239,25 @@ class ConsumerAdapterModel:
             power_entity=self.power_entity,
             power_entity_inverted=self.power_entity_inverted,
         )
+
+
+def create_power_insight(subentries: Iterable[ConfigSubentry]) -> PowerInsight:
+    """Build a ``PowerInsight`` engine with one adapter per adapter subentry.
+
+    Used by entry setup and by the history backfill, which replays recorder
+    data through a private engine so the live one is never touched.
+    """
+    power_insight = PowerInsight()
+    for subentry in subentries:
+        adapter_type = subentry.data["adapter"].get("adapter_type")
+        if not adapter_type:
+            continue
+
+        model_cls = ADAPTER_MODELS.get(adapter_type)
+        if model_cls is None:
+            _LOGGER.warning("Unknown adapter type %r in subentry %s — skipping.", adapter_type, subentry.subentry_id)
+            continue
+
+        model = model_cls.from_subentry(subentry)
+        power_insight.register_adapter(model.create_adapter())
+    return power_insight
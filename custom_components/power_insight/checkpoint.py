@@ -0,0 +1,146 @@
+"""Batched persistence of accumulator checkpoints.
+
+``RestoreSensor`` only persists a running total on its periodic dump and on a
+clean shutdown, so a crash loses up to one dump interval of accounting. The
+``CheckpointStore`` keeps every accumulator of a config entry in one compact
+record instead:
+
+- **Delta log** — each integration step records the sensor's new totals in
+  memory; the first one after a write schedules the next write of only the
+  values changed since the last checkpoint, ``DELTA_SAVE_DELAY`` later. Later
+  steps join that write rather than postponing it, so under continuous load
+  the log is still written every ``DELTA_SAVE_DELAY``.
+- **Checkpoint** — every ``CHECKPOINT_INTERVAL`` the deltas are folded into a
+  full record and the delta log is reset.
+
+Both records carry a sequence number; on load the delta is applied on top of
+the checkpoint only if it was written after it, so a crash between the two
+writes never replays stale values. Setup reads both records once and the
+sensors restore from memory rather than each asking ``RestoreEntity``.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal, InvalidOperation
+import logging
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+CHECKPOINT_INTERVAL = timedelta(minutes=5)
+# Seconds; every integration step in the window joins one write.
+DELTA_SAVE_DELAY = 10
+
+
+class CheckpointStore:
+    """Per-entry store of accumulator ``(_state, _last_valid_state)`` pairs."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialise the store for one config entry."""
+        self.hass = hass
+        self._checkpoint_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.checkpoint"
+        )
+        self._delta_store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.checkpoint_delta"
+        )
+        self._seq = 0
+        # unique_id -> [state, last_valid_state] as strings (Decimal-exact).
+        self._values: dict[str, list[str | None]] = {}
+        self._delta: dict[str, list[str | None]] = {}
+        self._cancel_interval: CALLBACK_TYPE | None = None
+        self._cancel_flush: CALLBACK_TYPE | None = None
+
+    async def async_load(self) -> None:
+        """Read the newest checkpoint (+ delta) and start the checkpoint timer."""
+        checkpoint = await self._checkpoint_store.async_load() or {}
+        delta = await self._delta_store.async_load() or {}
+        self._seq = checkpoint.get("seq", 0)
+        self._values = dict(checkpoint.get("values", {}))
+        if delta.get("seq") == self._seq:
+            self._values.update(delta.get("values", {}))
+        self._cancel_interval = async_track_time_interval(
+            self.hass, self._async_checkpoint_interval, CHECKPOINT_INTERVAL
+        )
+
+    def get(self, unique_id: str) -> tuple[Decimal | None, Decimal | None] | None:
+        """Return the stored ``(state, last_valid_state)`` for a sensor, if any."""
+        if (entry := self._values.get(unique_id)) is None:
+            return None
+        try:
+            return tuple(
+                Decimal(value) if value is not None else None for value in entry
+            )  # type: ignore[return-value]
+        except InvalidOperation:
+            _LOGGER.error("Discarding corrupted checkpoint for %s", unique_id)
+            return None
+
+    @callback
+    def record(
+        self,
+        unique_id: str,
+        state: Decimal | None,
+        last_valid_state: Decimal | None,
+    ) -> None:
+        """Record a sensor's new totals; written with the pending delta flush."""
+        entry = [
+            str(state) if state is not None else None,
+            str(last_valid_state) if last_valid_state is not None else None,
+        ]
+        self._values[unique_id] = entry
+        self._delta[unique_id] = entry
+        # Not rescheduled per step: that would postpone it indefinitely.
+        if self._cancel_flush is None:
+            self._cancel_flush = async_call_later(
+                self.hass, DELTA_SAVE_DELAY, self._async_flush_delta
+            )
+
+    async def _async_flush_delta(self, now: datetime) -> None:
+        """Write the delta log on the flush timer."""
+        self._cancel_flush = None
+        await self._delta_store.async_save(self._delta_data())
+
+    @callback
+    def _delta_data(self) -> dict[str, Any]:
+        """Return the delta record (evaluated at write time)."""
+        return {"seq": self._seq, "values": self._delta}
+
+    async def _async_checkpoint_interval(self, now: datetime) -> None:
+        """Fold the delta log into a new checkpoint on the timer."""
+        await self.async_checkpoint()
+
+    async def async_checkpoint(self) -> None:
+        """Write a full checkpoint and reset the delta log."""
+        if not self._delta:
+            return
+        self._seq += 1
+        self._delta = {}
+        await self._checkpoint_store.async_save(
+            {"seq": self._seq, "values": dict(self._values)}
+        )
+        # The delta record now predates the checkpoint; rewrite it empty so a
+        # stale one is never applied on top of this checkpoint.
+        await self._delta_store.async_save(self._delta_data())
+
+    async def async_shutdown(self) -> None:
+        """Stop the timer and write a final checkpoint (entry unload)."""
+        if self._cancel_interval is not None:
+            self._cancel_interval()
+            self._cancel_interval = None
+        if self._cancel_flush is not None:
+            self._cancel_flush()
+            self._cancel_flush = None
+        await self.async_checkpoint()
+
+    async def async_remove(self) -> None:
+        """Delete both records (entry removal)."""
+        await self._checkpoint_store.async_remove()
+        await self._delta_store.async_remove()
@@ -17,6 +17,9 @@ PLATFORMS = [Platform.SENSOR]
 
 DOMAIN = "power_insight"
 
+# hass.data key of the per-entry sensor blueprint cache (see sensor.py)
+DATA_BLUEPRINTS = f"{DOMAIN}_blueprints"
+
 # Structural keys
 CONF_KEY = "key"
 CONF_ADAPTER_TYPE = "adapter_type"
@@ -68,6 +71,27 @@ CONF_CALCULATE_INSTANTANEOUS_SAVING_RATES = "calculate_instantaneous_saving_rate
 CONF_CALCULATE_ACCUMULATED_ENTITIES = "calculate_accumulated_entities"
 
 CONF_ENABLE_DEBUG_ENTITIES = "debug_power_entities"
+# Distribution sensors refresh on a slow timer instead of on every source event
+# (global option, stored flat next to debug_power_entities).
+CONF_LAZY_DISTRIBUTION_SENSORS = "lazy_distribution_sensors"
+LAZY_REFRESH_INTERVAL = 300
+# One hub entity mirroring the whole result table in its attributes (global).
+CONF_ENABLE_SNAPSHOT_ENTITY = "snapshot_entity"
+# Diagnostic sensors for the entry's tick rate, evaluation time and write rate,
+# polled from its instrumentation every LATENCY_REFRESH_INTERVAL s (global).
+CONF_ENABLE_LATENCY_ENTITIES = "latency_entities"
+LATENCY_REFRESH_INTERVAL = 60
+
+# Accumulator timer (global options, stored flat next to debug_power_entities).
+# Bounds are in seconds; the fixed 60 s interval applies while adaptive is off.
+CONF_ADAPTIVE_SUB_INTERVAL = "adaptive_sub_interval"
+CONF_MIN_SUB_INTERVAL = "min_sub_interval"
+CONF_MAX_SUB_INTERVAL = "max_sub_interval"
+DEFAULT_MIN_SUB_INTERVAL = 15
+DEFAULT_MAX_SUB_INTERVAL = 900
+# Numerical integration method of every accumulator (see entity.py).
+CONF_INTEGRATION_METHOD = "integration_method"
+DEFAULT_INTEGRATION_METHOD = "trapezoidal"
 # Legacy combined power-share toggle (pre-redesign); kept only so the options
 # migration can read it. Superseded by the distribution/share keys below.
 CONF_ENABLE_POWER_SHARES = "enable_power_shares"
@@ -78,6 +102,9 @@ CONF_ENABLE_DISTRIBUTION_RATIOS = "enable_distribution_ratios"    # *_ratio %
 CONF_ENABLE_DISTRIBUTION_SHARES = "enable_distribution_shares"    # *_share %
 CONF_ENABLE_CHARGING_SOURCE_SHARES = "enable_charging_source_shares"  # battery
 CONF_ENABLE_POWER_SOURCE_SHARES = "enable_power_source_shares"        # consumer
+# One sensor per consumer with the source shares as attributes, instead of one
+# entity per source (consumer; only with CONF_ENABLE_POWER_SOURCE_SHARES).
+CONF_GROUP_POWER_SOURCE_SHARES = "group_power_source_shares"
 
 # Export compensation (split out of the cost-rate / accumulate-cost keys)
 CONF_ENABLE_EXPORT_COMPENSATION_RATE = "enable_export_compensation_rate"
@@ -202,6 +229,7 @@ SCOPE_SUPPORTED_OPTIONS: dict[str, set[str]] = {
         CONF_CALCULATE_LEVELIZED_COST_RATES,
         CONF_ENABLE_DISTRIBUTION_SHARES,
         CONF_ENABLE_POWER_SOURCE_SHARES,
+        CONF_GROUP_POWER_SOURCE_SHARES,
     },
 }
 
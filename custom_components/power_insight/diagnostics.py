@@ -2,13 +2,22 @@
 
 from __future__ import annotations
 
+from asyncio import AbstractEventLoop
+from functools import partial
+from logging import Logger
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.device_registry import DeviceEntry
+from homeassistant.helpers.entity import Entity, EntityDescription
+from homeassistant.helpers.entity_platform import EntityPlatform, async_get_platforms
+from homeassistant.helpers.entity_registry import RegistryEntry
 
 from .const import CONF_RETIRED_ADAPTERS, DOMAIN
+from .entity import BaseEventIntegrationSensorEntity
+from .event import power_insight_tracker_data
+from .memory import SizeEstimator
 from .power_insight import (
     BaseConsumerAdapter,
     BatteryAdapter,
@@ -34,6 +43,9 @@ async def async_get_config_entry_diagnostics(
         },
         "adapters": _dump_all_adapters(power_insight),
         "hub_calculations": _dump_hub_calculations(power_insight),
+        "integration_timers": _dump_integration_timers(hass, entry),
+        "performance": _dump_performance(power_insight),
+        "memory": _dump_memory(hass, entry),
     }
 
 
@@ -160,6 +172,89 @@ def _dump_adapter(adapter, power_insight: PowerInsight) -> dict[str, Any]:
     return data
 
 
+def _dump_integration_timers(
+    hass: HomeAssistant, entry: ConfigEntry[MyData]
+) -> dict[str, Any]:
+    """Return the effective max_sub_interval of every accumulator, in seconds."""
+    result: dict[str, Any] = {}
+    for platform in async_get_platforms(hass, DOMAIN):
+        if platform.config_entry is None or platform.config_entry.entry_id != entry.entry_id:
+            continue
+        for entity_id, entity in platform.entities.items():
+            if not isinstance(entity, BaseEventIntegrationSensorEntity):
+                continue
+            interval = entity.effective_max_sub_interval
+            result[entity_id] = {
+                "adaptive": entity.adaptive_sub_interval,
+                "effective_max_sub_interval_s": (
+                    interval.total_seconds() if interval is not None else None
+                ),
+            }
+    return result
+
+
+def _dump_performance(power_insight: PowerInsight) -> dict[str, Any]:
+    """Return the hot-path counters and sampled timings of the entry."""
+    if power_insight.instrumentation is None:
+        return {}
+    return power_insight.instrumentation.as_dict()
+
+
+# Owned by the core, the registries or other entities; shared descriptions are
+# module constants. Partials are unsubscribe callbacks into shared tables.
+_MEMORY_BOUNDARY = (
+    HomeAssistant,
+    AbstractEventLoop,
+    ConfigEntry,
+    EntityPlatform,
+    RegistryEntry,
+    DeviceEntry,
+    State,
+    Entity,
+    EntityDescription,
+    Logger,
+    partial,
+)
+
+
+def _dump_memory(hass: HomeAssistant, entry: ConfigEntry[MyData]) -> dict[str, Any]:
+    """Return an estimate of the live memory held by the entry, in bytes.
+
+    Each part is counted without what an earlier part already holds: the
+    sensors' share excludes the engine they read from. The checkpoint store,
+    ledger and unit resolver are left out.
+    """
+    data = entry.runtime_data
+    sensors = _entry_entities(hass, entry)
+    estimator = SizeEstimator(
+        _MEMORY_BOUNDARY, exclude=(data.checkpoints, data.ledger, data.units)
+    )
+    power_insight_bytes = estimator.add(data.power_insight)
+    event_trackers_bytes = estimator.add(
+        data.event_handler, *power_insight_tracker_data(hass, entry.entry_id)
+    )
+    sensors_bytes = estimator.add(*sensors)
+    return {
+        "power_insight_bytes": power_insight_bytes,
+        "event_trackers_bytes": event_trackers_bytes,
+        "sensors_bytes": sensors_bytes,
+        "sensors": len(sensors),
+        "bytes_per_sensor": round(sensors_bytes / len(sensors)) if sensors else None,
+        "total_bytes": power_insight_bytes + event_trackers_bytes + sensors_bytes,
+    }
+
+
+def _entry_entities(hass: HomeAssistant, entry: ConfigEntry[MyData]) -> list[Entity]:
+    """Return the entry's entities across all platforms."""
+    return [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == entry.entry_id
+        for entity in platform.entities.values()
+    ]
+
+
 def _dump_hub_calculations(power_insight: PowerInsight) -> dict[str, Any]:
     """Return a snapshot of hub-level derived values."""
     if power_insight.grid_adapter is None:
@@ -16,10 +16,13 @@ Two base classes are provided:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
 from decimal import Decimal, InvalidOperation
 import logging
+from time import monotonic
 from typing import Any, Self
 
 from homeassistant.components.sensor import (
@@ -28,7 +31,7 @@ from homeassistant.components.sensor import (
     SensorExtraStoredData,
     SensorStateClass,
 )
-from homeassistant.const import UnitOfTime
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP, UnitOfTime
 from homeassistant.core import (
     CALLBACK_TYPE,
     Event,
@@ -37,8 +40,9 @@ from homeassistant.core import (
     State,
     callback,
 )
-from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.event import async_call_later, async_track_time_interval
 
+from .checkpoint import CheckpointStore
 from .event import (
     async_track_power_insight_state_change_event,
     async_track_power_insight_state_report_event,
@@ -57,6 +61,24 @@ UNIT_TIME = {
     UnitOfTime.DAYS: 24 * 60 * 60,
 }
 
+# Relative rate change between two integration steps above which the rate is
+# considered volatile and the adaptive sub-interval drops to its lower bound.
+VOLATILITY_THRESHOLD = 0.1
+
+# Longest an accumulator may hold back a write while its displayed (rounded)
+# value is unchanged, so last_updated and the recorder still see it advance.
+MAX_WRITE_STALENESS = timedelta(minutes=5)
+
+
+def _write_ha_state(
+    entity: BaseEventSensorEntity | BaseEventIntegrationSensorEntity,
+) -> None:
+    """Write *entity*'s state, recorded by the engine's instrumentation if any."""
+    if (stats := entity.power_insight.instrumentation) is not None:
+        stats.write(entity, entity.async_write_ha_state)
+    else:
+        entity.async_write_ha_state()
+
 
 # ---------------------------------------------------------------------------
 # BaseEventSensorEntity
@@ -90,9 +112,16 @@ class BaseEventSensorEntity(SensorEntity):
     flag and schedules a single ``_flush_write`` with ``call_soon``; subsequent
     events in the same tick see the flag is already set and do nothing.  The
     flush runs in the next iteration when ``PowerInsight`` holds all updates.
+
+    Lazy refresh
+    ------------
+    With ``lazy_refresh`` set the sensor ignores source events and re-reads its
+    value on that cadence instead, writing only when the value changed. The
+    ``homeassistant.update_entity`` action still writes it on demand.
     """
 
     _attr_should_poll = False
+    lazy_refresh: timedelta | None = None
 
     def __init__(
         self,
@@ -117,6 +146,16 @@ class BaseEventSensorEntity(SensorEntity):
         """Register event listeners once the entity is part of HA."""
         await super().async_added_to_hass()
 
+        if self.lazy_refresh is not None:
+            # HA writes the current value right after this returns.
+            self._lazy_value = (self.native_value, self.extra_state_attributes)
+            self.async_on_remove(
+                async_track_time_interval(
+                    self.hass, self._async_lazy_refresh, self.lazy_refresh
+                )
+            )
+            return
+
         # Track both event types for each source entity.
         # state_changed  — source value actually changed.
         # state_reported — source value was re-reported without changing (gives
@@ -144,14 +183,27 @@ class BaseEventSensorEntity(SensorEntity):
         Safe to call from any number of callbacks in the same tick — only the
         first call schedules the flush; the rest are no-ops.
         """
+        stats = self.power_insight.instrumentation
         if not self._pending_write:
             self._pending_write = True
             self.hass.loop.call_soon(self._flush_write)
+            if stats is not None:
+                stats.count("writes_scheduled")
+        elif stats is not None:
+            stats.count("writes_coalesced")
 
     def _flush_write(self) -> None:
         """Write state to HA once all same-tick events have been processed."""
         self._pending_write = False
-        self.async_write_ha_state()
+        _write_ha_state(self)
+
+    @callback
+    def _async_lazy_refresh(self, now: datetime) -> None:
+        """Write the state if the value changed since the last lazy refresh."""
+        value = (self.native_value, self.extra_state_attributes)
+        if value != self._lazy_value:
+            self._lazy_value = value
+            _write_ha_state(self)
 
     @callback
     def _update_on_state_change_callback(
@@ -175,12 +227,23 @@ class BaseEventSensorEntity(SensorEntity):
 METHOD_TRAPEZOIDAL = "trapezoidal"
 METHOD_LEFT = "left"
 METHOD_RIGHT = "right"
-INTEGRATION_METHODS = [METHOD_TRAPEZOIDAL, METHOD_LEFT, METHOD_RIGHT]
+METHOD_SIMPSON = "simpson"
+METHOD_SPLINE = "spline"
+INTEGRATION_METHODS = [
+    METHOD_TRAPEZOIDAL, METHOD_LEFT, METHOD_RIGHT, METHOD_SIMPSON, METHOD_SPLINE
+]
+
+# One history sample: (timestamp in seconds, value).
+type _Sample = tuple[Decimal, Decimal]
 
 
 class _IntegrationMethod(ABC):
     """Abstract base for numerical integration strategies."""
 
+    #: Number of past ``(t, value)`` samples the method needs, including the
+    #: left endpoint.  ``0`` for the two-point rules (no buffer is kept).
+    history_size: int = 0
+
     @staticmethod
     def from_name(method_name: str) -> _IntegrationMethod:
         """Return the integration method instance for the given name."""
@@ -202,6 +265,19 @@ class _IntegrationMethod(ABC):
     ) -> Decimal:
         """Return the area of one integration slice given two endpoint values."""
 
+    def calculate_area_with_history(
+        self,
+        history: Sequence[_Sample],
+        elapsed_time: Decimal,
+        left: Decimal,
+        right: Decimal,
+    ) -> Decimal:
+        """Return the slice area, using earlier samples where the method can.
+
+        ``history`` ends with the left endpoint.  The two-point rules ignore it.
+        """
+        return self.calculate_area_with_two_states(elapsed_time, left, right)
+
     def calculate_area_with_one_state(
         self, elapsed_time: Decimal, constant_state: Decimal
     ) -> Decimal:
@@ -259,6 +335,90 @@ class _Right(_IntegrationMethod):
         return (right_dec, right_dec)
 
 
+class _Simpson(_Trapezoidal):
+    """Simpson's rule, applied one slice at a time.
+
+    Integrates the parabola through the previous, left and right samples over
+    the newest slice only, which handles uneven event spacing:
+    ``trapezoid - h1³/6 · f[t0, t1, t2]`` with ``f[…]`` the second divided
+    difference.  Exact for quadratic rate curves (e.g. a PV production
+    shoulder).  Falls back to trapezoidal until a previous sample exists.
+    """
+
+    history_size = 2
+
+    def calculate_area_with_history(
+        self,
+        history: Sequence[_Sample],
+        elapsed_time: Decimal,
+        left: Decimal,
+        right: Decimal,
+    ) -> Decimal:
+        trapezoid = self.calculate_area_with_two_states(elapsed_time, left, right)
+        if len(history) < 2:
+            return trapezoid
+        (t0, y0), (t1, _) = history[-2], history[-1]
+        h0 = t1 - t0
+        if h0 <= 0:
+            return trapezoid
+        second_divided = ((right - left) / elapsed_time - (left - y0) / h0) / (
+            h0 + elapsed_time
+        )
+        return trapezoid - elapsed_time**3 / 6 * second_divided
+
+
+class _Spline(_Trapezoidal):
+    """Natural cubic spline through the last few samples, newest slice only.
+
+    Solves the (tiny, tridiagonal) spline system over the buffered samples plus
+    the right endpoint and integrates the final segment:
+    ``trapezoid - h³/24 · (M_left + M_right)`` with ``M`` the spline's second
+    derivatives.  Falls back to trapezoidal until enough samples exist.
+    """
+
+    history_size = 3
+
+    def calculate_area_with_history(
+        self,
+        history: Sequence[_Sample],
+        elapsed_time: Decimal,
+        left: Decimal,
+        right: Decimal,
+    ) -> Decimal:
+        trapezoid = self.calculate_area_with_two_states(elapsed_time, left, right)
+        if len(history) < 2:
+            return trapezoid
+        times = [t for t, _ in history]
+        values = [y for _, y in history]
+        times.append(times[-1] + elapsed_time)
+        values.append(right)
+        widths = [b - a for a, b in zip(times, times[1:])]
+        if any(h <= 0 for h in widths):
+            return trapezoid
+
+        # Thomas algorithm for the interior second derivatives (natural ends).
+        n = len(values) - 1
+        diag: list[Decimal] = []
+        rhs: list[Decimal] = []
+        for i in range(1, n):
+            d = 2 * (widths[i - 1] + widths[i])
+            r = 6 * (
+                (values[i + 1] - values[i]) / widths[i]
+                - (values[i] - values[i - 1]) / widths[i - 1]
+            )
+            if diag:
+                factor = widths[i - 1] / diag[-1]
+                d -= factor * widths[i - 1]
+                r -= factor * rhs[-1]
+            diag.append(d)
+            rhs.append(r)
+        second = [Decimal(0)] * (n + 1)
+        for i in range(n - 1, 0, -1):
+            second[i] = (rhs[i - 1] - widths[i] * second[i + 1]) / diag[i - 1]
+
+        return trapezoid - elapsed_time**3 / 24 * (second[n - 1] + second[n])
+
+
 def _decimal_state(state: float | str) -> Decimal | None:
     """Convert a numeric state value to ``Decimal``, returning ``None`` on failure."""
     try:
@@ -271,6 +431,8 @@ _NAME_TO_INTEGRATION_METHOD: dict[str, type[_IntegrationMethod]] = {
     METHOD_LEFT: _Left,
     METHOD_RIGHT: _Right,
     METHOD_TRAPEZOIDAL: _Trapezoidal,
+    METHOD_SIMPSON: _Simpson,
+    METHOD_SPLINE: _Spline,
 }
 
 
@@ -351,7 +513,9 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
     computed ``PowerInsight`` values (left = previous calculation result,
     right = current calculation result), trapezoidal averaging is appropriate
     and more accurate than left- or right-rectangle rules for smoothly varying
-    rate values.
+    rate values.  ``simpson`` and ``spline`` go one order further by fitting a
+    curve through a short per-sensor buffer of recent samples, which tracks
+    curved profiles (PV production) accurately at lower event rates.
 
     **max_sub_interval**
 
@@ -363,10 +527,34 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
     The timer is cancelled and rescheduled whenever a real event arrives, so
     there is no double-counting.  Defaults to 1 minute.
 
+    **Adaptive sub-interval**
+
+    A fixed interval wakes an idle accumulator 1440 times a day for nothing and
+    is no finer during fast-changing periods.  Passing ``min_sub_interval``
+    switches the timer to adaptive mode, bounded by ``[min_sub_interval,
+    max_sub_interval]``: each timer fire (no event arrived, so the rate held
+    steady) and each event whose rate moved by less than
+    ``VOLATILITY_THRESHOLD`` doubles the effective interval; a zero rate jumps
+    straight to the upper bound; a volatile step or an availability change
+    drops it back to the lower bound.  The current value is exposed as
+    ``effective_max_sub_interval`` for diagnostics.
+
+    **Write suppression**
+
+    Most integration slices move the total by far less than its display
+    precision (the user's override from the entity registry, else
+    ``suggested_display_precision``).  Such slices update ``_state`` but skip
+    the state write while the rounded value is unchanged, up to
+    ``MAX_WRITE_STALENESS``.  A held-back write is flushed when HA stops or
+    the entity is removed.
+
     **State restoration**
 
     The running total survives HA restarts via ``RestoreSensor`` /
-    ``IntegrationSensorExtraStoredData``.
+    ``IntegrationSensorExtraStoredData``.  When a ``CheckpointStore`` is
+    given, every change to the total is also recorded there (batched per
+    config entry, so a crash loses seconds rather than a dump interval) and
+    the entry's newest checkpoint takes precedence on restore.
     """
 
     _attr_state_class = SensorStateClass.TOTAL
@@ -377,6 +565,9 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
         source_entities: list[str],
         power_insight: PowerInsight,
         max_sub_interval: timedelta | None = timedelta(minutes=1),
+        min_sub_interval: timedelta | None = None,
+        checkpoints: CheckpointStore | None = None,
+        integration_method: str = METHOD_TRAPEZOIDAL,
     ) -> None:
         """Initialise the integration sensor.
 
@@ -387,11 +578,19 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
             max_sub_interval: How often to force an integration step when no
                 source event arrives.  Set to ``None`` to disable.  Defaults
                 to 1 minute, which keeps accumulation error under ~1/60th of
-                the hourly rate for any steady-state period.
+                the hourly rate for any steady-state period.  In adaptive mode
+                this is the upper bound.
+            min_sub_interval: Lower bound of the adaptive timer.  ``None``
+                (the default) keeps the fixed ``max_sub_interval``.
+            checkpoints: The config entry's checkpoint store, or ``None`` to
+                rely on ``RestoreSensor`` alone.
+            integration_method: One of ``INTEGRATION_METHODS``.  Simpson and
+                spline keep a few past samples to fit a curve through them.
 
         """
         self._source_entities = source_entities
         self.power_insight = power_insight
+        self._checkpoints = checkpoints
 
         # Running total; None until the first integration step completes.
         self._state: Decimal | None = None
@@ -406,7 +605,10 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
         # None until the first event is received.
         self._last_integration_time: datetime | None = None
 
-        self._method = _IntegrationMethod.from_name(METHOD_TRAPEZOIDAL)
+        self._method = _IntegrationMethod.from_name(integration_method)
+        # Recent (t, value) samples for the higher-order methods; the newest
+        # is the left endpoint.  maxlen 0 for the two-point rules.
+        self._history = self.new_sample_history()
 
         # Unit scaling: dividing the raw area (value × seconds) by
         # (prefix × time_unit_in_seconds) converts to the target unit.
@@ -415,9 +617,27 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
         self._unit_time = UNIT_TIME[UnitOfTime.HOURS]
 
         self._max_sub_interval = max_sub_interval
+        # Adaptive mode only when both bounds are set; start at the lower bound
+        # until the rate has shown itself to be stable.
+        self._min_sub_interval = (
+            min(min_sub_interval, max_sub_interval)
+            if min_sub_interval is not None and max_sub_interval is not None
+            else None
+        )
+        self._effective_max_sub_interval = (
+            self._min_sub_interval
+            if self._min_sub_interval is not None
+            else max_sub_interval
+        )
         # Cancellation handle for the pending max_sub_interval timer.
         self._cancel_max_sub_interval: CALLBACK_TYPE | None = None
 
+        # Rounded value and monotonic time of the last state write, and
+        # whether a write has been held back since.
+        self._last_written_display: Decimal | None = None
+        self._last_write_time: float = 0.0
+        self._write_suppressed = False
+
     # ------------------------------------------------------------------
     # Abstract interface
     # ------------------------------------------------------------------
@@ -448,23 +668,122 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
             self._state += area_scaled
         else:
             self._state = area_scaled
+        if (stats := self.power_insight.instrumentation) is not None:
+            stats.count("integration_steps")
         self._last_valid_state = self._state
+        self._total_changed()
         _LOGGER.debug(
             "Integrated area=%s scaled=%s running_total=%s",
             area, area_scaled, self._state,
         )
 
+    def slice_area(
+        self,
+        elapsed_seconds: Decimal,
+        left: float | None,
+        right: float | None,
+        history: Sequence[_Sample] = (),
+    ) -> Decimal | None:
+        """Return one slice's area in the native unit, without accumulating it.
+
+        Lets the history backfill reuse this sensor's integration method and
+        unit scaling; ``history`` is its own sample buffer (see
+        ``new_sample_history``).  ``None`` when either endpoint is unusable.
+        """
+        if elapsed_seconds <= 0 or left is None or right is None:
+            return None
+        if (states := self._method.validate_states(left, right)) is None:
+            return None
+        area = self._method.calculate_area_with_history(
+            history, elapsed_seconds, *states
+        )
+        return area / (self._unit_prefix * self._unit_time)
+
+    def new_sample_history(self) -> deque[_Sample]:
+        """Return an empty sample buffer sized for this sensor's method."""
+        return deque(maxlen=self._method.history_size)
+
+    def remember_sample(
+        self, history: deque[_Sample], timestamp: datetime, value: float | None
+    ) -> None:
+        """Push the new left endpoint into *history*.
+
+        An unusable value breaks the curve, so the buffer restarts.  A sample
+        at the same instant as the newest one replaces it.
+        """
+        if not self._method.history_size:
+            return
+        if (value_dec := _decimal_state(value)) is None:
+            history.clear()
+            return
+        t = Decimal(str(timestamp.timestamp()))
+        if history and history[-1][0] == t:
+            history.pop()
+        history.append((t, value_dec))
+
+    def _remember_sample(self, timestamp: datetime, value: float | None) -> None:
+        """Push the new left endpoint into the sensor's own history buffer."""
+        self.remember_sample(self._history, timestamp, value)
+
+    def _record_checkpoint(self) -> None:
+        """Hand the current totals to the entry's checkpoint store, if any."""
+        if self._checkpoints is not None and self.unique_id is not None:
+            self._checkpoints.record(
+                self.unique_id, self._state, self._last_valid_state
+            )
+
+    def _total_changed(self) -> None:
+        """Propagate a new running total; subclasses may publish it further."""
+        self._record_checkpoint()
+
     # ------------------------------------------------------------------
     # max_sub_interval timer
     # ------------------------------------------------------------------
 
+    @property
+    def adaptive_sub_interval(self) -> bool:
+        """Return True if the timer interval adapts to rate volatility."""
+        return self._min_sub_interval is not None
+
+    @property
+    def effective_max_sub_interval(self) -> timedelta | None:
+        """Return the interval the next timer will be scheduled with."""
+        return self._effective_max_sub_interval
+
+    def _adapt_sub_interval(
+        self, left: float | None, right: float | None
+    ) -> None:
+        """Lengthen or shorten the effective interval after an integration step.
+
+        No-op in fixed mode.  ``left``/``right`` are the rate before and after
+        the step; equal values model a timer fire (rate held steady).
+        """
+        if self._min_sub_interval is None or self._max_sub_interval is None:
+            return
+        if left is None or right is None:
+            # Availability change — treat as volatile.
+            self._effective_max_sub_interval = self._min_sub_interval
+            return
+        scale = max(abs(left), abs(right))
+        if scale == 0:
+            self._effective_max_sub_interval = self._max_sub_interval
+        elif abs(right - left) / scale > VOLATILITY_THRESHOLD:
+            self._effective_max_sub_interval = self._min_sub_interval
+        else:
+            self._effective_max_sub_interval = min(
+                self._effective_max_sub_interval * 2, self._max_sub_interval
+            )
+
     def _schedule_max_sub_interval(self) -> None:
         """Schedule a one-shot timer to integrate if no event arrives in time.
 
         Does nothing if max_sub_interval is disabled or if no first event has
         arrived yet (nothing to integrate from).
         """
-        if self._max_sub_interval is None or self._last_integration_value is None:
+        if (
+            self._effective_max_sub_interval is None
+            or self._last_integration_value is None
+        ):
             return
 
         @callback
@@ -472,6 +791,8 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
             """Integrate the last known rate as a constant, then reschedule."""
             if self._last_integration_time is None or self._last_integration_value is None:
                 return
+            if (stats := self.power_insight.instrumentation) is not None:
+                stats.count("timer_fires")
 
             elapsed = Decimal((now - self._last_integration_time).total_seconds())
             if (value_dec := _decimal_state(self._last_integration_value)) is not None:
@@ -479,15 +800,23 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
                 self._update_integral(area)
 
             self._last_integration_time = now
-            self.async_write_ha_state()
+            self._remember_sample(now, self._last_integration_value)
+            self._write_if_display_changed()
+
+            # No event since the last step, so the rate held steady.
+            self._adapt_sub_interval(
+                self._last_integration_value, self._last_integration_value
+            )
 
             # Reschedule for the next sub-interval.
             self._cancel_max_sub_interval = async_call_later(
-                self.hass, self._max_sub_interval, _on_max_sub_interval_exceeded
+                self.hass,
+                self._effective_max_sub_interval,
+                _on_max_sub_interval_exceeded,
             )
 
         self._cancel_max_sub_interval = async_call_later(
-            self.hass, self._max_sub_interval, _on_max_sub_interval_exceeded
+            self.hass, self._effective_max_sub_interval, _on_max_sub_interval_exceeded
         )
 
     def _cancel_and_reschedule_max_sub_interval(self) -> None:
@@ -516,8 +845,21 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
         await super().async_added_to_hass()
 
         # --- State restoration ---
-        # Attempt to recover the running total from the last HA session.
-        if (last_sensor_data := await self.async_get_last_sensor_data()) is not None:
+        # Attempt to recover the running total from the last HA session. The
+        # entry-wide checkpoint is newer than the RestoreEntity dump, so it wins.
+        checkpoint = (
+            self._checkpoints.get(self.unique_id)
+            if self._checkpoints is not None and self.unique_id is not None
+            else None
+        )
+        if checkpoint is not None:
+            self._state, self._last_valid_state = checkpoint
+            self._attr_native_value = self._state
+            _LOGGER.debug(
+                "Restored from checkpoint state=%s last_valid_state=%s",
+                self._state, self._last_valid_state,
+            )
+        elif (last_sensor_data := await self.async_get_last_sensor_data()) is not None:
             # Prefer native_value; fall back to last_valid_state if native_value
             # was None at shutdown (e.g. sensor had never integrated anything).
             self._state = (
@@ -534,6 +876,13 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
 
         # Ensure the timer is cancelled cleanly when the entity is removed.
         self.async_on_remove(self._cancel_pending_max_sub_interval)
+        # Plain listen (not listen_once): its remover stays valid after the
+        # stop event fired, when entities may still be torn down.
+        self.async_on_remove(
+            self.hass.bus.async_listen(
+                EVENT_HOMEASSISTANT_STOP, self._flush_suppressed_write
+            )
+        )
 
         # --- Event listeners ---
         self.async_on_remove(
@@ -602,7 +951,8 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
         1. Compute elapsed time from the previous event's timestamp.
         2. Integrate using (left=previous rate, right=current rate).
         3. Advance the left-endpoint anchor to the current values.
-        4. Reset the max_sub_interval timer.
+        4. Adapt the sub-interval to the step's volatility (adaptive mode).
+        5. Reset the max_sub_interval timer.
         """
         right_value = self.integration_value
 
@@ -610,7 +960,8 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
             # First event: record the initial anchor; nothing to integrate yet.
             self._last_integration_value = right_value
             self._last_integration_time = timestamp
-            self.async_write_ha_state()
+            self._remember_sample(timestamp, right_value)
+            self._write_state()
             self._schedule_max_sub_interval()
             return
 
@@ -626,17 +977,86 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
 
         if elapsed_seconds > 0 and left_value is not None and right_value is not None:
             if states := self._method.validate_states(left_value, right_value):
-                area = self._method.calculate_area_with_two_states(elapsed_seconds, *states)
+                area = self._method.calculate_area_with_history(
+                    self._history, elapsed_seconds, *states
+                )
                 self._update_integral(area)
 
         # Advance the left-endpoint anchor.
         self._last_integration_time = timestamp
         self._last_integration_value = right_value
+        self._remember_sample(timestamp, right_value)
+
+        self._adapt_sub_interval(left_value, right_value)
 
         # Cancel old timer and start a fresh one from this event's timestamp.
         self._cancel_and_reschedule_max_sub_interval()
 
-        self.async_write_ha_state()
+        self._write_if_display_changed()
+
+    @callback
+    def async_reanchor(self, timestamp: datetime) -> None:
+        """Integrate up to *timestamp* and restart the slice from the current rate.
+
+        Called around a live reconfiguration of the engine: once before it, to
+        close the running slice at the old rate, and once after it, to anchor
+        the next slice at the new rate (a zero-length step adds no area).
+        Before the first event has anchored the integral there is nothing to
+        integrate, but a rescaled display (correction factor) is still written.
+        """
+        if self._last_integration_time is None:
+            if self._state is not None:
+                self._write_if_display_changed()
+            return
+        self._handle_integration_event(timestamp)
+
+    # ------------------------------------------------------------------
+    # Write suppression
+    # ------------------------------------------------------------------
+
+    def _display_precision(self) -> int | None:
+        """Return the precision the total is displayed with, if known."""
+        if self.registry_entry is not None and (
+            sensor_options := self.registry_entry.options.get("sensor")
+        ):
+            if (precision := sensor_options.get("display_precision")) is not None:
+                return precision
+        return self.suggested_display_precision
+
+    def _displayed(self, value: Decimal | None) -> Decimal | None:
+        """Return *value* rounded as displayed (unrounded without a precision)."""
+        if value is None or (precision := self._display_precision()) is None:
+            return value
+        return round(value, precision)
+
+    def _write_state(self) -> None:
+        """Write state now and remember what was displayed."""
+        self._last_written_display = self._displayed(self.native_value)
+        self._last_write_time = monotonic()
+        self._write_suppressed = False
+        _write_ha_state(self)
+
+    def _write_if_display_changed(self) -> None:
+        """Write state unless the displayed value is unchanged and still fresh."""
+        if (
+            self._displayed(self.native_value) == self._last_written_display
+            and monotonic() - self._last_write_time
+            < MAX_WRITE_STALENESS.total_seconds()
+        ):
+            self._write_suppressed = True
+            return
+        self._write_state()
+
+    @callback
+    def _flush_suppressed_write(self, *_: Any) -> None:
+        """Write a held-back state (HA stop / entity removal)."""
+        if self._write_suppressed and self.hass is not None:
+            self._write_state()
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Flush a held-back state before the entity goes away."""
+        self._flush_suppressed_write()
+        await super().async_will_remove_from_hass()
 
     # ------------------------------------------------------------------
     # HA state properties
@@ -656,7 +1076,22 @@ class BaseEventIntegrationSensorEntity(RestoreSensor, ABC):
         """
         self._state = Decimal(str(value))
         self._last_valid_state = self._state
-        self.async_write_ha_state()
+        self._total_changed()
+        self._write_state()
+
+    def add_to_total(self, amount: Decimal) -> None:
+        """Add *amount* (native unit) to the running total and write it.
+
+        Used by the history backfill: whatever the sensor integrated live while
+        the history was replayed is kept.
+        """
+        if isinstance(self._state, Decimal):
+            self._state += amount
+        else:
+            self._state = amount
+        self._last_valid_state = self._state
+        self._total_changed()
+        self._write_state()
 
     @property
     def extra_restore_state_data(self) -> IntegrationSensorExtraStoredData:
@@ -211,6 +211,21 @@ def async_track_power_insight_state_report_event(
     )
 
 
+def power_insight_tracker_data(
+    hass: HomeAssistant, entry_id: str
+) -> list[_KeyedEventData[Any]]:
+    """Return the live scoped trackers of the config entry.
+
+    Added for diagnostics; not part of the upstream helper.
+    """
+    prefix = f"{DOMAIN}_{entry_id}_"
+    return [
+        data
+        for tracker in (_KEYED_TRACK_STATE_CHANGE, _KEYED_TRACK_STATE_REPORT)
+        if (data := hass.data.get(f"{prefix}{tracker.key}")) is not None
+    ]
+
+
 @callback
 def _remove_empty_listener() -> None:
     """Remove a listener that does nothing."""
@@ -186,5 +186,15 @@ class EventHandler:
         # state_changed: only fire when the stored numeric value actually
         # changed; if the HA state string changed but the float is identical
         # there is nothing for sensors to recalculate.
+        if (stats := self.power_insight.instrumentation) is not None:
+            stats.count(
+                "source_state_reported"
+                if is_report
+                else "source_state_changed"
+                if value_changed
+                else "source_state_unchanged"
+            )
+            if is_report or value_changed:
+                stats.begin_tick(entity_id)
         if is_report or value_changed:
             self.hass.bus.async_fire(event_type, event_data)
@@ -0,0 +1,229 @@
+"""Always-on counters and sampled timings for the event-to-state hot path.
+
+One ``Instrumentation`` per config entry hangs off the engine
+(``PowerInsight.instrumentation``), where ``EventHandler``, the result table and
+both sensor base classes record into it:
+
+* plain counters — source events, coalesced writes, integration steps and
+  timer fires — cost one dict increment each;
+* engine property evaluations and sensor writes are always counted, but only
+  timed during every ``sample_every``-th *tick* (one source update that reached
+  the sensors). Sampled durations go into fixed log2 histograms, and totals are
+  extrapolated from the samples;
+* the sampled ticks of the recent past are kept in a ring buffer to report the
+  slowest ones;
+* ``latency(now)`` polls the counters into a fixed-size rolling window and
+  returns the tick rate, the engine evaluation time per tick and the write
+  rate over it, for the optional latency sensors.
+
+Nothing here imports Home Assistant, so the engine tier can use it too.
+"""
+
+from __future__ import annotations
+
+from collections import Counter, deque
+from collections.abc import Callable
+from dataclasses import dataclass
+from itertools import islice
+from math import ceil
+from time import perf_counter_ns
+from typing import Any
+
+SAMPLE_EVERY = 16
+RECENT_TICKS = 128
+SLOWEST_TICKS = 5
+# Counter polls kept for the latency window (one per latency sensor refresh).
+LATENCY_POLLS = 16
+# Bucket i holds durations below 2**i ns; the last one takes everything above.
+_BUCKETS = 32
+
+
+class _Timing:
+    """Call count and sampled durations of one property or sensor class."""
+
+    __slots__ = ("count", "histogram", "sampled", "total_ns")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.sampled = 0
+        self.total_ns = 0
+        self.histogram = [0] * _BUCKETS
+
+    def add(self, elapsed_ns: int) -> None:
+        self.sampled += 1
+        self.total_ns += elapsed_ns
+        self.histogram[min(elapsed_ns.bit_length(), _BUCKETS - 1)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        mean_ns = self.total_ns / self.sampled if self.sampled else None
+        return {
+            "count": self.count,
+            "sampled": self.sampled,
+            "mean_us": round(mean_ns / 1e3, 3) if mean_ns is not None else None,
+            "estimated_total_ms": (
+                round(mean_ns * self.count / 1e6, 3) if mean_ns is not None else None
+            ),
+            # Upper bound of the bucket (µs) -> samples.
+            "histogram_us": {
+                f"<{2**i / 1e3:g}": n for i, n in enumerate(self.histogram) if n
+            },
+        }
+
+
+@dataclass(slots=True)
+class _Tick:
+    """Work attributed to one sampled source update."""
+
+    source: str
+    duration_ns: int = 0
+    # Outermost engine property evaluations only, inside writes or not.
+    evaluation_ns: int = 0
+    evaluations: int = 0
+    writes: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class Latency:
+    """Hot-path rates and evaluation times over the latency window.
+
+    ``None`` where the window holds no data yet: the rates need two polls, the
+    evaluation times a sampled tick finished since the oldest poll.
+    """
+
+    ticks_per_minute: float | None = None
+    evaluation_mean_ms: float | None = None
+    evaluation_p95_ms: float | None = None
+    writes_per_minute: float | None = None
+
+
+class Instrumentation:
+    """Hot-path statistics of one config entry."""
+
+    def __init__(self, sample_every: int = SAMPLE_EVERY) -> None:
+        """Initialise empty statistics."""
+        self.sample_every = sample_every
+        self.counters: Counter[str] = Counter()
+        self.properties: dict[str, _Timing] = {}
+        self.writes: dict[str, _Timing] = {}
+        self.ticks = 0
+        self._tick: _Tick | None = None
+        self._recent: deque[_Tick] = deque(maxlen=RECENT_TICKS)
+        # Sampled ticks closed into ``_recent`` so far.
+        self._closed = 0
+        # (seconds, ticks, writes, closed sampled ticks) per poll.
+        self._polls: deque[tuple[float, int, int, int]] = deque(maxlen=LATENCY_POLLS)
+        # Nesting depth of timed calls; only the outermost adds to the tick.
+        self._depth = 0
+        # Nesting depth of timed property evaluations alone.
+        self._evaluating = 0
+
+    def count(self, name: str) -> None:
+        """Increment the counter *name*."""
+        self.counters[name] += 1
+
+    def begin_tick(self, source: str) -> None:
+        """Start attributing work to a source update of *source*."""
+        if self._tick is not None:
+            self._recent.append(self._tick)
+            self._closed += 1
+        self._tick = _Tick(source) if self.ticks % self.sample_every == 0 else None
+        self.ticks += 1
+
+    def evaluate(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """Return ``fn(*args)``, recorded as an evaluation of property *name*."""
+        if (timing := self.properties.get(name)) is None:
+            timing = self.properties[name] = _Timing()
+        timing.count += 1
+        if self._tick is None:
+            return fn(*args)
+        self._tick.evaluations += 1
+        self._evaluating += 1
+        try:
+            return self._timed(timing, fn, args)
+        finally:
+            self._evaluating -= 1
+
+    def write(self, entity: object, write: Callable[[], None]) -> None:
+        """Call *write*, recorded as a state write of *entity*'s class."""
+        name = type(entity).__name__
+        if (timing := self.writes.get(name)) is None:
+            timing = self.writes[name] = _Timing()
+        timing.count += 1
+        if self._tick is None:
+            write()
+            return
+        self._tick.writes += 1
+        self._timed(timing, write, ())
+
+    def _timed(self, timing: _Timing, fn: Callable[..., Any], args: tuple) -> Any:
+        tick = self._tick
+        self._depth += 1
+        start = perf_counter_ns()
+        try:
+            return fn(*args)
+        finally:
+            elapsed = perf_counter_ns() - start
+            self._depth -= 1
+            timing.add(elapsed)
+            if self._depth == 0:
+                tick.duration_ns += elapsed
+            if self._evaluating == 1:
+                tick.evaluation_ns += elapsed
+
+    def latency(self, now: float) -> Latency:
+        """Poll the counters at time *now* (s); return the window's latency.
+
+        The window spans the last ``LATENCY_POLLS`` polls. Evaluation times are
+        those of the sampled ticks closed within it, at most ``RECENT_TICKS``.
+        """
+        writes = sum(timing.count for timing in self.writes.values())
+        self._polls.append((now, self.ticks, writes, self._closed))
+        since, ticks, old_writes, closed = self._polls[0]
+        minutes = (now - since) / 60
+        fresh = min(self._closed - closed, len(self._recent))
+        durations = sorted(
+            tick.evaluation_ns / 1e6 for tick in islice(reversed(self._recent), fresh)
+        )
+        return Latency(
+            ticks_per_minute=(self.ticks - ticks) / minutes if minutes > 0 else None,
+            evaluation_mean_ms=(
+                sum(durations) / len(durations) if durations else None
+            ),
+            # Nearest rank.
+            evaluation_p95_ms=(
+                durations[ceil(0.95 * len(durations)) - 1] if durations else None
+            ),
+            writes_per_minute=(writes - old_writes) / minutes if minutes > 0 else None,
+        )
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the statistics, costliest first, for diagnostics."""
+
+        def by_cost(timings: dict[str, _Timing]) -> dict[str, Any]:
+            dumped = {name: timing.as_dict() for name, timing in timings.items()}
+            return dict(
+                sorted(
+                    dumped.items(),
+                    key=lambda item: item[1]["estimated_total_ms"] or 0,
+                    reverse=True,
+                )
+            )
+
+        slowest = sorted(self._recent, key=lambda tick: tick.duration_ns, reverse=True)
+        return {
+            "sample_every": self.sample_every,
+            "ticks": self.ticks,
+            "counters": dict(sorted(self.counters.items())),
+            "properties": by_cost(self.properties),
+            "writes_by_class": by_cost(self.writes),
+            "slowest_recent_ticks": [
+                {
+                    "source": tick.source,
+                    "duration_ms": round(tick.duration_ns / 1e6, 3),
+                    "evaluation_ms": round(tick.evaluation_ns / 1e6, 3),
+                    "evaluations": tick.evaluations,
+                    "writes": tick.writes,
+                }
+                for tick in slowest[:SLOWEST_TICKS]
+            ],
+        }
@@ -0,0 +1,93 @@
+"""In-memory ledger of the levelized accumulated totals of a config entry.
+
+The combined levelized totals (``combined_total_levelized_*``) are the sum of
+the matching per-adapter accumulators plus the frozen contributions of retired
+adapters. Rather than have the combined sensor look up every per-adapter entity
+and parse its state on each event, each per-adapter accumulator pushes its
+corrected total into the entry's ``LevelizedLedger`` whenever it changes. The
+ledger keeps a running sum per key and notifies the combined sensors.
+
+The retired-adapter sum is read from ``entry.data[CONF_RETIRED_ADAPTERS]`` once
+and cached until that list is replaced (every update goes through
+``async_update_entry`` with a new list).
+"""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable
+from decimal import Decimal
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE
+
+from .const import CONF_RETIRED_ADAPTERS
+
+
+class LevelizedLedger:
+    """Running sums of the per-adapter levelized totals, keyed by sensor key."""
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialise an empty ledger for *entry*."""
+        self._entry = entry
+        # per-adapter key -> adapter uid -> corrected total
+        self._totals: dict[str, dict[str, Decimal]] = defaultdict(dict)
+        self._sums: dict[str, Decimal] = defaultdict(Decimal)
+        self._listeners: dict[str, list[Callable[[], None]]] = defaultdict(list)
+        self._retired_source: list[dict[str, Any]] | None = None
+        self._retired_sums: dict[str, float] = {}
+
+    def update(self, key: str, uid: str, total: Decimal | None) -> None:
+        """Set (or with ``None`` drop) the corrected total of one adapter."""
+        totals = self._totals[key]
+        previous = totals.get(uid)
+        if total == previous:
+            return
+        if previous is not None:
+            self._sums[key] -= previous
+        if total is None:
+            del totals[uid]
+        else:
+            totals[uid] = total
+            self._sums[key] += total
+        for listener in self._listeners[key]:
+            listener()
+
+    def remove(self, key: str, uid: str) -> None:
+        """Drop one adapter's contribution (its accumulator went away)."""
+        self.update(key, uid, None)
+
+    def active_total(self, key: str) -> float:
+        """Return the sum of the active adapters' corrected totals."""
+        return float(self._sums[key])
+
+    def retired_total(self, key: str) -> float:
+        """Return the frozen contributions of retired adapters for *key*."""
+        retired = self._entry.data.get(CONF_RETIRED_ADAPTERS)
+        if retired is not self._retired_source:
+            self._retired_source = retired
+            self._retired_sums = {}
+        if (total := self._retired_sums.get(key)) is None:
+            total = 0.0
+            for retired_adapter in retired or ():
+                value = retired_adapter.get("totals", {}).get(key)
+                if value is not None:
+                    total += value
+            self._retired_sums[key] = total
+        return total
+
+    def total(self, key: str) -> float:
+        """Return the combined total: active adapters plus retired ledger."""
+        return self.active_total(key) + self.retired_total(key)
+
+    def async_add_listener(
+        self, key: str, listener: Callable[[], None]
+    ) -> CALLBACK_TYPE:
+        """Call *listener* whenever an active total of *key* changes."""
+        self._listeners[key].append(listener)
+
+        def _remove() -> None:
+            self._listeners[key].remove(listener)
+
+        return _remove
@@ -0,0 +1,339 @@
+"""Options flow for Power Insight."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+from homeassistant.config_entries import OptionsFlow
+from homeassistant.data_entry_flow import FlowResult, section
+
+from .const import (
+    CONF_ENABLE_DEBUG_ENTITIES,
+    CONF_LAZY_DISTRIBUTION_SENSORS,
+    CONF_ENABLE_SNAPSHOT_ENTITY,
+    CONF_ENABLE_LATENCY_ENTITIES,
+    CONF_ADAPTIVE_SUB_INTERVAL,
+    CONF_MIN_SUB_INTERVAL,
+    CONF_MAX_SUB_INTERVAL,
+    DEFAULT_MIN_SUB_INTERVAL,
+    DEFAULT_MAX_SUB_INTERVAL,
+    CONF_INTEGRATION_METHOD,
+    DEFAULT_INTEGRATION_METHOD,
+    SCOPES,
+    SCOPE_COMBINED,
+    SCOPE_SUPPORTED_OPTIONS,
+    CONF_PRESET,
+    PRESET_CUSTOM,
+)
+from .flow_helpers import (
+    BOOLEAN_SELECTOR,
+    SECONDS_SELECTOR,
+    PRESET_SELECTIONS,
+    integration_method_selector,
+    preset_selector,
+    build_scope_form,
+    scope_ui_to_leaves,
+    scope_leaves_to_ui_defaults,
+    flatten_scope_sections,
+    check_options_feasibility,
+)
+
+
+# ============================================================================
+# OPTIONS FLOW
+# ============================================================================
+
+class PowerInsightOptionsFlow(OptionsFlow):
+    """Multi-step options flow with preset selection and per-scope pages.
+
+    Step init:   Pick a preset (applies immediately) or choose Custom.
+    Custom path: One page per device class present in the installation
+                 (combined → grid → pv_system → battery → consumer).
+    """
+
+    def __init__(self) -> None:
+        self._scopes: dict[str, list[str]] = {}
+        # Global (non-scope) options collected on the init step; written by
+        # both the preset and the custom save paths.
+        self._globals: dict[str, Any] = {}
+        self._device_types: set[str] = set()
+
+    def _init_device_types(self) -> None:
+        """Populate _device_types from the current subentries."""
+        self._device_types = {
+            sub.data.get("adapter", {}).get("adapter_type")
+            for sub in self.config_entry.subentries.values()
+        } - {None}
+
+    def _next_scope_step(self, after: str) -> str | None:
+        """Return the next step id in the chain after *after*, or None if done."""
+        order = list(SCOPES)
+        for scope in order[order.index(after) + 1:]:
+            if scope in self._device_types:
+                return scope
+        return None
+
+    def _last_scope(self) -> str:
+        """Return the final scope step in the navigation chain."""
+        for scope in reversed(SCOPES):
+            if scope == SCOPE_COMBINED or scope in self._device_types:
+                return scope
+        return SCOPE_COMBINED
+
+    async def _finish(self) -> FlowResult:
+        """Run feasibility check and save, or re-show the last scope form."""
+        stored = self.config_entry.options.get("scopes", {})
+        new_scopes = {
+            scope: self._scopes.get(scope, sorted(stored.get(scope, [])))
+            for scope in SCOPES
+        }
+        new_options = {
+            "schema": 2,
+            "scopes": new_scopes,
+            **self._globals,
+            CONF_PRESET: PRESET_CUSTOM,
+        }
+        problems = check_options_feasibility(self.config_entry, new_options)
+        if not problems:
+            return self.async_create_entry(title="", data=new_options)
+
+        last = self._last_scope()
+        defaults = scope_leaves_to_ui_defaults(last, set(self._scopes.get(last, [])))
+        return self.async_show_form(
+            step_id=last,
+            data_schema=build_scope_form(last, defaults),
+            errors={"base": "reconfigure_adapters_first"},
+            description_placeholders={
+                "adapters_needing_reconfigure": ", ".join(problems),
+            },
+            last_step=True,
+        )
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Show preset selector; non-custom presets save immediately."""
+        self._init_device_types()
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            preset = user_input.get(CONF_PRESET, PRESET_CUSTOM)
+            accumulation = user_input.get("accumulation", {})
+            self._globals = {
+                CONF_ENABLE_DEBUG_ENTITIES: bool(
+                    user_input.get(CONF_ENABLE_DEBUG_ENTITIES, False)
+                ),
+                CONF_LAZY_DISTRIBUTION_SENSORS: bool(
+                    user_input.get(CONF_LAZY_DISTRIBUTION_SENSORS, False)
+                ),
+                CONF_ENABLE_SNAPSHOT_ENTITY: bool(
+                    user_input.get(CONF_ENABLE_SNAPSHOT_ENTITY, False)
+                ),
+                CONF_ENABLE_LATENCY_ENTITIES: bool(
+                    user_input.get(CONF_ENABLE_LATENCY_ENTITIES, False)
+                ),
+                CONF_ADAPTIVE_SUB_INTERVAL: bool(
+                    accumulation.get(CONF_ADAPTIVE_SUB_INTERVAL, False)
+                ),
+                CONF_MIN_SUB_INTERVAL: int(
+                    accumulation.get(CONF_MIN_SUB_INTERVAL, DEFAULT_MIN_SUB_INTERVAL)
+                ),
+                CONF_MAX_SUB_INTERVAL: int(
+                    accumulation.get(CONF_MAX_SUB_INTERVAL, DEFAULT_MAX_SUB_INTERVAL)
+                ),
+                CONF_INTEGRATION_METHOD: accumulation.get(
+                    CONF_INTEGRATION_METHOD, DEFAULT_INTEGRATION_METHOD
+                ),
+            }
+
+            # The bounds only apply in adaptive mode; stale ones in the
+            # collapsed section must not block an unrelated save.
+            if (
+                self._globals[CONF_ADAPTIVE_SUB_INTERVAL]
+                and self._globals[CONF_MIN_SUB_INTERVAL]
+                > self._globals[CONF_MAX_SUB_INTERVAL]
+            ):
+                errors["base"] = "invalid_sub_interval_bounds"
+            elif preset != PRESET_CUSTOM:
+                stored = self.config_entry.options.get("scopes", {})
+                new_scopes = {
+                    scope: sorted(
+                        PRESET_SELECTIONS[preset] & SCOPE_SUPPORTED_OPTIONS[scope]
+                    ) if (scope == SCOPE_COMBINED or scope in self._device_types)
+                    else sorted(stored.get(scope, []))
+                    for scope in SCOPES
+                }
+                return self.async_create_entry(
+                    title="",
+                    data={
+                        "schema": 2,
+                        "scopes": new_scopes,
+                        **self._globals,
+                        CONF_PRESET: preset,
+                    },
+                )
+            else:
+                return await self.async_step_combined()
+
+        options = self.config_entry.options
+        current_preset = options.get(CONF_PRESET, PRESET_CUSTOM)
+        # A retired preset (e.g. the removed "all") may still be stored on an
+        # existing entry; fall back to Custom so the selector has a valid default
+        # while the entry's saved per-scope selection stays untouched.
+        if current_preset not in PRESET_SELECTIONS and current_preset != PRESET_CUSTOM:
+            current_preset = PRESET_CUSTOM
+        current_debug = bool(options.get(CONF_ENABLE_DEBUG_ENTITIES, False))
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(CONF_PRESET, default=current_preset): preset_selector(),
+                vol.Required(
+                    CONF_ENABLE_DEBUG_ENTITIES, default=current_debug
+                ): BOOLEAN_SELECTOR,
+                vol.Required(
+                    CONF_LAZY_DISTRIBUTION_SENSORS,
+                    default=bool(options.get(CONF_LAZY_DISTRIBUTION_SENSORS, False)),
+                ): BOOLEAN_SELECTOR,
+                vol.Required(
+                    CONF_ENABLE_SNAPSHOT_ENTITY,
+                    default=bool(options.get(CONF_ENABLE_SNAPSHOT_ENTITY, False)),
+                ): BOOLEAN_SELECTOR,
+                vol.Required(
+                    CONF_ENABLE_LATENCY_ENTITIES,
+                    default=bool(options.get(CONF_ENABLE_LATENCY_ENTITIES, False)),
+                ): BOOLEAN_SELECTOR,
+                vol.Optional("accumulation"): section(
+                    vol.Schema({
+                        vol.Required(
+                            CONF_INTEGRATION_METHOD,
+                            default=options.get(
+                                CONF_INTEGRATION_METHOD, DEFAULT_INTEGRATION_METHOD
+                            ),
+                        ): integration_method_selector(),
+                        vol.Required(
+                            CONF_ADAPTIVE_SUB_INTERVAL,
+                            default=bool(options.get(CONF_ADAPTIVE_SUB_INTERVAL, False)),
+                        ): BOOLEAN_SELECTOR,
+                        vol.Required(
+                            CONF_MIN_SUB_INTERVAL,
+                            default=options.get(
+                                CONF_MIN_SUB_INTERVAL, DEFAULT_MIN_SUB_INTERVAL
+                            ),
+                        ): SECONDS_SELECTOR,
+                        vol.Required(
+                            CONF_MAX_SUB_INTERVAL,
+                            default=options.get(
+                                CONF_MAX_SUB_INTERVAL, DEFAULT_MAX_SUB_INTERVAL
+                            ),
+                        ): SECONDS_SELECTOR,
+                    }),
+                    {"collapsed": True},
+                ),
+            }),
+            errors=errors,
+        )
+
+    async def async_step_combined(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure combined (whole-home aggregate) sensors."""
+        if user_input is not None:
+            flat = flatten_scope_sections(user_input)
+            self._scopes[SCOPE_COMBINED] = scope_ui_to_leaves(SCOPE_COMBINED, flat)
+            next_step = self._next_scope_step("combined")
+            if next_step is None:
+                return await self._finish()
+            return await getattr(self, f"async_step_{next_step}")()
+
+        stored = set(
+            self.config_entry.options.get("scopes", {}).get(SCOPE_COMBINED, [])
+        )
+        return self.async_show_form(
+            step_id="combined",
+            data_schema=build_scope_form(
+                SCOPE_COMBINED, scope_leaves_to_ui_defaults(SCOPE_COMBINED, stored)
+            ),
+            last_step=self._next_scope_step("combined") is None,
+        )
+
+    async def async_step_grid(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure grid adapter sensors."""
+        if user_input is not None:
+            flat = flatten_scope_sections(user_input)
+            self._scopes["grid"] = scope_ui_to_leaves("grid", flat)
+            next_step = self._next_scope_step("grid")
+            if next_step is None:
+                return await self._finish()
+            return await getattr(self, f"async_step_{next_step}")()
+
+        stored = set(self.config_entry.options.get("scopes", {}).get("grid", []))
+        return self.async_show_form(
+            step_id="grid",
+            data_schema=build_scope_form(
+                "grid", scope_leaves_to_ui_defaults("grid", stored)
+            ),
+            last_step=self._next_scope_step("grid") is None,
+        )
+
+    async def async_step_pv_system(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure PV system adapter sensors."""
+        if user_input is not None:
+            flat = flatten_scope_sections(user_input)
+            self._scopes["pv_system"] = scope_ui_to_leaves("pv_system", flat)
+            next_step = self._next_scope_step("pv_system")
+            if next_step is None:
+                return await self._finish()
+            return await getattr(self, f"async_step_{next_step}")()
+
+        stored = set(self.config_entry.options.get("scopes", {}).get("pv_system", []))
+        return self.async_show_form(
+            step_id="pv_system",
+            data_schema=build_scope_form(
+                "pv_system", scope_leaves_to_ui_defaults("pv_system", stored)
+            ),
+            last_step=self._next_scope_step("pv_system") is None,
+        )
+
+    async def async_step_battery(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure battery adapter sensors."""
+        if user_input is not None:
+            flat = flatten_scope_sections(user_input)
+            self._scopes["battery"] = scope_ui_to_leaves("battery", flat)
+            next_step = self._next_scope_step("battery")
+            if next_step is None:
+                return await self._finish()
+            return await getattr(self, f"async_step_{next_step}")()
+
+        stored = set(self.config_entry.options.get("scopes", {}).get("battery", []))
+        return self.async_show_form(
+            step_id="battery",
+            data_schema=build_scope_form(
+                "battery", scope_leaves_to_ui_defaults("battery", stored)
+            ),
+            last_step=self._next_scope_step("battery") is None,
+        )
+
+    async def async_step_consumer(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Configure consumer adapter sensors."""
+        if user_input is not None:
+            flat = flatten_scope_sections(user_input)
+            self._scopes["consumer"] = scope_ui_to_leaves("consumer", flat)
+            return await self._finish()
+
+        stored = set(self.config_entry.options.get("scopes", {}).get("consumer", []))
+        return self.async_show_form(
+            step_id="consumer",
+            data_schema=build_scope_form(
+                "consumer", scope_leaves_to_ui_defaults("consumer", stored)
+            ),
+            last_step=True,
+        )
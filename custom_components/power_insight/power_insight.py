@@ -77,6 +77,89 @@ class ConsumerAdapters(AdapterContainer):
     pass
 
 
+class ResultTable:
+    """Per-tick memo of the engine results.
+
+    Every engine property is recomputed on access, and the per-adapter
+    properties build a ``{uid: value}`` dict over all adapters. Reading them
+    through the table evaluates each property at most once per engine
+    *generation* (bumped whenever an input value changes), so N sensors reading
+    one dict property cost one evaluation plus N dict lookups per tick.
+
+    Attribute access mirrors ``PowerInsight``, which lets the existing
+    ``value_fn`` lambdas run against the table unchanged.
+    """
+
+    def __init__(self, power_insight: PowerInsight) -> None:
+        """Initialize instance."""
+        self._power_insight = power_insight
+        self._generation = -1
+        self._values: dict[str, object] = {}
+
+    def __getattr__(self, name: str):
+        """Return the memoized engine property *name*."""
+        values = self._current()
+        try:
+            return values[name]
+        except KeyError:
+            if (stats := self._power_insight.instrumentation) is not None:
+                value = stats.evaluate(name, getattr, self._power_insight, name)
+            else:
+                value = getattr(self._power_insight, name)
+            values[name] = value
+            return value
+
+    def _current(self) -> dict[str, object]:
+        """Return the memo, dropping it if the engine moved on."""
+        generation = self._power_insight.generation
+        if generation != self._generation:
+            self._values = {}
+            self._generation = generation
+        return self._values
+
+    def cell(self, value_fn, *keys: str, output_fn=None) -> ResultCell:
+        """Bind a reader to ``value_fn(table)[keys[0]][keys[1]]...``.
+
+        ``output_fn`` is the sensor's output stage (scaling, correction). It is
+        applied to non-``None`` values once per generation, so the cell holds
+        display-ready values.
+        """
+        return ResultCell(self, value_fn, keys, output_fn)
+
+
+class ResultCell:
+    """A sensor's slot in the result table, re-read once per generation."""
+
+    __slots__ = ("_generation", "_keys", "_output_fn", "_table", "_value", "_value_fn")
+
+    def __init__(
+        self, table: ResultTable, value_fn, keys: tuple[str, ...], output_fn=None
+    ) -> None:
+        """Initialize instance."""
+        self._table = table
+        self._value_fn = value_fn
+        self._keys = keys
+        self._output_fn = output_fn
+        self._generation = -1
+        self._value = None
+
+    @property
+    def value(self):
+        """Return the current value of the cell."""
+        generation = self._table._power_insight.generation
+        if generation != self._generation:
+            value = self._value_fn(self._table)
+            for key in self._keys:
+                if value is None:
+                    break
+                value = value.get(key)
+            if value is not None and self._output_fn is not None:
+                value = self._output_fn(value)
+            self._value = value
+            self._generation = generation
+        return self._value
+
+
 class PowerInsight:
     """Class used for the calculation of the power insights."""
 
@@ -90,6 +173,11 @@ class PowerInsight:
         self.pv_system_adapters = PvSystemAdapters()
         self.storage_adapters = BatteryAdapters()
         self.consumer_adapters = ConsumerAdapters()
+        # Bumped on every input change; invalidates ``results``.
+        self.generation = 0
+        self.results = ResultTable(self)
+        # Optional hot-path statistics (``instrumentation.Instrumentation``).
+        self.instrumentation = None
 
     @property
     def entity_mapping(self) -> dict:
@@ -2226,10 +2314,43 @@ class PowerInsight:
         when a source entity fires state_changed but the numeric value is the same.
         """
         adapter = self.get_adapter_by_entity(entity_id)
-        if adapter is not None:
-            return adapter.set_value(entity_id, new_value)
+        if adapter is not None and adapter.set_value(entity_id, new_value):
+            self.generation += 1
+            return True
         return False
 
+    def invalidate(self) -> None:
+        """Drop memoized results after a change outside of ``set_value``."""
+        self.generation += 1
+
+    def settings_compatible(self, other: PowerInsight) -> bool:
+        """Return True if *other* differs from this engine in settings only.
+
+        Both engines must hold the same adapters (uid, type, order, tracked
+        entities, names, ...), differing at most in their ``HOT_SETTINGS``.
+        """
+        if self.grid_adapter is None or other.grid_adapter is None:
+            return False
+        mine, theirs = self.uid_mapping, other.uid_mapping
+        return list(mine) == list(theirs) and all(
+            adapter.settings_compatible(theirs[uid]) for uid, adapter in mine.items()
+        )
+
+    def apply_settings(self, other: PowerInsight) -> set[str]:
+        """Copy the hot settings of a ``settings_compatible`` engine.
+
+        Returns the uids of the adapters that changed.
+        """
+        theirs = other.uid_mapping
+        changed = {
+            uid
+            for uid, adapter in self.uid_mapping.items()
+            if adapter.apply_settings(theirs[uid])
+        }
+        if changed:
+            self.invalidate()
+        return changed
+
     def register_adapter(self, adapter) -> None:
         """Register an adapter."""
         if isinstance(adapter, GridAdapter):
@@ -2251,6 +2372,8 @@ class PowerInsight:
         else:
             raise ValueError(f"Error registering adapter `{adapter}`.")
 
+        self.invalidate()
+
     def _to_kilo(self, power: float) -> float:
         """Convert the value into the kilo prefix."""
         if power == 0.0:
@@ -2278,12 +2401,41 @@ class PowerInsight:
 class AbstractBaseAdapter(ABC):
     """Abstract base adapter."""
 
+    # Attributes a reconfiguration may change on a live adapter. They only
+    # scale or route the computed values, never which entities are tracked.
+    HOT_SETTINGS: tuple[str, ...] = ()
+
     def __init__(self, unique_id, verbose_name, **kwargs) -> None:
         """Initialize base adapter."""
         self.uid = unique_id
         self.verbose_name = verbose_name
         self._values = {}
 
+    def _static_settings(self) -> dict:
+        """Return the configuration that requires a rebuild to change."""
+        return {
+            name: value
+            for name, value in vars(self).items()
+            if name != "_values" and name not in self.HOT_SETTINGS
+        }
+
+    def settings_compatible(self, other: AbstractBaseAdapter) -> bool:
+        """Return True if *other* differs from this adapter in settings only."""
+        return (
+            type(self) is type(other)
+            and self._static_settings() == other._static_settings()
+        )
+
+    def apply_settings(self, other: AbstractBaseAdapter) -> bool:
+        """Copy ``HOT_SETTINGS`` from *other*, returning True if any changed."""
+        changed = False
+        for name in self.HOT_SETTINGS:
+            value = getattr(other, name)
+            if getattr(self, name) != value:
+                setattr(self, name, value)
+                changed = True
+        return changed
+
     @property
     def correction_factor(self) -> float:
         """Return the levelized-cost correction factor (1.0 unless overridden).
@@ -2533,6 +2685,8 @@ class GridAdapter(BasePowerProvidingAdapter):
 class BaseProductionAdapter(BasePowerProvidingAdapter):
     """Grid power adapter."""
 
+    HOT_SETTINGS = ("export_compensation",)
+
     def __init__(
         self,
         unique_id: str,
@@ -2669,6 +2823,9 @@ class PvAdapter(BaseProductionAdapter):
     """Photovoltaic system adapter."""
 
     ADAPTER_TYPES = ("pv_system",)
+    HOT_SETTINGS = BaseProductionAdapter.HOT_SETTINGS + (
+        "_lcoe", "_lco2_intensity", "_correction_factor",
+    )
 
     def __init__(
         self,
@@ -2711,6 +2868,9 @@ class BatteryAdapter(BaseProductionAdapter):
     """Battery adapter."""
 
     ADAPTER_TYPES = ("battery",)
+    HOT_SETTINGS = BaseProductionAdapter.HOT_SETTINGS + (
+        "_lcos", "_lco2_intensity", "_correction_factor", "charge_from_adapters",
+    )
 
     def __init__(
         self,
@@ -0,0 +1,168 @@
+"""The ``power_insight.profile`` service.
+
+Profiles the running event loop for a few seconds with ``cProfile``, so hot
+spots can be captured in place under real load. The raw profile is written to
+the config directory as a ``.pstats`` file (open it with ``snakeviz``,
+``gprof2dot`` or ``python -m pstats``); the response summarises the engine
+properties and the integration callbacks that took the most time, plus the
+entry's hot-path counters over the same window.
+
+cProfile sees the whole event loop thread, not just one entry, so with several
+entries the engine and callback times cover all of them; the counters are the
+requested entry's own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import TYPE_CHECKING, Any
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    import pstats
+
+    from . import MyConfigEntry
+
+SERVICE_PROFILE = "profile"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_DURATION = "duration"
+
+DEFAULT_DURATION = 30
+MAX_DURATION = 600
+TOP_FUNCTIONS = 10
+
+PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_DURATION, default=DEFAULT_DURATION): vol.All(
+            vol.Coerce(float), vol.Range(min=1, max=MAX_DURATION)
+        ),
+    }
+)
+
+_PACKAGE_DIR = os.path.dirname(__file__)
+_ENGINE_FILE = os.path.join(_PACKAGE_DIR, "power_insight.py")
+# Measuring wrappers, not work of their own.
+_SKIPPED_FILES = frozenset(
+    os.path.join(_PACKAGE_DIR, name) for name in ("instrumentation.py", "profiler.py")
+)
+
+# Only one cProfile can be active per interpreter; this guards our own runs,
+# a foreign profiler surfaces as ``profiler_busy``.
+_ACTIVE = f"{DOMAIN}_profile_active"
+
+
+def async_register_profile_service(hass: HomeAssistant) -> None:
+    """Register ``power_insight.profile``."""
+
+    async def _async_profile(call: ServiceCall) -> ServiceResponse:
+        entry = hass.config_entries.async_get_entry(call.data[ATTR_CONFIG_ENTRY_ID])
+        if (
+            entry is None
+            or entry.domain != DOMAIN
+            or entry.state is not ConfigEntryState.LOADED
+        ):
+            raise ServiceValidationError(
+                f"'{call.data[ATTR_CONFIG_ENTRY_ID]}' is not a loaded Power Insight "
+                "config entry."
+            )
+        if hass.data.get(_ACTIVE):
+            raise ServiceValidationError("A Power Insight profile is already running.")
+        return await async_profile(hass, entry, call.data[ATTR_DURATION])
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+
+async def async_profile(
+    hass: HomeAssistant, entry: MyConfigEntry, duration: float
+) -> dict[str, Any]:
+    """Profile the event loop for *duration* seconds; return the summary."""
+    # Imported here: the profiler is rarely used and ``pstats`` is slow to load.
+    import cProfile
+    import pstats
+
+    stats = entry.runtime_data.power_insight.instrumentation
+    before = _counters(stats)
+
+    profiler = cProfile.Profile()
+    hass.data[_ACTIVE] = True
+    try:
+        try:
+            profiler.enable()
+        except ValueError as err:
+            # Another profiler (e.g. ``profiler.start``) holds the interpreter.
+            raise HomeAssistantError(
+                translation_domain=DOMAIN, translation_key="profiler_busy"
+            ) from err
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            profiler.disable()
+    finally:
+        hass.data.pop(_ACTIVE, None)
+
+    after = _counters(stats)
+    path = hass.config.path(
+        f"{DOMAIN}_profile_{entry.entry_id}_"
+        f"{dt_util.utcnow().strftime('%Y%m%d%H%M%S')}.pstats"
+    )
+    await hass.async_add_executor_job(profiler.dump_stats, path)
+    return {
+        "file": path,
+        "duration_s": duration,
+        "counters": {key: after[key] - before.get(key, 0) for key in after},
+        **_summarize(pstats.Stats(profiler)),
+    }
+
+
+def _counters(stats) -> dict[str, int]:
+    if stats is None:
+        return {}
+    return {"ticks": stats.ticks, **stats.counters}
+
+
+def _summarize(stats: pstats.Stats) -> dict[str, Any]:
+    """Return the top engine properties and integration callbacks."""
+    properties: list[dict[str, Any]] = []
+    callbacks: list[dict[str, Any]] = []
+    for (filename, line, name), (_, calls, own, cumulative, _) in stats.stats.items():
+        if not filename.startswith(_PACKAGE_DIR) or filename in _SKIPPED_FILES:
+            continue
+        row = {
+            "function": f"{os.path.basename(filename)}:{line}({name})",
+            "calls": calls,
+            "own_ms": round(own * 1e3, 3),
+            "cumulative_ms": round(cumulative * 1e3, 3),
+        }
+        (properties if filename == _ENGINE_FILE else callbacks).append(row)
+
+    def top(rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        rows.sort(key=lambda row: row["cumulative_ms"], reverse=True)
+        return rows[:TOP_FUNCTIONS]
+
+    return {
+        "total_calls": stats.total_calls,
+        "total_ms": round(stats.total_tt * 1e3, 3),
+        "top_properties": top(properties),
+        "top_callbacks": top(callbacks),
+    }
@@ -0,0 +1,92 @@
+"""Apply settings-only configuration changes without reloading the entry.
+
+A reload tears down every listener, rebuilds the engine and all sensors and
+restores every accumulator, which leaves a gap of seconds in the accounting of
+the whole home. Most reconfigurations only change adapter settings the engine
+reads at calculation time (lcoe/lcos, CO2 intensity, correction factor, export
+compensation, ``charge_from_adapters``). ``async_apply_hot_update`` applies
+those to the live engine instead, provided that
+
+- the entry's title, options and data are unchanged,
+- a freshly built engine differs from the live one in ``HOT_SETTINGS`` only,
+- and the new configuration yields exactly the same sensors.
+
+Accumulators integrate up to the moment of the change at the old rate and
+restart from the new one; instantaneous sensors are written only if their value
+changed.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from typing import TYPE_CHECKING
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import async_get_platforms
+from homeassistant.util import dt as dt_util
+
+from .adapter_models import create_power_insight
+from .const import DOMAIN
+from .entity import BaseEventIntegrationSensorEntity, BaseEventSensorEntity
+
+if TYPE_CHECKING:
+    from . import MyConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def static_config(entry: MyConfigEntry) -> str:
+    """Return a key for the entry-level config a hot update must not change."""
+    return json.dumps(
+        {"title": entry.title, "options": dict(entry.options), "data": dict(entry.data)},
+        sort_keys=True,
+        default=str,
+    )
+
+
+@callback
+def async_apply_hot_update(hass: HomeAssistant, entry: MyConfigEntry) -> bool:
+    """Apply a settings-only change in place; return False if a reload is needed."""
+    # Imported here: sensor.py imports the package, which imports this module.
+    from .sensor import async_adopt_blueprint
+
+    data = entry.runtime_data
+    live = data.power_insight
+    if data.static_config != static_config(entry):
+        return False
+    candidate = create_power_insight(entry.subentries.values())
+    if not live.settings_compatible(candidate):
+        return False
+    if not async_adopt_blueprint(hass, entry, candidate):
+        return False
+
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == entry.entry_id
+        for entity in platform.entities.values()
+    ]
+    accumulators = [
+        e for e in entities if isinstance(e, BaseEventIntegrationSensorEntity)
+    ]
+    measurements = [e for e in entities if isinstance(e, BaseEventSensorEntity)]
+
+    now = dt_util.utcnow()
+    for accumulator in accumulators:
+        accumulator.async_reanchor(now)
+    before = [
+        (sensor.native_value, sensor.extra_state_attributes) for sensor in measurements
+    ]
+
+    changed = live.apply_settings(candidate)
+
+    for accumulator in accumulators:
+        accumulator.async_reanchor(now)
+    for sensor, value in zip(measurements, before, strict=True):
+        if (sensor.native_value, sensor.extra_state_attributes) != value:
+            sensor.async_write_ha_state()
+
+    _LOGGER.debug("Applied new settings of %s in place", sorted(changed))
+    return True
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+import json
 import logging
+from collections import Counter
 from collections.abc import Callable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from decimal import Decimal
 
 import voluptuous as vol
@@ -15,9 +18,13 @@ from homeassistant.helpers import entity_platform
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.util import dt as dt_util
 from homeassistant.const import (
     PERCENTAGE,
+    EntityCategory,
     UnitOfPower,
+    UnitOfTime,
 )
 from homeassistant.components.sensor import (
     SensorDeviceClass,
@@ -30,11 +37,13 @@ from .entity import (
     BaseEventIntegrationSensorEntity,
     IntegrationSensorExtraStoredData,
 )
+from .instrumentation import Latency
 from .utils import get_value
 from .power_insight import PowerInsight, AbstractBaseAdapter
 from . import MyConfigEntry
 from .const import (
     DOMAIN,
+    DATA_BLUEPRINTS,
     SCOPE_COMBINED,
     CONF_ENABLE_DEBUG_ENTITIES,
     CONF_ENABLE_DISTRIBUTION_POWER,
@@ -42,6 +51,12 @@ from .const import (
     CONF_ENABLE_DISTRIBUTION_SHARES,
     CONF_ENABLE_CHARGING_SOURCE_SHARES,
     CONF_ENABLE_POWER_SOURCE_SHARES,
+    CONF_GROUP_POWER_SOURCE_SHARES,
+    CONF_LAZY_DISTRIBUTION_SENSORS,
+    LAZY_REFRESH_INTERVAL,
+    CONF_ENABLE_SNAPSHOT_ENTITY,
+    CONF_ENABLE_LATENCY_ENTITIES,
+    LATENCY_REFRESH_INTERVAL,
     CONF_ENABLE_EXPORT_COMPENSATION_RATE,
     CONF_ACCUMULATE_EXPORT_COMPENSATION,
     CONF_CALCULATE_COST_RATES,
@@ -57,6 +72,13 @@ from .const import (
     CONF_ACCUMULATE_FINANCIAL_RETURN,
     CONF_ACCUMULATE_LEVELIZED_FINANCIAL_RETURN,
     CONF_RETIRED_ADAPTERS,
+    CONF_ADAPTIVE_SUB_INTERVAL,
+    CONF_MIN_SUB_INTERVAL,
+    CONF_MAX_SUB_INTERVAL,
+    DEFAULT_MIN_SUB_INTERVAL,
+    DEFAULT_MAX_SUB_INTERVAL,
+    CONF_INTEGRATION_METHOD,
+    DEFAULT_INTEGRATION_METHOD,
 )
 
 _LOGGER = logging.getLogger(__name__)
@@ -98,6 +120,19 @@ class PowerInsightIntegrationSensorDescription(SensorEntityDescription):
     apply_correction_factor: bool = False
 
 
+@dataclass(frozen=True, kw_only=True)
+class PowerInsightLatencySensorDescription(PowerInsightSensorDescription):
+    """Describe a latency sensor: one figure of the instrumentation's window.
+
+    These read the ``Latency`` window, not the engine; no source entity drives
+    them and ``value_fn`` is unused.
+    """
+
+    entities_fn: Callable[[PowerInsight], list[str]] = lambda _: []
+    value_fn: Callable[[PowerInsight], float | None] = lambda _: None
+    figure_fn: Callable[[Latency], float | None]
+
+
 # ---------------------------------------------------------------------------
 # Hub-level sensors
 # ---------------------------------------------------------------------------
@@ -354,9 +389,10 @@ POWER_INSIGHT_INTEGRATION_SENSORS = (
 # Combined accumulated levelized sensors (derived + retired-adapter ledger)
 #
 # These do NOT integrate a pre-summed combined rate. Instead they derive their
-# value at read time as the sum of the per-adapter base accumulated totals
-# (each already scaled by that adapter's correction factor for display) plus a
-# persistent ledger of removed end-of-life adapters. This keeps the combined
+# value from the entry's in-memory ``LevelizedLedger``: the running sum of the
+# per-adapter base accumulated totals (each already scaled by that adapter's
+# correction factor for display) plus a persistent ledger of removed
+# end-of-life adapters. This keeps the combined
 # total consistent with the per-adapter totals, makes lifetime-value
 # corrections retroactive, and prevents a removed device from dropping its
 # historical contribution.
@@ -1272,12 +1308,80 @@ POWER_INSIGHT_CONS_ADAPTER_INTEGRATION_SENSORS: tuple[
     PowerInsightIntegrationSensorDescription, ...
 ] = ()
 
+# Grouped alternative to the per-source "Power share from {Source}" sensors.
+CONS_ADAPTER_LOCAL_POWER_SHARE_SENSOR = PowerInsightSensorDescription(
+    key="local_power_share",
+    name="Local power share",
+    icon="mdi:home-lightning-bolt",
+    native_unit_of_measurement=PERCENTAGE,
+    state_class=SensorStateClass.MEASUREMENT,
+    suggested_display_precision=0,
+    entities_fn=lambda obj: obj.source_entities_power,
+    value_fn=lambda obj: obj.cons_adapters_source_shares,
+    transform_fn=lambda val: val * 100,
+)
+
 
 # ---------------------------------------------------------------------------
 # Options wrapper
 # ---------------------------------------------------------------------------
 
 
+SNAPSHOT_SENSOR = PowerInsightSensorDescription(
+    key="snapshot",
+    name="Snapshot",
+    icon="mdi:table",
+    native_unit_of_measurement=UnitOfPower.WATT,
+    state_class=SensorStateClass.MEASUREMENT,
+    device_class=SensorDeviceClass.POWER,
+    suggested_display_precision=0,
+    entities_fn=lambda obj: obj.source_entities,
+    value_fn=lambda obj: obj.gross_power,
+)
+
+# Hub diagnostics polled from the entry's instrumentation.
+LATENCY_SENSORS = (
+    PowerInsightLatencySensorDescription(
+        key="tick_rate",
+        name="Update rate",
+        icon="mdi:pulse",
+        native_unit_of_measurement="updates/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        figure_fn=lambda latency: latency.ticks_per_minute,
+    ),
+    PowerInsightLatencySensorDescription(
+        key="evaluation_time_mean",
+        name="Mean calculation time",
+        icon="mdi:timer-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        suggested_display_precision=3,
+        figure_fn=lambda latency: latency.evaluation_mean_ms,
+    ),
+    PowerInsightLatencySensorDescription(
+        key="evaluation_time_p95",
+        name="95th percentile calculation time",
+        icon="mdi:timer-alert-outline",
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        state_class=SensorStateClass.MEASUREMENT,
+        device_class=SensorDeviceClass.DURATION,
+        suggested_display_precision=3,
+        figure_fn=lambda latency: latency.evaluation_p95_ms,
+    ),
+    PowerInsightLatencySensorDescription(
+        key="write_rate",
+        name="State write rate",
+        icon="mdi:database-arrow-up-outline",
+        native_unit_of_measurement="writes/min",
+        state_class=SensorStateClass.MEASUREMENT,
+        suggested_display_precision=1,
+        figure_fn=lambda latency: latency.writes_per_minute,
+    ),
+)
+
+
 class OptionsWrapper:
     """Scope-aware view over the per-scope options dict.
 
@@ -1385,6 +1489,15 @@ _SENSOR_OPTION_GATE: dict[str, str] = {
 }
 
 
+# Options whose sensors refresh lazily when CONF_LAZY_DISTRIBUTION_SENSORS is
+# on. The dynamic per-source shares are gated inline, see ``_compile_blueprint``.
+_LAZY_OPTION_GATES = frozenset({
+    CONF_ENABLE_DISTRIBUTION_POWER,
+    CONF_ENABLE_DISTRIBUTION_RATIOS,
+    CONF_ENABLE_DISTRIBUTION_SHARES,
+})
+
+
 def _option_gated_out(description, options: OptionsWrapper, scope: str) -> bool:
     """Return True if *description* is gated off for *scope* by the options."""
     gate = _SENSOR_OPTION_GATE.get(description.key)
@@ -1440,60 +1553,153 @@ def _sync_entity_enabled_state(
             )
 
 
-def _resolve_currency_unit(unit: str | None, hass: HomeAssistant | None) -> str | None:
-    """Replace the ``EUR`` placeholder in a unit with the configured currency.
+@callback
+def _sync_entity_enabled_diff(
+    hass: HomeAssistant,
+    added_unique_ids: set[str],
+    removed_unique_ids: set[str],
+) -> None:
+    """Apply ``_sync_entity_enabled_state`` to the sensors that changed only.
 
-    Falls back to the literal (``EUR``) when no currency is configured, so
-    existing setups keep their units unchanged.
+    Used on reload, when the previous blueprint already reconciled every other
+    entity of the entry.
     """
-    if unit and "EUR" in unit and hass is not None:
-        currency = hass.config.currency
-        if currency:
-            return unit.replace("EUR", currency)
-    return unit
+    ent_reg = er.async_get(hass)
+    for unique_id in added_unique_ids:
+        entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id)
+        if entity_id is None:
+            continue
+        if ent_reg.entities[entity_id].disabled_by is er.RegistryEntryDisabler.INTEGRATION:
+            ent_reg.async_update_entity(entity_id, disabled_by=None)
+    for unique_id in removed_unique_ids:
+        entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id)
+        if entity_id is None:
+            continue
+        if ent_reg.entities[entity_id].disabled_by is None:
+            ent_reg.async_update_entity(
+                entity_id,
+                disabled_by=er.RegistryEntryDisabler.INTEGRATION,
+            )
 
 
-def _retired_ledger_sum(config_entry: ConfigEntry, per_adapter_key: str) -> float:
-    """Sum the frozen contributions of retired adapters for a levelized key.
+def _sub_interval_bounds(options: dict) -> tuple[timedelta, timedelta | None]:
+    """Return ``(max_sub_interval, min_sub_interval)`` for integration sensors.
 
-    A retired (removed end-of-life) adapter's final corrected accumulated total
-    is persisted in ``config_entry.data[CONF_RETIRED_ADAPTERS]`` so that the
-    combined total never drops when the device is removed.
+    ``min_sub_interval`` is ``None`` unless the adaptive timer is enabled, which
+    keeps the fixed 1-minute interval for entries that never opted in.
     """
-    total = 0.0
-    for retired in config_entry.data.get(CONF_RETIRED_ADAPTERS, []):
-        value = retired.get("totals", {}).get(per_adapter_key)
-        if value is not None:
-            total += value
-    return total
+    if not options.get(CONF_ADAPTIVE_SUB_INTERVAL, False):
+        return timedelta(minutes=1), None
+    return (
+        timedelta(seconds=options.get(CONF_MAX_SUB_INTERVAL, DEFAULT_MAX_SUB_INTERVAL)),
+        timedelta(seconds=options.get(CONF_MIN_SUB_INTERVAL, DEFAULT_MIN_SUB_INTERVAL)),
+    )
 
 
 # ---------------------------------------------------------------------------
-# Platform setup
+# Entity blueprint
 # ---------------------------------------------------------------------------
+#
+# Which sensors an entry gets depends only on its topology (the subentries) and
+# its options. ``_compile_blueprint`` walks the descriptions once for such a
+# pair and records the outcome as plain specs, which ``async_setup_entry`` then
+# instantiates against the freshly built engine. Blueprints are cached per
+# entry and signature in ``hass.data``, and on reload the previous blueprint is
+# diffed against the new one so only the sensors that came or went touch the
+# entity registry.
+
+
+@dataclass(frozen=True, slots=True)
+class _EntitySpec:
+    """One sensor of a blueprint: which class to build, for which adapter(s)."""
+
+    entity_cls: type[BasePowerInsightSensor | BasePowerInsightIntegrationSensor]
+    description: (
+        PowerInsightSensorDescription | PowerInsightIntegrationSensorDescription
+    )
+    unique_id: str
+    source_entities: list[str]
+    adapter_uid: str | None = None
+    dynamic_uid: str | None = None
+    # Refresh on the lazy cadence instead of on source events.
+    lazy: bool = False
 
 
-async def async_setup_entry(
-        hass: HomeAssistant,
-        entry: MyConfigEntry,
-        async_add_entities: AddEntitiesCallback,
-) -> None:
-    """Set up the sensor platform."""
-    power_insight = entry.runtime_data.power_insight
-    if power_insight.grid_adapter is None:
-        return
+@dataclass(frozen=True, slots=True)
+class SensorBlueprint:
+    """The sensors of one (topology, options) pair, grouped by device."""
+
+    signature: str
+    # (config_subentry_id, specs); ``None`` groups the hub-level sensors.
+    groups: tuple[tuple[str | None, tuple[_EntitySpec, ...]], ...]
+    unique_ids: frozenset[str]
+
+
+@dataclass
+class _EntryBlueprints:
+    """Blueprints compiled for one config entry, newest last."""
+
+    compiled: dict[str, SensorBlueprint] = field(default_factory=dict)
+    current: SensorBlueprint | None = None
+
+
+# Option toggles flip between a handful of signatures; keep the recent ones.
+_BLUEPRINT_CACHE_SIZE = 4
+
+
+def _blueprint_signature(entry: ConfigEntry) -> str:
+    """Return a key for everything the set of sensors depends on."""
+    return json.dumps(
+        {
+            "subentries": {
+                subentry_id: [subentry.subentry_type, subentry.title, dict(subentry.data)]
+                for subentry_id, subentry in entry.subentries.items()
+            },
+            "options": dict(entry.options),
+            "retired": bool(entry.data.get(CONF_RETIRED_ADAPTERS)),
+        },
+        sort_keys=True,
+        default=str,
+    )
+
+
+def _compile_blueprint(
+    entry: ConfigEntry, power_insight: PowerInsight, signature: str
+) -> SensorBlueprint:
+    """Walk the sensor descriptions once and record which sensors to create."""
     options_wrapped = OptionsWrapper(entry.options)
-    # Unique IDs of every sensor we create this run, used afterwards to disable
-    # (and later re-enable) entities whose controlling option has been toggled.
-    created_unique_ids: set[str] = set()
+    # Memoizes the source-entity lists shared by most descriptions.
+    results = power_insight.results
+    groups: list[tuple[str | None, tuple[_EntitySpec, ...]]] = []
+    lazy_mode = bool(entry.options.get(CONF_LAZY_DISTRIBUTION_SENSORS, False))
+
+    def is_lazy(description) -> bool:
+        return lazy_mode and _SENSOR_OPTION_GATE.get(description.key) in _LAZY_OPTION_GATES
+
+    def hub(entity_cls, description) -> _EntitySpec:
+        return _EntitySpec(
+            entity_cls,
+            description,
+            f"{entry.entry_id}_{description.key}",
+            description.entities_fn(results),
+            lazy=is_lazy(description),
+        )
 
-    def _add(entities: list, **kwargs) -> None:
-        """Register a batch of entities and record their unique IDs."""
-        created_unique_ids.update(ent.unique_id for ent in entities)
-        async_add_entities(entities, **kwargs)
+    def per_adapter(
+        entity_cls, description, adapter, dynamic_adapter=None, lazy=None
+    ) -> _EntitySpec:
+        return _EntitySpec(
+            entity_cls,
+            description,
+            f"{entry.entry_id}_{adapter.uid}_{description.key}",
+            description.entities_fn(results),
+            adapter.uid,
+            dynamic_adapter.uid if dynamic_adapter is not None else None,
+            is_lazy(description) if lazy is None else lazy,
+        )
 
     # --- Hub-level sensors ---
-    entities: list = []
+    specs: list[_EntitySpec] = []
     # Evaluated once; shared by the three loops below.
     _prod_lcoe_available = _all_prod_adapters_have_lcoe(power_insight)
     # Ledger sensors should also survive after all prod adapters are removed, as
@@ -1506,24 +1712,14 @@ async def async_setup_entry(
             continue
         if description.lcoe_gated and not _prod_lcoe_available:
             continue
-        entities.append(PowerInsightSensor(
-            description=description,
-            config_entry=entry,
-            source_entities=description.entities_fn(power_insight),
-            power_insight=power_insight,
-        ))
+        specs.append(hub(PowerInsightSensor, description))
 
     for description in POWER_INSIGHT_INTEGRATION_SENSORS:
         if not description.exists_fn(options_wrapped):
             continue
         if _option_gated_out(description, options_wrapped, SCOPE_COMBINED):
             continue
-        entities.append(PowerInsightIntegrationSensor(
-            description=description,
-            config_entry=entry,
-            source_entities=description.entities_fn(power_insight),
-            power_insight=power_insight,
-        ))
+        specs.append(hub(PowerInsightIntegrationSensor, description))
 
     # Combined accumulated levelized sensors are derived (summed from the
     # per-adapter base totals + retired-adapter ledger), not integrated.
@@ -1534,18 +1730,21 @@ async def async_setup_entry(
             continue
         if description.lcoe_gated and not (_prod_lcoe_available or _has_retired_lcoe):
             continue
-        entities.append(PowerInsightCombinedLedgerSensor(
-            description=description,
-            config_entry=entry,
-            source_entities=description.entities_fn(power_insight),
-            power_insight=power_insight,
-        ))
+        specs.append(hub(PowerInsightCombinedLedgerSensor, description))
+
+    if entry.options.get(CONF_ENABLE_SNAPSHOT_ENTITY, False):
+        specs.append(hub(PowerInsightSnapshotSensor, SNAPSHOT_SENSOR))
+    if entry.options.get(CONF_ENABLE_LATENCY_ENTITIES, False):
+        specs.extend(
+            hub(PowerInsightLatencySensor, description)
+            for description in LATENCY_SENSORS
+        )
 
-    _add(entities)
+    groups.append((None, tuple(specs)))
 
     # --- Grid adapter sensors ---
     grid_adapter = power_insight.grid_adapter
-    entities = []
+    specs = []
     for description in POWER_INSIGHT_GRID_ADAPTER_SENSORS:
         if not description.exists_fn(options_wrapped):
             continue
@@ -1555,32 +1754,22 @@ async def async_setup_entry(
             power_insight, grid_adapter.uid
         ):
             continue
-        entities.append(PowerInsightAdapterSensor(
-            description=description,
-            config_entry=entry,
-            source_entities=description.entities_fn(power_insight),
-            power_insight=power_insight,
-            device_adapter=grid_adapter,
-        ))
+        specs.append(per_adapter(PowerInsightAdapterSensor, description, grid_adapter))
 
     for description in POWER_INSIGHT_GRID_ADAPTER_INTEGRATION_SENSORS:
         if not description.exists_fn(options_wrapped):
             continue
         if _option_gated_out(description, options_wrapped, "grid"):
             continue
-        entities.append(PowerInsightAdapterIntegrationSensor(
-            description=description,
-            config_entry=entry,
-            source_entities=description.entities_fn(power_insight),
-            power_insight=power_insight,
-            device_adapter=grid_adapter,
-        ))
+        specs.append(
+            per_adapter(PowerInsightAdapterIntegrationSensor, description, grid_adapter)
+        )
 
-    _add(entities, config_subentry_id=grid_adapter.uid)
+    groups.append((grid_adapter.uid, tuple(specs)))
 
     # --- PV adapter sensors ---
     for adapter in power_insight.pv_system_adapters:
-        entities = []
+        specs = []
         for description in POWER_INSIGHT_PV_ADAPTER_SENSORS:
             if not description.exists_fn(adapter):
                 continue
@@ -1590,32 +1779,22 @@ async def async_setup_entry(
                 power_insight, adapter.uid
             ):
                 continue
-            entities.append(PowerInsightAdapterSensor(
-                description=description,
-                config_entry=entry,
-                source_entities=description.entities_fn(power_insight),
-                power_insight=power_insight,
-                device_adapter=adapter,
-            ))
+            specs.append(per_adapter(PowerInsightAdapterSensor, description, adapter))
 
         for description in POWER_INSIGHT_PV_ADAPTER_INTEGRATION_SENSORS:
             if not description.exists_fn(adapter):
                 continue
             if _option_gated_out(description, options_wrapped, "pv_system"):
                 continue
-            entities.append(PowerInsightAdapterIntegrationSensor(
-                description=description,
-                config_entry=entry,
-                source_entities=description.entities_fn(power_insight),
-                power_insight=power_insight,
-                device_adapter=adapter,
-            ))
+            specs.append(
+                per_adapter(PowerInsightAdapterIntegrationSensor, description, adapter)
+            )
 
-        _add(entities, config_subentry_id=adapter.uid)
+        groups.append((adapter.uid, tuple(specs)))
 
     # --- Battery adapter sensors ---
     for adapter in power_insight.storage_adapters:
-        entities = []
+        specs = []
 
         for description in POWER_INSIGHT_STORAGE_ADAPTER_SENSORS:
             if not description.exists_fn(adapter):
@@ -1626,26 +1805,16 @@ async def async_setup_entry(
                 power_insight, adapter.uid
             ):
                 continue
-            entities.append(PowerInsightAdapterSensor(
-                description=description,
-                config_entry=entry,
-                source_entities=description.entities_fn(power_insight),
-                power_insight=power_insight,
-                device_adapter=adapter,
-            ))
+            specs.append(per_adapter(PowerInsightAdapterSensor, description, adapter))
 
         for description in POWER_INSIGHT_STORAGE_ADAPTER_INTEGRATION_SENSORS:
             if not description.exists_fn(adapter):
                 continue
             if _option_gated_out(description, options_wrapped, "battery"):
                 continue
-            entities.append(PowerInsightAdapterIntegrationSensor(
-                description=description,
-                config_entry=entry,
-                source_entities=description.entities_fn(power_insight),
-                power_insight=power_insight,
-                device_adapter=adapter,
-            ))
+            specs.append(
+                per_adapter(PowerInsightAdapterIntegrationSensor, description, adapter)
+            )
 
         # Dynamic charging source share sensors — one per power-providing
         # adapter the battery is actually configured to charge from. A source
@@ -1668,80 +1837,246 @@ async def async_setup_entry(
                     value_fn=lambda obj: obj.storage_adapters_charging_source_shares,
                     transform_fn=lambda val: val * 100,
                 )
-                entities.append(PowerInsightDynamicAdapterSensor(
-                    description=dynamic_description,
-                    config_entry=entry,
-                    source_entities=dynamic_description.entities_fn(power_insight),
-                    power_insight=power_insight,
-                    device_adapter=adapter,
-                    dynamic_adapter=source_adapter,
+                specs.append(per_adapter(
+                    PowerInsightDynamicAdapterSensor,
+                    dynamic_description,
+                    adapter,
+                    source_adapter,
+                    lazy=lazy_mode,
                 ))
 
-        _add(entities, config_subentry_id=adapter.uid)
+        groups.append((adapter.uid, tuple(specs)))
 
     # --- Consumer adapter sensors ---
     for adapter in power_insight.consumer_adapters:
-        entities = []
+        specs = []
 
         for description in POWER_INSIGHT_CONS_ADAPTER_SENSORS:
             if not description.exists_fn(adapter):
                 continue
             if _option_gated_out(description, options_wrapped, "consumer"):
                 continue
-            entities.append(PowerInsightAdapterSensor(
-                description=description,
-                config_entry=entry,
-                source_entities=description.entities_fn(power_insight),
-                power_insight=power_insight,
-                device_adapter=adapter,
-            ))
+            specs.append(per_adapter(PowerInsightAdapterSensor, description, adapter))
 
         for description in POWER_INSIGHT_CONS_ADAPTER_INTEGRATION_SENSORS:
             if not description.exists_fn(adapter):
                 continue
             if _option_gated_out(description, options_wrapped, "consumer"):
                 continue
-            entities.append(PowerInsightAdapterIntegrationSensor(
-                description=description,
-                config_entry=entry,
-                source_entities=description.entities_fn(power_insight),
-                power_insight=power_insight,
-                device_adapter=adapter,
-            ))
+            specs.append(
+                per_adapter(PowerInsightAdapterIntegrationSensor, description, adapter)
+            )
 
         # Dynamic consumption source share sensors — one per power-providing
         # adapter. Named "Power share from {Source}" to mirror the battery's
         # "Charging share from {Source}" sensors; both report this device's
         # current draw from that source as a share (%). Gate on the power-share
-        # option.
+        # option. Grouped, a single sensor carries all shares as attributes.
         if options_wrapped.check(CONF_ENABLE_POWER_SOURCE_SHARES, "consumer"):
-            for source_adapter in power_insight.gross_power_adapters:
-                name = source_adapter.verbose_name
-                dynamic_description = PowerInsightSensorDescription(
-                    key=f"power_share_from_{name}",
-                    name=f"Power share from {name}",
-                    icon="mdi:percent",
-                    native_unit_of_measurement=PERCENTAGE,
-                    state_class=SensorStateClass.MEASUREMENT,
-                    suggested_display_precision=0,
-                    entities_fn=lambda obj: obj.source_entities_power,
-                    value_fn=lambda obj: obj.cons_adapters_source_shares,
-                    transform_fn=lambda val: val * 100,
-                )
-                entities.append(PowerInsightDynamicAdapterSensor(
-                    description=dynamic_description,
-                    config_entry=entry,
-                    source_entities=dynamic_description.entities_fn(power_insight),
-                    power_insight=power_insight,
-                    device_adapter=adapter,
-                    dynamic_adapter=source_adapter,
+            if options_wrapped.check(CONF_GROUP_POWER_SOURCE_SHARES, "consumer"):
+                specs.append(per_adapter(
+                    PowerInsightSourceSharesSensor,
+                    CONS_ADAPTER_LOCAL_POWER_SHARE_SENSOR,
+                    adapter,
+                    lazy=lazy_mode,
                 ))
+            else:
+                for source_adapter in power_insight.gross_power_adapters:
+                    name = source_adapter.verbose_name
+                    dynamic_description = PowerInsightSensorDescription(
+                        key=f"power_share_from_{name}",
+                        name=f"Power share from {name}",
+                        icon="mdi:percent",
+                        native_unit_of_measurement=PERCENTAGE,
+                        state_class=SensorStateClass.MEASUREMENT,
+                        suggested_display_precision=0,
+                        entities_fn=lambda obj: obj.source_entities_power,
+                        value_fn=lambda obj: obj.cons_adapters_source_shares,
+                        transform_fn=lambda val: val * 100,
+                    )
+                    specs.append(per_adapter(
+                        PowerInsightDynamicAdapterSensor,
+                        dynamic_description,
+                        adapter,
+                        source_adapter,
+                        lazy=lazy_mode,
+                    ))
+
+        groups.append((adapter.uid, tuple(specs)))
+
+    return SensorBlueprint(
+        signature,
+        tuple(groups),
+        frozenset(spec.unique_id for _, specs in groups for spec in specs),
+    )
+
+
+@callback
+def async_adopt_blueprint(
+    hass: HomeAssistant, entry: ConfigEntry, power_insight: PowerInsight
+) -> bool:
+    """Adopt the blueprint of a reconfigured entry if it keeps the same sensors.
+
+    *power_insight* is an engine built from the entry's new configuration.
+    Returns False (leaving the cache untouched) when the set of sensors would
+    change, in which case the entry has to be reloaded.
+    """
+    cache: _EntryBlueprints | None = hass.data.get(DATA_BLUEPRINTS, {}).get(
+        entry.entry_id
+    )
+    if cache is None or cache.current is None:
+        return False
+    signature = _blueprint_signature(entry)
+    blueprint = cache.compiled.get(signature) or _compile_blueprint(
+        entry, power_insight, signature
+    )
+    if blueprint.unique_ids != cache.current.unique_ids:
+        return False
+    cache.compiled[signature] = blueprint
+    cache.current = blueprint
+    return True
 
-        _add(entities, config_subentry_id=adapter.uid)
 
-    # Disable entities whose controlling option is now off (keeping their
-    # history), and re-enable any we previously disabled that are wanted again.
-    _sync_entity_enabled_state(hass, entry, created_unique_ids)
+@callback
+def _async_get_blueprint(
+    hass: HomeAssistant, entry: ConfigEntry, power_insight: PowerInsight
+) -> tuple[SensorBlueprint, SensorBlueprint | None]:
+    """Return the entry's blueprint and the one of its previous setup, if any."""
+    cache: _EntryBlueprints = hass.data.setdefault(DATA_BLUEPRINTS, {}).setdefault(
+        entry.entry_id, _EntryBlueprints()
+    )
+    signature = _blueprint_signature(entry)
+    if (blueprint := cache.compiled.pop(signature, None)) is None:
+        blueprint = _compile_blueprint(entry, power_insight, signature)
+    # Re-insert so the dict stays ordered by last use.
+    cache.compiled[signature] = blueprint
+    while len(cache.compiled) > _BLUEPRINT_CACHE_SIZE:
+        del cache.compiled[next(iter(cache.compiled))]
+    previous, cache.current = cache.current, blueprint
+    return blueprint, previous
+
+
+def _instantiate(
+    spec: _EntitySpec,
+    entry: MyConfigEntry,
+    power_insight: PowerInsight,
+    adapters: dict[str, AbstractBaseAdapter],
+) -> BasePowerInsightSensor | BasePowerInsightIntegrationSensor:
+    """Build the entity described by *spec* against the live engine."""
+    kwargs = {}
+    if spec.adapter_uid is not None:
+        kwargs["device_adapter"] = adapters[spec.adapter_uid]
+    if spec.dynamic_uid is not None:
+        kwargs["dynamic_adapter"] = adapters[spec.dynamic_uid]
+    entity = spec.entity_cls(
+        description=spec.description,
+        config_entry=entry,
+        source_entities=spec.source_entities,
+        power_insight=power_insight,
+        **kwargs,
+    )
+    if spec.lazy:
+        entity.lazy_refresh = timedelta(seconds=LAZY_REFRESH_INTERVAL)
+    return entity
+
+
+# ---------------------------------------------------------------------------
+# Platform setup
+# ---------------------------------------------------------------------------
+
+
+async def async_setup_entry(
+        hass: HomeAssistant,
+        entry: MyConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+    power_insight = entry.runtime_data.power_insight
+    if power_insight.grid_adapter is None:
+        return
+    blueprint, previous = _async_get_blueprint(hass, entry, power_insight)
+    ent_reg = er.async_get(hass)
+    adapters = power_insight.uid_mapping
+
+    # Staged: build every entity, wire the cross-entity trackers, then register.
+    # HA takes one subentry per call, so that is one batch per device.
+    batches = [
+        (
+            subentry_id,
+            [_instantiate(spec, entry, power_insight, adapters) for spec in specs],
+        )
+        for subentry_id, specs in blueprint.groups
+    ]
+    accumulators: list[BasePowerInsightIntegrationSensor] = [
+        ent
+        for _, entities in batches
+        for ent in entities
+        if isinstance(ent, BasePowerInsightIntegrationSensor)
+    ]
+    for _, entities in batches:
+        for ent in entities:
+            if isinstance(ent, PowerInsightSnapshotSensor):
+                ent.track([
+                    member
+                    for _, members in batches
+                    for member in members
+                    if PowerInsightSnapshotSensor.mirrors(member)
+                ])
+    latency_sensors = [
+        ent
+        for _, entities in batches
+        for ent in entities
+        if isinstance(ent, PowerInsightLatencySensor)
+    ]
+    if latency_sensors:
+        entry.async_on_unload(
+            PowerInsightLatencySensor.async_track(
+                hass, power_insight, latency_sensors
+            )
+        )
+    for subentry_id, entities in batches:
+        if subentry_id is None:
+            async_add_entities(entities)
+        else:
+            async_add_entities(entities, config_subentry_id=subentry_id)
+
+    if previous is None:
+        # First setup in this HA run: reconcile against the whole registry.
+        known_unique_ids = {
+            ent.unique_id
+            for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+        }
+        is_existing_entry = bool(known_unique_ids)
+        # Disable entities whose controlling option is now off (keeping their
+        # history), and re-enable any we previously disabled that are wanted
+        # again.
+        _sync_entity_enabled_state(hass, entry, blueprint.unique_ids)
+    else:
+        # Reload: only the sensors that came or went touch the registry.
+        added = blueprint.unique_ids - previous.unique_ids
+        known_unique_ids = {
+            uid for uid in added
+            if ent_reg.async_get_entity_id("sensor", DOMAIN, uid) is not None
+        } | previous.unique_ids
+        is_existing_entry = True
+        _sync_entity_enabled_diff(
+            hass, added, previous.unique_ids - blueprint.unique_ids
+        )
+
+    # Accumulators added to an existing entry (an option was switched on) are
+    # seeded from recorder history instead of starting at zero. A brand-new
+    # entry has nothing to catch up on.
+    new_accumulators = [
+        ent for ent in accumulators if ent.unique_id not in known_unique_ids
+    ]
+    if is_existing_entry and new_accumulators and "recorder" in hass.config.components:
+        from .backfill import async_backfill
+
+        entry.async_create_background_task(
+            hass,
+            async_backfill(hass, entry, new_accumulators),
+            f"{DOMAIN}_backfill_{entry.entry_id}",
+        )
 
     # Register the ``set_value`` service as a platform entity service. HA
     # calls ``async_set_value`` on every targeted entity regardless of whether
@@ -1782,10 +2117,20 @@ class BasePowerInsightSensor(BaseEventSensorEntity):
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Substitute the HA-configured currency for the EUR placeholder."""
-        return _resolve_currency_unit(
-            self.entity_description.native_unit_of_measurement, self.hass
+        return self.config_entry.runtime_data.units.resolve(
+            self.entity_description.native_unit_of_measurement
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Republish a money unit when the configured currency changes."""
+        await super().async_added_to_hass()
+        if "EUR" in (self.entity_description.native_unit_of_measurement or ""):
+            self.async_on_remove(
+                self.config_entry.runtime_data.units.async_add_listener(
+                    self.async_write_ha_state
+                )
+            )
+
     async def async_set_value(self, value: float) -> None:
         """Reject set_value calls on non-accumulation sensors."""
         raise ServiceValidationError(
@@ -1807,6 +2152,9 @@ class PowerInsightSensor(BasePowerInsightSensor):
     ) -> None:
         """Initialize sensor entity."""
         super().__init__(description, config_entry, source_entities, power_insight)
+        self._cell = power_insight.results.cell(
+            description.value_fn, output_fn=description.transform_fn
+        )
         self._attr_unique_id = (
             f"{self.config_entry.entry_id}_{self.entity_description.key}"
         )
@@ -1819,21 +2167,20 @@ class PowerInsightSensor(BasePowerInsightSensor):
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        value = self.entity_description.value_fn(self.power_insight)
-        if value is not None:
-            value = self.entity_description.transform_fn(value)
-        return value
+        return self._cell.value
 
 
 class PowerInsightCombinedLedgerSensor(PowerInsightSensor):
     """Combined accumulated levelized sensor derived from per-adapter totals.
 
-    Recomputes on every source event as the sum of the active per-adapter base
-    accumulated totals (each already scaled by its adapter's correction factor
-    for display) plus the frozen contributions of removed end-of-life adapters.
-    It stores no running total itself, so there is no reload double-count, and
-    a lifetime-value correction is reflected retroactively and consistently in
-    both the per-adapter and the combined totals.
+    Reads the entry's ``LevelizedLedger``: the running sum of the active
+    per-adapter base accumulated totals (each already scaled by its adapter's
+    correction factor for display) plus the frozen contributions of removed
+    end-of-life adapters. The per-adapter accumulators push their totals into
+    the ledger, which schedules a write here whenever the sum changes. This
+    sensor stores no running total itself, so there is no reload double-count,
+    and a lifetime-value correction is reflected retroactively and consistently
+    in both the per-adapter and the combined totals.
     """
 
     def __init__(
@@ -1846,29 +2193,21 @@ class PowerInsightCombinedLedgerSensor(PowerInsightSensor):
         """Initialize the combined ledger sensor."""
         super().__init__(description, config_entry, source_entities, power_insight)
         self._per_adapter_key = COMBINED_LEDGER_ADAPTER_KEYS[description.key]
+        self._ledger = config_entry.runtime_data.ledger
+
+    async def async_added_to_hass(self) -> None:
+        """Also write whenever a per-adapter total in the ledger changes."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._ledger.async_add_listener(
+                self._per_adapter_key, self._schedule_write
+            )
+        )
 
     @property
     def native_value(self) -> float | None:
         """Return the summed per-adapter totals plus the retired ledger."""
-        ent_reg = er.async_get(self.hass)
-        total = 0.0
-        for uid in self.power_insight.levelized_correction_factors:
-            unique_id = (
-                f"{self.config_entry.entry_id}_{uid}_{self._per_adapter_key}"
-            )
-            entity_id = ent_reg.async_get_entity_id("sensor", DOMAIN, unique_id)
-            if entity_id is None:
-                continue
-            state = self.hass.states.get(entity_id)
-            if state is None or state.state in ("unknown", "unavailable"):
-                continue
-            try:
-                total += float(state.state)
-            except (ValueError, TypeError):
-                continue
-
-        total += _retired_ledger_sum(self.config_entry, self._per_adapter_key)
-        return total
+        return self._ledger.total(self._per_adapter_key)
 
 
 class PowerInsightAdapterSensor(BasePowerInsightSensor):
@@ -1885,6 +2224,9 @@ class PowerInsightAdapterSensor(BasePowerInsightSensor):
         """Initialize adapter sensor entity."""
         super().__init__(description, config_entry, source_entities, power_insight)
         self.device_adapter = device_adapter
+        self._cell = power_insight.results.cell(
+            description.value_fn, device_adapter.uid, output_fn=self._output
+        )
 
         uid = f"{self.config_entry.entry_id}_{self.device_adapter.uid}"
         self._attr_unique_id = f"{uid}_{self.entity_description.key}"
@@ -1894,16 +2236,17 @@ class PowerInsightAdapterSensor(BasePowerInsightSensor):
             name=f"{self.config_entry.title} {self.device_adapter.verbose_name}",
         )
 
+    def _output(self, value: float) -> float:
+        """Scale *value* for display and apply the correction factor."""
+        value = self.entity_description.transform_fn(value)
+        if self.entity_description.apply_correction_factor:
+            value = value * self.device_adapter.correction_factor
+        return value
+
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        value = self.entity_description.value_fn(self.power_insight)
-        value = get_value(self.device_adapter.uid, value)
-        if value is not None:
-            value = self.entity_description.transform_fn(value)
-            if self.entity_description.apply_correction_factor:
-                value = value * self.device_adapter.correction_factor
-        return value
+        return self._cell.value
 
 
 class PowerInsightDynamicAdapterSensor(BasePowerInsightSensor):
@@ -1926,6 +2269,12 @@ class PowerInsightDynamicAdapterSensor(BasePowerInsightSensor):
         super().__init__(description, config_entry, source_entities, power_insight)
         self.device_adapter = device_adapter
         self.dynamic_adapter = dynamic_adapter
+        self._cell = power_insight.results.cell(
+            description.value_fn,
+            device_adapter.uid,
+            dynamic_adapter.uid,
+            output_fn=description.transform_fn,
+        )
 
         uid = f"{self.config_entry.entry_id}_{self.device_adapter.uid}"
         self._attr_unique_id = f"{uid}_{self.entity_description.key}"
@@ -1938,12 +2287,191 @@ class PowerInsightDynamicAdapterSensor(BasePowerInsightSensor):
     @property
     def native_value(self) -> float | None:
         """Return the state of the sensor."""
-        value = self.entity_description.value_fn(self.power_insight)
-        value = get_value(self.device_adapter.uid, value)
-        value = get_value(self.dynamic_adapter.uid, value)
-        if value is not None:
-            value = self.entity_description.transform_fn(value)
-        return value
+        return self._cell.value
+
+
+class PowerInsightSourceSharesSensor(PowerInsightAdapterSensor):
+    """Consumer sensor carrying its whole source-share vector.
+
+    Stands in for the per-source ``Power share from {Source}`` entities: one
+    entity and one state write per tick instead of one per source. The state is
+    the share drawn from local sources (every source but the grid); the
+    ``source_shares`` attribute maps each source name to its share (%). Sources
+    sharing a name are told apart by their uid.
+    """
+
+    # Changes on almost every tick; keep it out of the recorder's attributes.
+    _unrecorded_attributes = frozenset({"source_shares"})
+
+    def _output(
+        self, shares: dict[str, float | None]
+    ) -> tuple[float | None, dict[str, float | None]]:
+        """Return the local share and the per-source shares, both in %."""
+        transform = self.entity_description.transform_fn
+        adapters = self.power_insight.uid_mapping
+        grid_uid = self.power_insight.grid_adapter.uid
+        local = [
+            share
+            for uid, share in shares.items()
+            if uid != grid_uid and share is not None
+        ]
+        state = (
+            transform(sum(local))
+            if local or shares.get(grid_uid) is not None
+            else None
+        )
+        names = Counter(adapters[uid].verbose_name for uid in shares)
+        return state, {
+            (
+                name
+                if names[name := adapters[uid].verbose_name] == 1
+                else f"{name} ({uid})"
+            ): None if share is None else round(transform(share), 1)
+            for uid, share in shares.items()
+        }
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the share of local (non-grid) sources."""
+        if (value := self._cell.value) is None:
+            return None
+        return value[0]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, dict[str, float | None]]:
+        """Return the share of every source, keyed by source name."""
+        value = self._cell.value
+        return {"source_shares": value[1] if value is not None else {}}
+
+
+class PowerInsightSnapshotSensor(PowerInsightSensor):
+    """Hub sensor mirroring the entry's whole result table.
+
+    The state is the available (gross) power; the ``results`` attribute maps
+    ``combined`` and every device name to the values of its measurement
+    sensors, keyed like their unique ids. Built from the sensors' result cells,
+    so it costs one pass over memoized values per tick and follows every source
+    entity of the entry. Lazily refreshed sensors are read live here.
+    """
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    # Keep the (large, frequently changing) table out of the recorder.
+    _unrecorded_attributes = frozenset({"results"})
+
+    def __init__(
+            self,
+            description: PowerInsightSensorDescription,
+            config_entry: ConfigEntry,
+            source_entities: list[str],
+            power_insight: PowerInsight,
+    ) -> None:
+        """Initialize the snapshot sensor."""
+        super().__init__(description, config_entry, source_entities, power_insight)
+        self._members: list[tuple[str, str, BasePowerInsightSensor]] = []
+        self._table = power_insight.results.cell(self._collect)
+
+    @staticmethod
+    def mirrors(entity: object) -> bool:
+        """Return True if *entity* reads the engine's result table."""
+        return isinstance(
+            entity,
+            (PowerInsightSensor, PowerInsightAdapterSensor, PowerInsightDynamicAdapterSensor),
+        ) and not isinstance(
+            entity, (PowerInsightCombinedLedgerSensor, PowerInsightSnapshotSensor)
+        )
+
+    def track(self, members: list[BasePowerInsightSensor]) -> None:
+        """Mirror the values of *members* in the ``results`` attribute.
+
+        Devices sharing a name (or named like the ``combined`` group) are told
+        apart by their uid.
+        """
+        adapters = {
+            member.device_adapter.uid: member.device_adapter.verbose_name
+            for member in members
+            if hasattr(member, "device_adapter")
+        }
+        names = Counter([SCOPE_COMBINED, *adapters.values()])
+        groups = {
+            uid: name if names[name] == 1 else f"{name} ({uid})"
+            for uid, name in adapters.items()
+        }
+        self._members = [
+            (
+                groups[member.device_adapter.uid]
+                if hasattr(member, "device_adapter")
+                else SCOPE_COMBINED,
+                member.entity_description.key,
+                member,
+            )
+            for member in members
+        ]
+
+    def _collect(self, table) -> dict[str, dict[str, float | None]]:
+        """Return the members' current values, grouped by device."""
+        results: dict[str, dict[str, float | None]] = {}
+        for group, key, member in self._members:
+            results.setdefault(group, {})[key] = member.native_value
+        return results
+
+    @property
+    def extra_state_attributes(self) -> dict[str, dict[str, dict[str, float | None]]]:
+        """Return the result table."""
+        return {"results": self._table.value}
+
+
+class PowerInsightLatencySensor(PowerInsightSensor):
+    """Hub diagnostic reporting one figure of the instrumentation's latency window.
+
+    The entry's latency sensors share one timer (see ``async_track``) that
+    polls the window once per ``LATENCY_REFRESH_INTERVAL`` and writes them.
+    Those writes bypass the instrumentation, so the write rate only counts the
+    sensors that follow the engine.
+    """
+
+    entity_description: PowerInsightLatencySensorDescription
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+            self,
+            description: PowerInsightLatencySensorDescription,
+            config_entry: ConfigEntry,
+            source_entities: list[str],
+            power_insight: PowerInsight,
+    ) -> None:
+        """Initialize the latency sensor."""
+        super().__init__(description, config_entry, source_entities, power_insight)
+        self.latency = Latency()
+
+    @staticmethod
+    @callback
+    def async_track(
+        hass: HomeAssistant,
+        power_insight: PowerInsight,
+        sensors: list[PowerInsightLatencySensor],
+    ) -> Callable[[], None]:
+        """Poll the window now and on every interval; return the unsubscriber."""
+        stats = power_insight.instrumentation
+        stats.latency(dt_util.utcnow().timestamp())
+
+        @callback
+        def _async_poll(now: datetime) -> None:
+            latency = stats.latency(now.timestamp())
+            for sensor in sensors:
+                sensor.latency = latency
+                # Disabled sensors are never added.
+                if sensor.hass is not None:
+                    sensor.async_write_ha_state()
+
+        return async_track_time_interval(
+            hass, _async_poll, timedelta(seconds=LATENCY_REFRESH_INTERVAL)
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the sensor's figure of the last poll."""
+        return self.entity_description.figure_fn(self.latency)
 
 
 # ---------------------------------------------------------------------------
@@ -1966,17 +2494,39 @@ class BasePowerInsightIntegrationSensor(BaseEventIntegrationSensorEntity):
             power_insight: PowerInsight,
     ) -> None:
         """Initialize the base integration sensor entity."""
-        super().__init__(source_entities, power_insight)
+        max_sub_interval, min_sub_interval = _sub_interval_bounds(
+            config_entry.options
+        )
+        super().__init__(
+            source_entities,
+            power_insight,
+            max_sub_interval=max_sub_interval,
+            min_sub_interval=min_sub_interval,
+            checkpoints=config_entry.runtime_data.checkpoints,
+            integration_method=config_entry.options.get(
+                CONF_INTEGRATION_METHOD, DEFAULT_INTEGRATION_METHOD
+            ),
+        )
         self.entity_description = description
         self.config_entry = config_entry
 
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Substitute the HA-configured currency for the EUR placeholder."""
-        return _resolve_currency_unit(
-            self.entity_description.native_unit_of_measurement, self.hass
+        return self.config_entry.runtime_data.units.resolve(
+            self.entity_description.native_unit_of_measurement
         )
 
+    async def async_added_to_hass(self) -> None:
+        """Republish a money unit when the configured currency changes."""
+        await super().async_added_to_hass()
+        if "EUR" in (self.entity_description.native_unit_of_measurement or ""):
+            self.async_on_remove(
+                self.config_entry.runtime_data.units.async_add_listener(
+                    self.async_write_ha_state
+                )
+            )
+
 
 class PowerInsightIntegrationSensor(BasePowerInsightIntegrationSensor):
     """Hub-level integration sensor."""
@@ -1990,6 +2540,9 @@ class PowerInsightIntegrationSensor(BasePowerInsightIntegrationSensor):
     ) -> None:
         """Initialize the integration sensor entity."""
         super().__init__(description, config_entry, source_entities, power_insight)
+        self._cell = power_insight.results.cell(
+            description.integration_value_fn, output_fn=description.transform_fn
+        )
         self._attr_unique_id = (
             f"{self.config_entry.entry_id}_{self.entity_description.key}"
         )
@@ -2002,7 +2555,11 @@ class PowerInsightIntegrationSensor(BasePowerInsightIntegrationSensor):
     @property
     def integration_value(self) -> float | None:
         """Return the current rate value to integrate."""
-        value = self.entity_description.integration_value_fn(self.power_insight)
+        return self._cell.value
+
+    def compute_integration_value(self, power_insight: PowerInsight) -> float | None:
+        """Return the rate to integrate as read from *power_insight*."""
+        value = self.entity_description.integration_value_fn(power_insight)
         if value is not None:
             value = self.entity_description.transform_fn(value)
         return value
@@ -2022,6 +2579,20 @@ class PowerInsightAdapterIntegrationSensor(BasePowerInsightIntegrationSensor):
         """Initialize the adapter integration sensor entity."""
         super().__init__(description, config_entry, source_entities, power_insight)
         self.device_adapter = device_adapter
+        self._cell = power_insight.results.cell(
+            description.integration_value_fn,
+            device_adapter.uid,
+            output_fn=description.transform_fn,
+        )
+        self._display_factor = self._read_display_factor()
+        # Levelized totals of adapters with an LCOE feed the combined ledger.
+        self._ledger = config_entry.runtime_data.ledger
+        self._ledger_key = (
+            description.key
+            if description.key in LEVELIZED_TOTAL_KEYS
+            and device_adapter.uid in power_insight.levelized_correction_factors
+            else None
+        )
 
         uid = f"{self.config_entry.entry_id}_{self.device_adapter.uid}"
         self._attr_unique_id = f"{uid}_{self.entity_description.key}"
@@ -2039,20 +2610,53 @@ class PowerInsightAdapterIntegrationSensor(BasePowerInsightIntegrationSensor):
         total accumulates the base rate so that the factor can be applied to
         the displayed total retroactively.
         """
-        value = self.entity_description.integration_value_fn(self.power_insight)
+        return self._cell.value
+
+    def compute_integration_value(self, power_insight: PowerInsight) -> float | None:
+        """Return this adapter's base rate as read from *power_insight*."""
+        value = self.entity_description.integration_value_fn(power_insight)
         value = get_value(self.device_adapter.uid, value)
         if value is not None:
             value = self.entity_description.transform_fn(value)
         return value
 
+    def _read_display_factor(self) -> Decimal | None:
+        """Return the adapter's correction factor as a Decimal, if applied."""
+        if not self.entity_description.apply_correction_factor:
+            return None
+        return Decimal(str(self.device_adapter.correction_factor))
+
     @property
     def native_value(self) -> Decimal | None:
         """Return the accumulated base total, scaled for display if requested."""
         base = self._state
-        if base is not None and self.entity_description.apply_correction_factor:
-            return base * Decimal(str(self.device_adapter.correction_factor))
+        if base is not None and self._display_factor is not None:
+            return base * self._display_factor
         return base
 
+    def _total_changed(self) -> None:
+        """Also push the corrected total into the combined ledger."""
+        super()._total_changed()
+        self._publish_to_ledger()
+
+    def _publish_to_ledger(self) -> None:
+        if self._ledger_key is not None:
+            self._ledger.update(
+                self._ledger_key, self.device_adapter.uid, self.native_value
+            )
+
+    async def async_added_to_hass(self) -> None:
+        """Publish the restored total to the combined ledger."""
+        await super().async_added_to_hass()
+        self._publish_to_ledger()
+
+    @callback
+    def async_reanchor(self, timestamp: datetime) -> None:
+        """Also republish: a new correction factor rescales the displayed total."""
+        self._display_factor = self._read_display_factor()
+        super().async_reanchor(timestamp)
+        self._publish_to_ledger()
+
     @property
     def extra_restore_state_data(self) -> IntegrationSensorExtraStoredData:
         """Persist the BASE running total (not the corrected display)."""
@@ -2073,6 +2677,8 @@ class PowerInsightAdapterIntegrationSensor(BasePowerInsightIntegrationSensor):
         ordinary reload (the subentry still exists), and only snapshot the former.
         """
         await super().async_will_remove_from_hass()
+        if self._ledger_key is not None:
+            self._ledger.remove(self._ledger_key, self.device_adapter.uid)
 
         key = self.entity_description.key
         if (
@@ -0,0 +1,293 @@
+"""Subentry flow for Power Insight adapters."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.config_entries import (
+    ConfigSubentryFlow,
+    SubentryFlowResult,
+)
+from homeassistant.helpers import issue_registry as ir
+from homeassistant.const import CONF_NAME
+from homeassistant.util import slugify
+
+from .const import (
+    DOMAIN,
+    CONF_CHARGE_FROM_ADAPTERS,
+)
+from .flow_helpers import (
+    GRID_FIELDS,
+    PV_SYSTEM_FIELDS,
+    BATTERY_FIELDS,
+    CONSUMER_FIELDS,
+    ADAPTER_TYPE_FIELDS,
+    build_schema,
+    validate_fields,
+    calculate_fields,
+    split_by_storage,
+    check_existing_slugs,
+    has_grid_subentry,
+)
+
+
+# ============================================================================
+# SUBENTRY FLOW  (grid / PV system / battery / consumer)
+# ============================================================================
+
+class AdapterSubentryFlow(ConfigSubentryFlow):
+    """Subentry flow for adding and reconfiguring adapters."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._adapter_type: str | None = None
+        self._adapter_fields: dict | None = None
+
+    def _current_options(self) -> dict:
+        """Return the parent entry's current options."""
+        return self._get_entry().options or {}
+
+    # ------------------------------------------------------------------
+    # Menu
+    # ------------------------------------------------------------------
+
+    async def async_step_user(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        menu_options = ["pv_system", "battery", "consumer"]
+        if not has_grid_subentry(self._get_entry()):
+            menu_options = ["grid"] + menu_options
+
+        return self.async_show_menu(
+            step_id="user",
+            menu_options=menu_options,
+        )
+
+    # ------------------------------------------------------------------
+    # Per-type dispatch
+    # ------------------------------------------------------------------
+
+    async def async_step_grid(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Entry point for grid adapter; enforces a single grid per entry."""
+        if has_grid_subentry(self._get_entry()):
+            return self.async_abort(reason="grid_already_configured")
+        self._adapter_type = "grid"
+        self._adapter_fields = GRID_FIELDS
+        return await self.async_step_configure(user_input)
+
+    async def async_step_pv_system(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        self._adapter_type = "pv_system"
+        self._adapter_fields = PV_SYSTEM_FIELDS
+        return await self.async_step_configure(user_input)
+
+    async def async_step_battery(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        self._adapter_type = "battery"
+        self._adapter_fields = BATTERY_FIELDS
+        return await self.async_step_configure(user_input)
+
+    async def async_step_consumer(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        self._adapter_type = "consumer"
+        self._adapter_fields = CONSUMER_FIELDS
+        return await self.async_step_configure(user_input)
+
+    # ------------------------------------------------------------------
+    # Shared configure step
+    # ------------------------------------------------------------------
+
+    async def async_step_configure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Generic configure step shared by all adapter types."""
+        errors: dict[str, str] = {}
+        options = self._current_options()
+        parent_entry = self._get_entry()
+
+        if user_input is not None:
+            validation_errors = validate_fields(
+                self.hass, self._adapter_fields, user_input, options, "config"
+            )
+            errors.update(validation_errors)
+
+            if not errors:
+                # Determine key and title
+                if self._adapter_type == "grid":
+                    key = "grid"
+                    title = "Grid"
+                else:
+                    name = user_input.get(CONF_NAME, "").strip()
+                    title = name or self._adapter_type.replace("_", " ").title()
+                    key = slugify(name) if name else slugify(self._adapter_type)
+                    existing = check_existing_slugs(parent_entry)
+                    if not key or key == "unknown":
+                        errors["base"] = "invalid_name"
+                    elif key in existing:
+                        errors["base"] = "name_not_unique"
+
+            if not errors:
+                complete = calculate_fields(
+                    self._adapter_fields, user_input, "config", options
+                )
+                adapter_config, top_level_data = split_by_storage(
+                    self._adapter_fields, complete
+                )
+
+                entry_data = {
+                    "adapter": {
+                        "adapter_type": self._adapter_type,
+                        "key": key,
+                        "config": adapter_config,
+                    },
+                    **top_level_data,
+                }
+
+                result = self.async_create_entry(title=title, data=entry_data)
+
+                # When a charge source (grid or pv_system) is added, prompt
+                # every existing battery adapter to be reconfigured so the user
+                # can update their charge_from_adapters settings.
+                if self._adapter_type in ("grid", "pv_system"):
+                    for sub in parent_entry.subentries.values():
+                        if sub.data.get("adapter", {}).get("adapter_type") == "battery":
+                            ir.async_create_issue(
+                                self.hass,
+                                DOMAIN,
+                                f"reconfigure_battery_{sub.subentry_id}",
+                                is_fixable=False,
+                                severity=ir.IssueSeverity.WARNING,
+                                translation_key="reconfigure_battery_adapters",
+                                translation_placeholders={"battery_name": sub.title},
+                            )
+                    # No explicit reload here: adding the subentry fires the
+                    # config-entry update listener, which performs the reload.
+                    # Reloading here as well would double-reload (deprecated
+                    # since HA 2026.6).
+
+                return result
+
+        schema = build_schema(
+            self._adapter_fields, "config", user_input, options, entry=parent_entry,
+            currency=self.hass.config.currency or "EUR",
+        )
+
+        return self.async_show_form(
+            step_id="configure",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={
+                "adapter_type": self._adapter_type.replace("_", " ").title(),
+            },
+        )
+
+    # ------------------------------------------------------------------
+    # Reconfigure step
+    # ------------------------------------------------------------------
+
+    async def async_step_reconfigure(
+        self, user_input: dict[str, Any] | None = None
+    ) -> SubentryFlowResult:
+        """Reconfigure entity IDs (and other reconfigure-flagged fields)."""
+        errors: dict[str, str] = {}
+        options = self._current_options()
+        parent_entry = self._get_entry()
+
+        subentry = self._get_reconfigure_subentry()
+        adapter = subentry.data.get("adapter", {})
+        self._adapter_type = adapter.get("adapter_type")
+        self._adapter_fields = ADAPTER_TYPE_FIELDS[self._adapter_type]
+
+        if user_input is not None:
+            validation_errors = validate_fields(
+                self.hass, self._adapter_fields, user_input, options, "reconfigure"
+            )
+            errors.update(validation_errors)
+
+            if not errors:
+                # Evaluate calculated fields (current_lcoe/lcos, correction
+                # factor) from the edited lifetime values, reading the immutable
+                # base (default_lcoe/lcos) from the existing config.
+                complete = calculate_fields(
+                    self._adapter_fields,
+                    user_input,
+                    "reconfigure",
+                    options,
+                    existing_data=adapter.get("config", {}),
+                )
+                new_adapter_config, new_top_level = split_by_storage(
+                    self._adapter_fields, complete
+                )
+
+                adapter_config = adapter.get("config", {}).copy()
+                adapter_config.update(new_adapter_config)
+
+                updated = subentry.data.copy()
+                updated.update(new_top_level)
+                updated["adapter"] = {
+                    "adapter_type": self._adapter_type,
+                    "key": adapter.get("key"),
+                    "config": adapter_config,
+                }
+                # Dismiss the per-battery reconfigure issue (raised when a
+                # charge-source adapter was added or removed) now that the
+                # user has reconfigured this battery.
+                ir.async_delete_issue(
+                    self.hass, DOMAIN, f"reconfigure_battery_{subentry.subentry_id}"
+                )
+                # Update without reloading here: the subentry change fires the
+                # config-entry update listener, which performs the single
+                # reload. Combining a reloading flow method with the update
+                # listener is deprecated since HA 2026.6.
+                return self.async_update_and_abort(
+                    self._get_entry(), subentry, data=updated
+                )
+
+        # Seed with existing adapter config values.
+        seed = {
+            k: v
+            for k, v in adapter.get("config", {}).items()
+            if k in self._adapter_fields
+        }
+        # store_in_data fields (e.g. lifetime values) live at the subentry top
+        # level, not in adapter.config — seed them so reconfigure pre-fills them.
+        for k, v in subentry.data.items():
+            if k != "adapter" and k in self._adapter_fields:
+                seed.setdefault(k, v)
+
+        # For charge_from_adapters, strip stale subentry IDs before seeding so
+        # the selector is pre-populated with only currently valid selections.
+        # Valid sources are grid and pv_system adapters.
+        if CONF_CHARGE_FROM_ADAPTERS in seed:
+            valid_source_ids = {
+                sub.subentry_id
+                for sub in parent_entry.subentries.values()
+                if sub.data.get("adapter", {}).get("adapter_type") in ("grid", "pv_system")
+            }
+            seed[CONF_CHARGE_FROM_ADAPTERS] = [
+                i for i in seed[CONF_CHARGE_FROM_ADAPTERS] if i in valid_source_ids
+            ]
+
+        schema = build_schema(
+            self._adapter_fields,
+            "reconfigure",
+            seed,
+            options,
+            entry=parent_entry,
+            exclude_subentry_id=subentry.subentry_id,
+            currency=self.hass.config.currency or "EUR",
+        )
+
+        return self.async_show_form(
+            step_id="reconfigure",
+            data_schema=schema,
+            errors=errors,
+            description_placeholders={
+                "adapter_type": self._adapter_type.replace("_", " ").title(),
+            },
+        )
@@ -0,0 +1,74 @@
+"""Per-entry cache of the currency-substituted sensor units.
+
+Sensor descriptions spell money units with an ``EUR`` placeholder
+(``EUR/h``, ``EUR/kWh``, ``EUR``) that is replaced by ``hass.config.currency``.
+``native_unit_of_measurement`` is read on every state write, so rather than
+redo the substitution each time the resolved units are cached per entry and the
+cache is only dropped when the core config's currency actually changes. The
+sensors with a money unit then rewrite their state to publish the new unit.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from homeassistant.const import EVENT_CORE_CONFIG_UPDATE
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+
+_MISSING = object()
+
+
+def resolve_currency_unit(unit: str | None, hass: HomeAssistant | None) -> str | None:
+    """Replace the ``EUR`` placeholder in a unit with the configured currency.
+
+    Falls back to the literal (``EUR``) when no currency is configured, so
+    existing setups keep their units unchanged.
+    """
+    if unit and "EUR" in unit and hass is not None:
+        currency = hass.config.currency
+        if currency:
+            return unit.replace("EUR", currency)
+    return unit
+
+
+class UnitResolver:
+    """Resolved description units of one config entry, keyed by placeholder."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialise an empty cache for the current currency."""
+        self.hass = hass
+        self._currency = hass.config.currency
+        self._units: dict[str | None, str | None] = {}
+        self._listeners: list[Callable[[], None]] = []
+
+    def resolve(self, unit: str | None) -> str | None:
+        """Return *unit* with the configured currency substituted."""
+        resolved = self._units.get(unit, _MISSING)
+        if resolved is _MISSING:
+            resolved = self._units[unit] = resolve_currency_unit(unit, self.hass)
+        return resolved
+
+    def async_add_listener(self, listener: Callable[[], None]) -> CALLBACK_TYPE:
+        """Call *listener* after the currency changed."""
+        self._listeners.append(listener)
+
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Refresh on core config updates; return the unsubscribe callback."""
+        return self.hass.bus.async_listen(
+            EVENT_CORE_CONFIG_UPDATE, self._async_core_config_updated
+        )
+
+    @callback
+    def _async_core_config_updated(self, event: Event) -> None:
+        """Drop the cache if the currency changed (other fields are ignored)."""
+        if self.hass.config.currency != self._currency:
+            self._currency = self.hass.config.currency
+            self._units.clear()
+            for listener in list(self._listeners):
+                listener()
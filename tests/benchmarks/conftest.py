@@ -0,0 +1,95 @@
+"""pytest wiring for the benchmark tier.
+
+Measurements — timings in ns, memory in bytes — are recorded per case into a
+session-wide table. With ``--benchmark-save`` the table replaces
+``baseline.json`` at the end of the run; otherwise each case is compared against
+its stored baseline. Measurements that are reported rather than gated go to
+``REPORT``.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+BASELINE_PATH = Path(__file__).with_name("baseline.json")
+
+# Human-readable results, printed in the terminal summary.
+REPORT: list[str] = []
+
+
+class Baseline:
+    """Stored measurements per case, and the measurements taken in this run."""
+
+    def __init__(self, config: Any) -> None:
+        self.max_ratio: float = config.getoption("--benchmark-max-ratio")
+        self.max_exponent: float = config.getoption("--benchmark-max-exponent")
+        self.save: bool = config.getoption("--benchmark-save")
+        self.stored: dict[str, int] = {}
+        if BASELINE_PATH.exists():
+            self.stored = json.loads(BASELINE_PATH.read_text())["measurements"]
+        self.measured: dict[str, int] = {}
+
+    def check(
+        self, case: str, value: int, *, floor: int = 50_000, unit: str = "ns"
+    ) -> str | None:
+        """Record *case*; return a failure message if it regressed.
+
+        Measurements up to *floor* always pass. The default suits timings,
+        where sub-50 µs results are dominated by timer and interpreter noise;
+        pass ``unit="bytes"`` (and a matching floor) for memory.
+        """
+        self.measured[case] = value
+        reference = self.stored.get(case)
+        if self.save or reference is None:
+            return None
+        limit = max(reference * self.max_ratio, floor)
+        if value > limit:
+            return (
+                f"{case}: {_format(value, unit)} exceeds "
+                f"{self.max_ratio}x its baseline of {_format(reference, unit)}"
+            )
+        return None
+
+    def write(self) -> None:
+        """Replace the baseline file with this run's measurements."""
+        BASELINE_PATH.write_text(
+            json.dumps(
+                {
+                    "python": sys.version.split()[0],
+                    "machine": platform.machine(),
+                    "measurements": dict(
+                        sorted({**self.stored, **self.measured}.items())
+                    ),
+                },
+                indent=2,
+            )
+            + "\n"
+        )
+
+
+def _format(value: int, unit: str) -> str:
+    if unit == "ns":
+        return f"{value / 1e6:.3f} ms"
+    return f"{value:,} {unit}"
+
+
+@pytest.fixture(scope="session")
+def baseline(request: Any):
+    """The session's :class:`Baseline`; written back with ``--benchmark-save``."""
+    table = Baseline(request.config)
+    yield table
+    if table.save and table.measured:
+        table.write()
+
+
+def pytest_terminal_summary(terminalreporter: Any) -> None:
+    if REPORT:
+        terminalreporter.section("benchmark report")
+        for line in REPORT:
+            terminalreporter.write_line(line)
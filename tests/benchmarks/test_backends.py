@@ -0,0 +1,33 @@
+"""Throughput of the registered engine backends, side by side.
+
+Runs the differential harness of ``tests/engine/engine_property_framework.py``
+over every engine scenario in many random states and reports each backend's
+time and throughput relative to the reference ``PowerInsight``. Correctness is
+gated by the engine tier (``tests/engine/test_engine_backends.py``); the ratios
+here are reported, not gated.
+"""
+
+from __future__ import annotations
+
+from tests.engine import test_engine_property_scenarios
+from tests.engine.engine_property_framework import (
+    compare_backends,
+    differential_cases,
+    scenario_classes,
+)
+
+from .conftest import REPORT
+
+STATES = 200
+
+
+def test_backend_throughput() -> None:
+    cases = differential_cases(
+        scenario_classes(test_engine_property_scenarios), states=STATES, seed=1
+    )
+    report = compare_backends(cases)
+
+    REPORT.append(f"backends over {report.cases} cases:")
+    REPORT.extend(f"  {line}" for line in report.table().splitlines())
+    mismatched = {b: len(m) for b, m in report.mismatches.items() if m}
+    assert not mismatched, f"backends disagree with the reference: {mismatched}"
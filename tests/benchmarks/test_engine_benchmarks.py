@@ -0,0 +1,98 @@
+"""Engine microbenchmarks over scaled synthetic topologies.
+
+Two kinds of checks:
+
+* **Baseline** — every engine property on the large topology, and the full
+  sensor sweep (every property the sensor descriptions read, i.e. one tick) on
+  each size, must stay within ``--benchmark-max-ratio`` of ``baseline.json``.
+* **Scaling** — growing one adapter type tenfold must not grow any property's
+  cost faster than ``n ** --benchmark-max-exponent``. This is machine
+  independent and catches a reintroduced quadratic loop even without a
+  baseline for the host.
+
+Each timing is the best of several runs, which filters scheduler noise.
+"""
+
+from __future__ import annotations
+
+import math
+import time
+from collections.abc import Callable
+
+import pytest
+
+from .topologies import (
+    ENGINE_PROPERTIES,
+    LARGE,
+    MEDIUM,
+    SCALING,
+    SENSOR_PROPERTIES,
+    SMALL,
+    Size,
+    build_engine,
+)
+
+REPEATS = 5
+# Below this the measurement is constant overhead, not the property's cost.
+_SCALING_FLOOR_NS = 100_000
+
+_engines: dict[Size, object] = {}
+
+
+def _engine(size: Size):
+    """Return the (shared, read-only) engine of *size*."""
+    if size not in _engines:
+        _engines[size] = build_engine(size)
+    return _engines[size]
+
+
+def _best_ns(fn: Callable[[], object], repeats: int = REPEATS) -> int:
+    best = math.inf
+    for _ in range(repeats):
+        start = time.perf_counter_ns()
+        fn()
+        best = min(best, time.perf_counter_ns() - start)
+    return best
+
+
+def _sweep(engine) -> None:
+    for name in SENSOR_PROPERTIES:
+        getattr(engine, name)
+
+
+@pytest.mark.parametrize("name", ENGINE_PROPERTIES)
+def test_property(baseline, name: str) -> None:
+    engine = _engine(LARGE)
+    elapsed = _best_ns(lambda: getattr(engine, name))
+    if (failure := baseline.check(f"{LARGE.id}/{name}", elapsed)) is not None:
+        pytest.fail(failure)
+
+
+@pytest.mark.parametrize("size", [SMALL, MEDIUM, LARGE], ids=lambda size: size.id)
+def test_sensor_sweep(baseline, size: Size) -> None:
+    engine = _engine(size)
+    elapsed = _best_ns(lambda: _sweep(engine))
+    if (failure := baseline.check(f"{size.id}/sensor_sweep", elapsed)) is not None:
+        pytest.fail(failure)
+
+
+@pytest.mark.parametrize("family", SCALING)
+def test_scaling(baseline, family: str) -> None:
+    base_size, grown_size, dimension = SCALING[family]
+    base, grown = _engine(base_size), _engine(grown_size)
+    factor = getattr(grown_size, dimension) / getattr(base_size, dimension)
+
+    offenders = []
+    for name in ENGINE_PROPERTIES:
+        grown_ns = _best_ns(lambda: getattr(grown, name))
+        if grown_ns < _SCALING_FLOOR_NS:
+            continue
+        base_ns = _best_ns(lambda: getattr(base, name))
+        exponent = math.log(grown_ns / base_ns) / math.log(factor)
+        if exponent > baseline.max_exponent:
+            offenders.append(f"{name} ~ n**{exponent:.2f}")
+
+    assert not offenders, (
+        f"growing {dimension} {factor:g}x scaled superlinearly: "
+        + ", ".join(offenders)
+    )
@@ -0,0 +1,128 @@
+"""Memory of sensor entities and accumulators, measured with ``tracemalloc``.
+
+Sets up entries on the in-process Home Assistant core with a growing number of
+PV systems, under three ``pv_system`` scopes: no options (the ungated sensors
+only), the measurement options and the accumulator options. Everything the
+setup leaves allocated counts — engine adapter, device and entity registry
+entries, states, trackers and the entities themselves — so the results are the
+real cost of a sensor in Home Assistant, not just of the entity object:
+
+* **bytes per PV device** — growth per added PV system with no options,
+* **bytes per measurement sensor** / **per accumulator** — the extra growth of
+  the other scopes, divided by the extra sensors they create per PV system.
+
+Needs ``pytest-homeassistant-custom-component``; dropped from collection
+otherwise (see ``tests/conftest.py``).
+"""
+
+from __future__ import annotations
+
+import copy
+import gc
+import tracemalloc
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from tests.integration.conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+from .conftest import REPORT
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+# PV systems of the two entries compared per scope.
+FEW, MANY = 5, 25
+_FLOOR_BYTES = 1024
+
+_PV_OPTIONS = FULL_OPTIONS["scopes"]["pv_system"]
+SCOPES = {
+    "bare": [],
+    "measurement": [o for o in _PV_OPTIONS if not o.startswith("accumulate_")],
+    "accumulator": [o for o in _PV_OPTIONS if o.startswith("accumulate_")],
+}
+
+
+def _entry(index: int, pv: int, pv_options: list[str]) -> MockConfigEntry:
+    options = copy.deepcopy(FULL_OPTIONS)
+    options["scopes"]["pv_system"] = pv_options
+    subentries = [make_grid_subentry_data()]
+    for i in range(pv):
+        # Subentry ids double as device identifiers: unique across entries.
+        data = make_pv_subentry_data(f"01PV{index:04d}{i:018d}", f"sensor.pv{i}_power")
+        data["title"] = f"PV {i}"
+        subentries.append(data)
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title=f"Memory {index}",
+        options=options,
+        subentries_data=subentries,
+    )
+
+
+async def _setup(hass: HomeAssistant, entry: MockConfigEntry) -> tuple[int, int]:
+    """Set up *entry*; return the bytes it left allocated and its entity count."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await setup_integration(hass, entry)
+        for _ in range(4):
+            await hass.async_block_till_done()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    entities = er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+    return size, len(entities)
+
+
+async def test_entity_memory(hass: HomeAssistant, baseline) -> None:
+    hass.states.async_set("sensor.grid_power", "-1000", {"unit_of_measurement": "W"})
+    for i in range(MANY):
+        hass.states.async_set(f"sensor.pv{i}_power", "2000", {"unit_of_measurement": "W"})
+    # The first setup loads the platforms and fills lazy caches.
+    await _setup(hass, _entry(0, 1, _PV_OPTIONS))
+
+    # Per added PV system: (bytes, sensors).
+    growth: dict[str, tuple[float, float]] = {}
+    for index, (scope, pv_options) in enumerate(SCOPES.items(), start=1):
+        few_bytes, few_sensors = await _setup(hass, _entry(2 * index, FEW, pv_options))
+        many_bytes, many_sensors = await _setup(
+            hass, _entry(2 * index + 1, MANY, pv_options)
+        )
+        growth[scope] = (
+            (many_bytes - few_bytes) / (MANY - FEW),
+            (many_sensors - few_sensors) / (MANY - FEW),
+        )
+
+    bare_bytes, bare_sensors = growth["bare"]
+    results = {"pv_device_bytes": bare_bytes}
+    for scope in ("measurement", "accumulator"):
+        scope_bytes, scope_sensors = growth[scope]
+        assert scope_sensors > bare_sensors, f"{scope} options add no PV sensors"
+        results[f"{scope}_sensor_bytes"] = (scope_bytes - bare_bytes) / (
+            scope_sensors - bare_sensors
+        )
+
+    REPORT.append(
+        "memory: "
+        + ", ".join(f"{int(size):,} {case}" for case, size in results.items())
+        + f" ({bare_sensors:g} ungated sensors per PV device)"
+    )
+    failures = [
+        failure
+        for case, size in results.items()
+        if (
+            failure := baseline.check(
+                f"entities/{case}", int(size), floor=_FLOOR_BYTES, unit="bytes"
+            )
+        )
+    ]
+    assert not failures, "; ".join(failures)
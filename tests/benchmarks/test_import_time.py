@@ -0,0 +1,123 @@
+"""Import cost of the integration at Home Assistant startup.
+
+Each run is a fresh interpreter that first imports what the core has loaded
+before any integration (``homeassistant.bootstrap`` and the sensor platform),
+then times the integration's own modules in the order a start loads them:
+
+* **runtime** — the package and its sensor platform,
+* **boot** — plus ``config_flow`` and ``diagnostics``, which Home Assistant
+  preloads for every integration whether or not a flow is ever opened.
+
+The best of several runs is gated on the baseline. Independently of timing,
+the runtime path must not load ``config_flow`` or the flow modules it imports
+(Home Assistant preloads those in the executor, so they belong to boot), and
+the boot path must not load the recorder backfill or the profiler's
+``cProfile``/``pstats``: those are imported on first use.
+
+Needs Home Assistant; dropped from collection without the test harness (see
+``tests/conftest.py``).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from .conftest import REPORT
+
+RUNS = 5
+PACKAGE = "custom_components.power_insight"
+
+CORE_MODULES = (
+    "homeassistant.bootstrap",
+    "homeassistant.components.sensor",
+    "homeassistant.helpers.entity_platform",
+)
+RUNTIME_MODULES = (PACKAGE, f"{PACKAGE}.sensor")
+PRELOADED_MODULES = (f"{PACKAGE}.config_flow", f"{PACKAGE}.diagnostics")
+FLOW_MODULES = (
+    f"{PACKAGE}.config_flow",
+    f"{PACKAGE}.flow_helpers",
+    f"{PACKAGE}.subentry_flow",
+    f"{PACKAGE}.options_flow",
+)
+LAZY_MODULES = (
+    f"{PACKAGE}.backfill",
+    "cProfile",
+    "pstats",
+)
+
+_SCRIPT = """
+import importlib, json, sys, time
+for name in {core!r}:
+    importlib.import_module(name)
+core = set(sys.modules)
+start = time.perf_counter_ns()
+for name in {runtime!r}:
+    importlib.import_module(name)
+runtime = time.perf_counter_ns()
+runtime_modules = sorted(set(sys.modules) - core)
+for name in {preloaded!r}:
+    importlib.import_module(name)
+boot = time.perf_counter_ns()
+print(json.dumps({{
+    "runtime_ns": runtime - start,
+    "boot_ns": boot - start,
+    "runtime_modules": runtime_modules,
+    "boot_modules": sorted(set(sys.modules) - core),
+}}))
+"""
+
+
+def _measure() -> dict:
+    root = Path(__file__).parents[2]
+    script = _SCRIPT.format(
+        core=CORE_MODULES, runtime=RUNTIME_MODULES, preloaded=PRELOADED_MODULES
+    )
+    # Bytecode must be cached, as on a running host.
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONDONTWRITEBYTECODE"}
+    output = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=root,
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_time(baseline) -> None:
+    # The first run may compile bytecode; the best run is the warm start.
+    runs = [_measure() for _ in range(RUNS)]
+    runtime_ns = min(run["runtime_ns"] for run in runs)
+    boot_ns = min(run["boot_ns"] for run in runs)
+    loaded = runs[-1]
+
+    flows = sorted(set(FLOW_MODULES) & set(loaded["runtime_modules"]))
+    assert not flows, f"imported by the runtime: {', '.join(flows)}"
+    eager = sorted(set(LAZY_MODULES) & set(loaded["boot_modules"]))
+    assert not eager, f"imported at startup: {', '.join(eager)}"
+
+    external = [
+        name
+        for name in loaded["boot_modules"]
+        if not name.startswith(PACKAGE) and "." not in name
+    ]
+    REPORT.append(
+        f"import: runtime {runtime_ns / 1e6:.2f} ms, boot {boot_ns / 1e6:.2f} ms "
+        f"({len(loaded['boot_modules'])} modules; beyond the core: "
+        f"{', '.join(external) or 'none'})"
+    )
+    failures = [
+        failure
+        for case, elapsed in (("runtime", runtime_ns), ("boot", boot_ns))
+        if (failure := baseline.check(f"import/{case}", elapsed))
+    ]
+    if failures:
+        pytest.fail("; ".join(failures))
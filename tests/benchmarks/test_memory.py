@@ -0,0 +1,84 @@
+"""Engine memory over scaled synthetic topologies, measured with ``tracemalloc``.
+
+* **Bytes per adapter** — growing one adapter type tenfold (the ``SCALING``
+  families of the timing benchmarks); the growth of the engine divided by the
+  added adapters is that type's cost.
+* **Result memo** — what one tick's ``ResultTable`` holds after the full sensor
+  sweep, per size.
+
+Both are reported, and gated against ``baseline.json`` like the timings.
+Sensor entities and accumulators are measured in ``test_entity_memory.py``.
+"""
+
+from __future__ import annotations
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+
+from .conftest import REPORT
+from .topologies import (
+    LARGE,
+    MEDIUM,
+    SCALING,
+    SENSOR_PROPERTIES,
+    SMALL,
+    Size,
+    build_engine,
+)
+
+# Allocator rounding and interned strings move small results by a few hundred
+# bytes between runs.
+_FLOOR_BYTES = 1024
+
+
+def _allocated(fn: Callable[[], object]) -> tuple[int, object]:
+    """Return the bytes still allocated after ``fn()``, and its result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        gc.collect()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size, result
+
+
+def _check(baseline, case: str, size: int) -> None:
+    failure = baseline.check(case, size, floor=_FLOOR_BYTES, unit="bytes")
+    if failure is not None:
+        pytest.fail(failure)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _warm_up() -> None:
+    # First builds fill lazy caches (imports, interned names), not the engine.
+    build_engine(SMALL).results.gross_power
+
+
+@pytest.mark.parametrize("family", SCALING)
+def test_bytes_per_adapter(baseline, family: str) -> None:
+    base_size, grown_size, dimension = SCALING[family]
+    base_bytes, _ = _allocated(lambda: build_engine(base_size))
+    grown_bytes, _ = _allocated(lambda: build_engine(grown_size))
+    added = getattr(grown_size, dimension) - getattr(base_size, dimension)
+
+    per_adapter = round((grown_bytes - base_bytes) / added)
+    REPORT.append(f"memory: {per_adapter:,} bytes per {family} adapter")
+    _check(baseline, f"memory/{family}_adapter_bytes", per_adapter)
+
+
+@pytest.mark.parametrize("size", [SMALL, MEDIUM, LARGE], ids=lambda size: size.id)
+def test_result_memo(baseline, size: Size) -> None:
+    results = build_engine(size).results
+
+    def sweep() -> None:
+        for name in SENSOR_PROPERTIES:
+            getattr(results, name)
+
+    memo_bytes, _ = _allocated(sweep)
+    REPORT.append(f"memory: {size.id} result memo holds {memo_bytes:,} bytes per tick")
+    _check(baseline, f"{size.id}/result_memo_bytes", memo_bytes)
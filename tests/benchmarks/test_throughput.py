@@ -0,0 +1,179 @@
+"""End-to-end throughput of the event pipeline, source update to sensor write.
+
+Runs the real chain — ``EventHandler``, the scoped trackers in ``event.py`` and
+the coalescing sensor entities — on the in-process Home Assistant core (event
+bus and state machine only: no recorder, no frontend, no network). Reports per
+topology:
+
+* **latency** — time from a source ``async_set`` to the last sensor write it
+  caused (p50 / p99; updates that change no result write nothing and are left
+  out),
+* **events/s** — sustained rate with one source update per loop iteration, and
+  with a burst of updates to different sources in one iteration,
+* **writes/event** — sensor state writes per source update.
+
+Needs ``pytest-homeassistant-custom-component``; dropped from collection
+otherwise (see ``tests/conftest.py``).
+"""
+
+from __future__ import annotations
+
+import statistics
+import time
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from tests.integration.conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    GRID_SUB_ID,
+    make_battery_subentry_data,
+    make_consumer_subentry_data,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+from .conftest import REPORT
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+EVENTS = 300
+BURST = 20
+
+# (PV systems, batteries, consumers); the grid makes the device count round.
+TOPOLOGIES = {
+    "20-devices": (2, 1, 16),
+    "200-devices": (10, 5, 184),
+}
+
+
+def _entry(pv: int, batteries: int, consumers: int) -> MockConfigEntry:
+    subentries = [make_grid_subentry_data()]
+    for i in range(pv):
+        data = make_pv_subentry_data(f"01PV{i:022d}", f"sensor.pv{i}_power")
+        data["title"] = f"PV {i}"
+        subentries.append(data)
+    for i in range(batteries):
+        data = make_battery_subentry_data(
+            f"01BAT{i:021d}",
+            f"sensor.battery{i}_power",
+            [GRID_SUB_ID, f"01PV{i % pv:022d}"],
+        )
+        data["title"] = f"Battery {i}"
+        subentries.append(data)
+    for i in range(consumers):
+        data = make_consumer_subentry_data(
+            f"01CONS{i:020d}", f"sensor.consumer{i}_power"
+        )
+        data["title"] = f"Consumer {i}"
+        subentries.append(data)
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="Throughput",
+        options=FULL_OPTIONS,
+        subentries_data=subentries,
+    )
+
+
+async def _drain(hass: HomeAssistant) -> None:
+    # engine -> custom event -> coalesced sensor write: flush a few times.
+    for _ in range(4):
+        await hass.async_block_till_done()
+
+
+def _record_writes(
+    hass: HomeAssistant, entry: MockConfigEntry
+) -> tuple[list[float], int]:
+    """Timestamp every sensor state write; return the log and the entity count."""
+    writes: list[float] = []
+    entities = [
+        entity
+        for platform in async_get_platforms(hass, DOMAIN)
+        if platform.config_entry is not None
+        and platform.config_entry.entry_id == entry.entry_id
+        for entity in platform.entities.values()
+    ]
+    for entity in entities:
+        write = entity.async_write_ha_state
+
+        def _timed(write=write) -> None:
+            writes.append(time.perf_counter())
+            write()
+
+        entity.async_write_ha_state = _timed
+    return writes, len(entities)
+
+
+@pytest.mark.parametrize("topology", TOPOLOGIES)
+async def test_event_to_state_throughput(
+    hass: HomeAssistant, baseline, topology: str
+) -> None:
+    pv, batteries, consumers = TOPOLOGIES[topology]
+    sources = (
+        ["sensor.grid_power"]
+        + [f"sensor.pv{i}_power" for i in range(pv)]
+        + [f"sensor.battery{i}_power" for i in range(batteries)]
+        + [f"sensor.consumer{i}_power" for i in range(consumers)]
+    )
+    for source in sources:
+        hass.states.async_set(source, "100", {"unit_of_measurement": "W"})
+    entry = _entry(pv, batteries, consumers)
+    await setup_integration(hass, entry)
+    writes, entity_count = _record_writes(hass, entry)
+
+    # One source update per loop iteration.
+    latencies: list[float] = []
+    total_writes = 0
+    for i in range(EVENTS):
+        writes.clear()
+        start = time.perf_counter()
+        hass.states.async_set(
+            sources[i % len(sources)], str(101 + i), {"unit_of_measurement": "W"}
+        )
+        await _drain(hass)
+        # Updates that leave every result unchanged fire no engine event.
+        if writes:
+            latencies.append(writes[-1] - start)
+            total_writes += len(writes)
+
+    # Many sources updated in the same iteration (coalesced writes).
+    writes.clear()
+    start = time.perf_counter()
+    for i in range(BURST):
+        hass.states.async_set(
+            sources[i % len(sources)], str(1000 + i), {"unit_of_measurement": "W"}
+        )
+    await _drain(hass)
+    burst_rate = BURST / (writes[-1] - start)
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    p50, p99 = quantiles[49], quantiles[98]
+    writes_per_event = total_writes / EVENTS
+    REPORT.append(
+        f"{topology} ({entity_count} sensors): "
+        f"{len(latencies) / sum(latencies):,.0f} events/s sequential, "
+        f"{burst_rate:,.0f} events/s burst, "
+        f"p50 {p50 * 1e3:.2f} ms, p99 {p99 * 1e3:.2f} ms, "
+        f"{writes_per_event:.1f} writes/event "
+        f"({len(latencies)}/{EVENTS} updates changed a result)"
+    )
+
+    # Coalescing: a sensor writes at most once per source update.
+    assert writes_per_event <= entity_count
+    failures = [
+        failure
+        for case, seconds in (
+            ("p50_latency", p50),
+            ("mean_latency", statistics.fmean(latencies)),
+        )
+        if (
+            failure := baseline.check(
+                f"throughput-{topology}/{case}", int(seconds * 1e9)
+            )
+        )
+    ]
+    assert not failures, "; ".join(failures)
@@ -0,0 +1,126 @@
+"""Synthetic topologies for the benchmark tier.
+
+Builds :class:`~tools.mock_power_insight.MockPowerInsight` engines of any size
+with deterministic inputs, so timings are comparable between runs. Battery
+``charge_from`` routing cycles through grid-only, grid + one PV system and
+PV-only, which exercises every charging-source branch of the engine.
+"""
+
+from __future__ import annotations
+
+import ast
+import os
+from dataclasses import dataclass
+
+from tools.mock_power_insight import (
+    _HELPER_PROPS,
+    Battery,
+    Consumer,
+    Grid,
+    MockPowerInsight,
+    Pv,
+    _engine_properties,
+)
+
+_SENSOR_PATH = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    os.pardir,
+    "custom_components",
+    "power_insight",
+    "sensor.py",
+)
+
+
+@dataclass(frozen=True)
+class Size:
+    """Adapter counts of one synthetic topology (plus the single grid)."""
+
+    pv: int
+    batteries: int
+    consumers: int
+
+    @property
+    def id(self) -> str:
+        return f"pv{self.pv}-bat{self.batteries}-cons{self.consumers}"
+
+
+SMALL = Size(pv=1, batteries=0, consumers=1)
+MEDIUM = Size(pv=50, batteries=10, consumers=200)
+LARGE = Size(pv=500, batteries=100, consumers=2000)
+
+# Grow one adapter type tenfold: (base size, grown size, grown dimension).
+SCALING = {
+    "pv": (MEDIUM, Size(pv=500, batteries=10, consumers=200), "pv"),
+    "battery": (MEDIUM, Size(pv=50, batteries=100, consumers=200), "batteries"),
+    "consumer": (MEDIUM, Size(pv=50, batteries=10, consumers=2000), "consumers"),
+}
+
+
+def charge_from(index: int, pv: int) -> list[str]:
+    """Return the charging sources of battery *index*."""
+    sources = ["grid"] if index % 3 != 2 else []
+    if pv and index % 3 != 0:
+        sources.append(f"pv{index % pv}")
+    return sources
+
+
+def build_engine(size: Size) -> MockPowerInsight:
+    """Return an engine of *size* with every value slot mocked."""
+    engine = MockPowerInsight(
+        Grid(),
+        *(
+            Pv(f"pv{i}", exports_power=i % 2 == 0, export_compensation=0.08)
+            for i in range(size.pv)
+        ),
+        *(
+            Battery(f"bat{i}", charge_from=charge_from(i, size.pv))
+            for i in range(size.batteries)
+        ),
+        *(Consumer(f"cons{i}") for i in range(size.consumers)),
+    )
+    values: dict[str, float] = {"grid": 500.0, "grid_price": 0.30}
+    values.update({f"pv{i}": 1000.0 + i % 7 * 100 for i in range(size.pv)})
+    values.update(
+        {f"bat{i}": -200.0 if i % 2 else 300.0 for i in range(size.batteries)}
+    )
+    values.update({f"cons{i}": -50.0 - i % 5 * 10 for i in range(size.consumers)})
+    return engine.mock(**values)
+
+
+# Every public calculation property of the engine.
+ENGINE_PROPERTIES = tuple(
+    name
+    for name in _engine_properties()
+    if name not in _HELPER_PROPS and not name.startswith("source_entities")
+)
+
+
+def _sensor_properties() -> tuple[str, ...]:
+    """Return the engine properties read by the sensor descriptions.
+
+    Parsed from the ``value_fn`` / ``integration_value_fn`` lambdas in
+    ``sensor.py`` (which imports Home Assistant, so it is not imported here).
+    """
+    with open(_SENSOR_PATH, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    names: list[str] = []
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.keyword)
+            and node.arg in ("value_fn", "integration_value_fn")
+            and isinstance(node.value, ast.Lambda)
+        ):
+            arg = node.value.args.args[0].arg
+            for inner in ast.walk(node.value.body):
+                if (
+                    isinstance(inner, ast.Attribute)
+                    and isinstance(inner.value, ast.Name)
+                    and inner.value.id == arg
+                    and inner.attr not in names
+                ):
+                    names.append(inner.attr)
+    return tuple(names)
+
+
+SENSOR_PROPERTIES = _sensor_properties()
@@ -5,6 +5,8 @@ Tests are split into two tiers, one directory per dependency group:
 * ``engine/``      — pure Python, no Home Assistant, no network. Imports
                      ``power_insight.py`` directly via ``importlib``.
 * ``integration/`` — requires ``pytest-homeassistant-custom-component``.
+* ``benchmarks/``  — engine timings against a stored baseline. Opt-in with
+                     ``--benchmark`` (timings are too noisy to gate every run).
 
 The engine tier must stay runnable without the Home Assistant test harness
 installed. If that harness is absent we drop the integration tier from
@@ -13,9 +15,46 @@ engine environment still exercises the calculation engine.
 """
 from __future__ import annotations
 
+from pathlib import Path
+
 collect_ignore_glob: list[str] = []
 
 try:
     import pytest_homeassistant_custom_component  # noqa: F401
 except ImportError:
     collect_ignore_glob.append("integration/*")
+    collect_ignore_glob.append("benchmarks/test_throughput.py")
+    collect_ignore_glob.append("benchmarks/test_entity_memory.py")
+    collect_ignore_glob.append("benchmarks/test_import_time.py")
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup("benchmark", "engine benchmarks (tests/benchmarks)")
+    group.addoption(
+        "--benchmark",
+        action="store_true",
+        help="Run the benchmark tier.",
+    )
+    group.addoption(
+        "--benchmark-save",
+        action="store_true",
+        help="Write the measured timings to the baseline file.",
+    )
+    group.addoption(
+        "--benchmark-max-ratio",
+        type=float,
+        default=2.0,
+        help="Fail a timing slower than this multiple of its baseline.",
+    )
+    group.addoption(
+        "--benchmark-max-exponent",
+        type=float,
+        default=1.5,
+        help="Fail a property whose cost grows faster than n**exponent.",
+    )
+
+
+def pytest_ignore_collect(collection_path: Path, config) -> bool | None:
+    if collection_path.name == "benchmarks" and not config.getoption("--benchmark"):
+        return True
+    return None
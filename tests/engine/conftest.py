@@ -31,6 +31,16 @@ def _decl_case(request: Any) -> Any:
     return request.param
 
 
+@pytest.fixture
+def _fuzz_case(request: Any) -> Any:
+    return request.param
+
+
+@pytest.fixture
+def _fuzz(request: Any) -> Any:
+    return request.param
+
+
 @pytest.fixture
 def power_insight(_scenario_cell: Any) -> Any:
     """A freshly built engine for the current (topology, state) cell."""
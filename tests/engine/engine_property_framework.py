@@ -50,13 +50,28 @@ produce/discharge / ``-`` standby/charge; consumer ``-`` = load.
 :func:`build_engine` turns a ``DEVICES`` list into a ready-to-query engine,
 validating that there is exactly one grid, that indices don't collide, and that
 every ``charge_from`` target exists (raising ``ValueError`` otherwise).
+
+Differential testing
+--------------------
+
+Alternative evaluation strategies register with :func:`register_backend`.
+:func:`compare_backends` runs :func:`differential_cases` — each scenario's own
+state plus random ones — through the reference engine and every backend,
+compares all result properties within a tolerance and times each side; the
+:class:`DifferentialReport` lists the mismatches and throughput ratios.
 """
 
 from __future__ import annotations
 
 import importlib.util
+import math
 import os
+import random
+import time
+from collections.abc import Callable
 from dataclasses import dataclass, field
+from functools import partial
+from types import ModuleType
 from typing import Any
 
 import pytest
@@ -364,6 +379,25 @@ def build_engine(devices: list[_DeviceEntry]) -> Any:
     validates the device: exactly one grid, unique indices, and every
     ``charge_from`` target present. Raises ``ValueError`` on any violation.
     """
+    config, readings = device_config(devices)
+    return load_engine(config, readings)
+
+
+def load_engine(config: DeviceConfig, readings: dict[str, float | None]) -> Any:
+    """Return a fresh engine for ``config`` with ``entity_id -> value`` applied."""
+    pi = config.build_engine()
+    for entity_id, value in readings.items():
+        pi.set_value(entity_id, value)
+    return pi
+
+
+def device_config(
+    devices: list[_DeviceEntry],
+) -> tuple[DeviceConfig, dict[str, float | None]]:
+    """Split a ``DEVICES`` list into its configuration and its readings.
+
+    Validates like :func:`build_engine`; the readings map entity ids to values.
+    """
     grids: list[GridSpec] = []
     pvs: list[PvSpec] = []
     batteries: list[BatterySpec] = []
@@ -450,10 +484,7 @@ def build_engine(devices: list[_DeviceEntry]) -> Any:
         batteries=tuple(batteries),
         consumers=tuple(consumers),
     )
-    pi = config.build_engine()
-    for entity_id, value in readings.items():
-        pi.set_value(entity_id, value)
-    return pi
+    return config, readings
 
 
 class EngineScenario:
@@ -469,3 +500,255 @@ class EngineScenario:
     @pytest.fixture
     def power_insight(self) -> Any:
         return build_engine(self.DEVICES)
+
+
+# ---------------------------------------------------------------------------
+# Differential testing — alternative evaluation backends vs. the reference.
+# ---------------------------------------------------------------------------
+
+# Structural helpers — adapter objects and entity lists, not results.
+_STRUCTURAL_PROPERTIES = {
+    "entity_mapping",
+    "uid_mapping",
+    "prod_adapters",
+    "gross_power_adapters",
+    "source_entities",
+    "source_entities_power",
+    "source_entities_price",
+    "source_entities_co2",
+}
+
+#: Every public result property of the engine, in name order.
+ENGINE_PROPERTIES: tuple[str, ...] = tuple(
+    sorted(
+        name
+        for klass in PowerInsight.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, property)
+        and not name.startswith("_")
+        and name not in _STRUCTURAL_PROPERTIES
+    )
+)
+
+#: ``readings -> reader`` for one device configuration; see :func:`register_backend`.
+Loader = Callable[[dict[str, float | None]], Any]
+
+#: Backend name -> factory returning the loader of one device configuration.
+BACKENDS: dict[str, Callable[[DeviceConfig], Loader]] = {}
+
+
+def register_backend(
+    name: str,
+) -> Callable[[Callable[[DeviceConfig], Loader]], Callable[[DeviceConfig], Loader]]:
+    """Register an alternative evaluation backend under ``name``.
+
+    The decorated factory is called once per device configuration and returns
+    a loader; the loader is called once per state, in order, with the state's
+    ``entity_id -> value`` readings and returns an object whose attributes are
+    the engine properties for that state. A loader may keep state between
+    calls (e.g. a long-lived engine) — that is part of what is compared.
+    """
+
+    def deco(
+        factory: Callable[[DeviceConfig], Loader],
+    ) -> Callable[[DeviceConfig], Loader]:
+        if name == "reference" or name in BACKENDS:
+            raise ValueError(f"backend {name!r} is already registered")
+        BACKENDS[name] = factory
+        return factory
+
+    return deco
+
+
+def _reference(config: DeviceConfig) -> Loader:
+    """A fresh engine per state, every property computed on access."""
+    return partial(load_engine, config)
+
+
+@register_backend("result_table")
+def _result_table(config: DeviceConfig) -> Loader:
+    """A fresh engine per state, read through its per-generation memo."""
+    return lambda readings: load_engine(config, readings).results
+
+
+@register_backend("live_engine")
+def _live_engine(config: DeviceConfig) -> Loader:
+    """One engine fed state after state, read through its memo (the HA path)."""
+    pi = config.build_engine()
+
+    def load(readings: dict[str, float | None]) -> Any:
+        for entity_id, value in readings.items():
+            pi.set_value(entity_id, value)
+        return pi.results
+
+    return load
+
+
+def scenario_classes(module: ModuleType) -> list[type[EngineScenario]]:
+    """Return the :class:`EngineScenario` subclasses ``module`` defines, in order."""
+    return [
+        value
+        for value in vars(module).values()
+        if isinstance(value, type)
+        and issubclass(value, EngineScenario)
+        and value.__module__ == module.__name__
+    ]
+
+
+@dataclass(frozen=True)
+class DifferentialCase:
+    """One device configuration in one state."""
+
+    name: str
+    config: DeviceConfig
+    readings: dict[str, float | None]
+
+
+def differential_cases(
+    scenarios: list[type], *, states: int = 20, seed: int = 0
+) -> list[DifferentialCase]:
+    """Return every scenario's own state plus ``states`` random ones each.
+
+    Random states keep the scenario's device and redraw every reading: powers
+    anywhere in ±5 kW, zero or unavailable (``None``) now and then, and the
+    grid price. They need not be physically plausible — any input both
+    backends accept must give the same results.
+    """
+    rng = random.Random(seed)
+    cases: list[DifferentialCase] = []
+    for scenario in scenarios:
+        config, readings = device_config(scenario.DEVICES)
+        cases.append(DifferentialCase(scenario.__name__, config, readings))
+        for index in range(states):
+            cases.append(
+                DifferentialCase(
+                    f"{scenario.__name__}-random{index}",
+                    config,
+                    {
+                        entity_id: _random_reading(rng, entity_id)
+                        for entity_id in readings
+                    },
+                )
+            )
+    return cases
+
+
+def _random_reading(rng: random.Random, entity_id: str) -> float | None:
+    roll = rng.random()
+    if roll < 0.1:
+        return None
+    if roll < 0.2:
+        return 0.0
+    if entity_id == "sensor.grid_price":
+        return rng.uniform(0.0, 0.6)
+    return rng.uniform(-5000.0, 5000.0)
+
+
+def _outcome(reader: Any, name: str) -> Any:
+    try:
+        return getattr(reader, name)
+    except Exception as exc:  # noqa: BLE001 — raising is a result to compare too
+        return _Raised(type(exc).__name__)
+
+
+@dataclass(frozen=True)
+class _Raised:
+    exception: str
+
+
+def _differences(
+    path: str, expected: Any, actual: Any, rel: float, abs_: float
+) -> list[str]:
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        if expected.keys() != actual.keys():
+            return [f"{path}: keys {sorted(expected)} != {sorted(actual)}"]
+        return [
+            diff
+            for key in expected
+            for diff in _differences(
+                f"{path}[{key}]", expected[key], actual[key], rel, abs_
+            )
+        ]
+    if (
+        isinstance(expected, float)
+        and isinstance(actual, float)
+        and (
+            math.isclose(expected, actual, rel_tol=rel, abs_tol=abs_)
+            or (math.isnan(expected) and math.isnan(actual))
+        )
+    ):
+        return []
+    if expected == actual and type(expected) is type(actual):
+        return []
+    return [f"{path}: reference {expected!r}, backend {actual!r}"]
+
+
+@dataclass
+class DifferentialReport:
+    """Mismatches and evaluation time of each backend over the same cases."""
+
+    cases: int
+    #: Backend -> ``"case: property...: reference ..., backend ..."`` lines.
+    mismatches: dict[str, list[str]]
+    #: Backend (and ``"reference"``) -> seconds for loading and reading all cases.
+    seconds: dict[str, float]
+
+    def speedup(self, backend: str) -> float:
+        """Throughput of ``backend`` relative to the reference (>1: faster)."""
+        return self.seconds["reference"] / self.seconds[backend]
+
+    def table(self) -> str:
+        """The backends side by side: time, throughput ratio, mismatches."""
+        rows = [f"{'backend':<14} {'ms':>9} {'vs reference':>13} {'mismatches':>11}"]
+        for backend, seconds in self.seconds.items():
+            rows.append(
+                f"{backend:<14} {seconds * 1e3:>9.2f} "
+                f"{self.speedup(backend):>12.2f}x "
+                f"{len(self.mismatches.get(backend, ())):>11}"
+            )
+        return "\n".join(rows)
+
+
+def compare_backends(
+    cases: list[DifferentialCase],
+    backends: list[str] | None = None,
+    *,
+    names: tuple[str, ...] = ENGINE_PROPERTIES,
+    rel: float = 1e-9,
+    abs_: float = 1e-9,
+) -> DifferentialReport:
+    """Run ``cases`` through the reference and each backend; compare ``names``.
+
+    ``backends`` defaults to every registered one. Cases are fed to each
+    backend in order, one loader per distinct configuration, and every
+    property is compared within ``rel`` / ``abs_`` (deep on dicts; a raising
+    property must raise the same exception type).
+    """
+    factories = {"reference": _reference} | {
+        name: BACKENDS[name] for name in (BACKENDS if backends is None else backends)
+    }
+    outcomes: dict[str, list[list[Any]]] = {}
+    seconds: dict[str, float] = {}
+    for backend, factory in factories.items():
+        loaders: dict[DeviceConfig, Loader] = {}
+        results = []
+        start = time.perf_counter()
+        for case in cases:
+            if (load := loaders.get(case.config)) is None:
+                load = loaders[case.config] = factory(case.config)
+            reader = load(case.readings)
+            results.append([_outcome(reader, name) for name in names])
+        seconds[backend] = time.perf_counter() - start
+        outcomes[backend] = results
+
+    reference = outcomes.pop("reference")
+    mismatches = {
+        backend: [
+            f"{case.name}: {diff}"
+            for case, expected_row, actual_row in zip(cases, reference, results)
+            for name, expected, actual in zip(names, expected_row, actual_row)
+            for diff in _differences(name, expected, actual, rel, abs_)
+        ]
+        for backend, results in outcomes.items()
+    }
+    return DifferentialReport(len(cases), mismatches, seconds)
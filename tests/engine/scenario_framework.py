@@ -27,6 +27,12 @@ by:
 Use maps for the numeric bulk and methods for the awkward cases (``is None``,
 relationships, formulas); a class may use either or both.
 
+A ``@fuzz`` method adds random cells — large random topologies with plausible
+random states, reproducible from a seed (see :class:`Fuzz`). They are checked
+against the engine-wide :data:`INVARIANTS` (shares summing to 1, ratios in
+[0, 1]) and timed, flagging evaluation cost that grows superlinearly with the
+adapter count; bespoke ``test_`` methods run on them like on any other cell.
+
 Collection-time safety rail: a ``state`` must supply a reading for *exactly* the
 adapter uids its topology defines — no more, no less. A mismatch raises
 ``ValueError`` at collection instead of silently defaulting a missing adapter to
@@ -41,7 +47,11 @@ Wiring: ``tests/engine/conftest.py`` calls :func:`generate_scenario_tests` from
 from __future__ import annotations
 
 import importlib.util
+import math
 import os
+import random
+import statistics
+import time
 from dataclasses import dataclass, field, replace
 from typing import Any, Callable
 
@@ -532,6 +542,311 @@ def _apply_modify(topology: Topology, mod: Modify) -> Topology:
     return Topology(*adapters, name=topology.name)
 
 
+# ---------------------------------------------------------------------------
+# Fuzz — random large topologies × plausible random states.
+# ---------------------------------------------------------------------------
+
+
+@dataclass(frozen=True)
+class Fuzz:
+    """Random cells of growing size, reproducible from ``seed``.
+
+    For every adapter count in ``sizes`` (the grid included) one random
+    topology is drawn — a random mix of PV systems, batteries and consumers,
+    with random export settings, ``charge_from`` routing and inverted sensors —
+    and ``states`` random readings for it. Readings are physically plausible:
+    the grid balances the house, only exporting adapters cover an export, and a
+    battery charges (only with ``charging``) no more than its sources supply.
+
+    Every cell is checked against :data:`INVARIANTS` except the names in
+    ``known_violations``, and timed; see :func:`superlinear_growth`.
+    """
+
+    seed: int
+    sizes: tuple[int, ...] = (16, 64, 256)
+    states: int = 3
+    charging: bool = True
+    #: Invariants the engine is known to break in these cells, left unchecked.
+    known_violations: tuple[str, ...] = ()
+    #: Largest tolerated growth exponent of the evaluation time between sizes.
+    max_exponent: float = 1.5
+    name: str = ""  # filled in from the @fuzz method name
+
+    def cells(self) -> list[Cell]:
+        unknown = sorted(set(self.known_violations) - set(INVARIANTS))
+        if unknown:
+            raise ValueError(
+                f"fuzz {self.name!r}: unknown invariant(s) {unknown}; "
+                f"known: {sorted(INVARIANTS)}"
+            )
+        rng = random.Random(self.seed)
+        cells_: list[Cell] = []
+        for size in self.sizes:
+            topo = random_topology(rng, size, name=f"{self.name}_n{size}")
+            for index in range(self.states):
+                st = random_state(rng, topo, charging=self.charging)
+                object.__setattr__(st, "name", f"random{index}")
+                cells_.append(Cell(topo, st))
+        return cells_
+
+
+def fuzz(fn: Callable[[Any], Fuzz]) -> Callable[[Any], Fuzz]:
+    """Mark a method as returning a :class:`Fuzz` — random cells to check.
+
+    Fuzz cells join the scenario's cells (``test_`` methods run on them too),
+    and add two generated tests: ``test_fuzz_invariants`` per fuzz cell and one
+    ``test_fuzz_scaling`` over all of them. A fuzz-only scenario needs no
+    ``@topology`` / ``@state``.
+    """
+    fn._scenario_role = "fuzz"  # type: ignore[attr-defined]
+    return fn
+
+
+def random_topology(rng: random.Random, size: int, *, name: str = "") -> Topology:
+    """Draw a topology of ``size`` adapters: the grid plus a random mix."""
+    if size < 2:
+        raise ValueError(f"a random topology needs at least 2 adapters, got {size}")
+    rest = size - 1
+    pv_count = max(1, round(rest * rng.uniform(0.1, 0.4)))
+    battery_count = min(rest - pv_count, round(rest * rng.uniform(0.0, 0.2)))
+    pvs = [
+        Adapter.pv(
+            f"pv{i}",
+            lcoe=rng.uniform(0.05, 0.20),
+            exports=rng.random() < 0.5,
+            export_comp=rng.uniform(0.0, 0.10),
+            inverted=rng.random() < 0.1,
+        )
+        for i in range(pv_count)
+    ]
+    sources = ["grid", *(pv.uid for pv in pvs)]
+    max_sources = min(3, len(sources))
+    batteries = [
+        Adapter.battery(
+            f"bat{i}",
+            lcos=rng.uniform(0.05, 0.25),
+            exports=rng.random() < 0.3,
+            export_comp=rng.uniform(0.0, 0.10),
+            charge_from=tuple(rng.sample(sources, rng.randint(0, max_sources))),
+            inverted=rng.random() < 0.1,
+        )
+        for i in range(battery_count)
+    ]
+    consumers = [
+        Adapter.consumer(f"cons{i}", inverted=rng.random() < 0.1)
+        for i in range(rest - pv_count - battery_count)
+    ]
+    return Topology(Adapter.grid(), *pvs, *batteries, *consumers, name=name)
+
+
+def random_state(rng: random.Random, topo: Topology, *, charging: bool = True) -> State:
+    """Draw plausible readings for every adapter of ``topo`` (see :class:`Fuzz`)."""
+    by_kind: dict[str, list[Adapter]] = {}
+    for adapter in topo.adapters:
+        by_kind.setdefault(adapter.kind, []).append(adapter)
+    power: dict[str, float] = {}
+    # Power each PV system (and the grid) has left to charge batteries with.
+    spare: dict[str, float] = {"grid": rng.uniform(0.0, 5000.0)}
+    for pv in by_kind.get("pv", []):
+        power[pv.uid] = spare[pv.uid] = rng.uniform(0.0, 5000.0)
+    for battery in by_kind.get("battery", []):
+        sources = battery.config["charge_from_adapters"]
+        if charging and sources and rng.random() < 0.5:
+            charge = 0.0
+            for uid in sources:
+                drawn = rng.uniform(0.0, spare[uid])
+                spare[uid] -= drawn
+                charge += drawn
+            power[battery.uid] = -charge
+        else:
+            power[battery.uid] = rng.choice((0.0, rng.uniform(0.0, 3000.0)))
+    for consumer in by_kind.get("consumer", []):
+        power[consumer.uid] = -rng.uniform(0.0, 1500.0)
+
+    # The unmeasured rest of the house comes on top of the consumers.
+    load = -sum(power[c.uid] for c in by_kind.get("consumer", []))
+    load += rng.uniform(0.0, 2000.0)
+    sources = [a for a in topo.adapters if a.kind in ("pv", "battery")]
+    supplied = sum(power[a.uid] for a in sources)
+    exportable = sum(
+        power[a.uid]
+        for a in sources
+        if a.config["exports_power"] and power[a.uid] > 0
+    )
+    # An export beyond what the exporting adapters produce is self-consumed.
+    power["grid"] = max(load - supplied, -exportable)
+
+    readings = {
+        a.uid: -power[a.uid] if a.inverted else power[a.uid] for a in topo.adapters
+    }
+    return State(price=rng.uniform(0.05, 0.50), **readings)
+
+
+_TOLERANCE = 1e-6
+
+
+def _leaves(value: Any) -> list[float]:
+    if isinstance(value, dict):
+        return [leaf for inner in value.values() for leaf in _leaves(inner)]
+    return [] if value is None else [value]
+
+
+def _bounded(name: str, value: Any) -> list[str]:
+    return [
+        f"{name} holds {leaf!r} outside [0, 1]"
+        for leaf in _leaves(value)
+        if not -_TOLERANCE <= leaf <= 1.0 + _TOLERANCE
+    ]
+
+
+def _sums_to_one(name: str, shares: dict) -> list[str]:
+    errors = _bounded(name, shares)
+    total = sum(_leaves(shares))
+    if abs(total - 1.0) > _TOLERANCE:
+        errors.append(f"{name} sum to {total!r}, not 1")
+    return errors
+
+
+_GROSS_POWER_RATIOS = (
+    "gross_power_export_ratio",
+    "gross_power_consumption_ratio",
+    "gross_power_standby_ratio",
+    "gross_power_charging_ratio",
+)
+
+
+def _check_gross_power_ratios(pi: Any) -> list[str]:
+    ratios = {name: getattr(pi, name) for name in _GROSS_POWER_RATIOS}
+    errors = _bounded("gross power ratios", ratios)
+    errors += _bounded(
+        "gross_power_applicable_consumption_ratio",
+        pi.gross_power_applicable_consumption_ratio,
+    )
+    if pi.gross_power and None not in ratios.values():
+        errors += _sums_to_one("gross power ratios", ratios)
+    return errors
+
+
+def _check_gross_power_shares(pi: Any) -> list[str]:
+    if not pi.gross_power:
+        return []
+    return _sums_to_one(
+        "gross power shares",
+        pi.grid_adapters_gross_power_shares | pi.prod_adapters_gross_power_shares,
+    )
+
+
+def _check_export_shares(pi: Any) -> list[str]:
+    if not pi.combined_grid_export:
+        return []
+    return _sums_to_one("export shares", pi.prod_adapters_export_shares)
+
+
+def _check_consumption_shares(pi: Any) -> list[str]:
+    if not pi.combined_consumption or pi.combined_consumption < 0:
+        return []
+    return _sums_to_one(
+        "consumption shares",
+        pi.grid_adapters_consumption_shares | pi.prod_adapters_consumption_shares,
+    )
+
+
+def _check_consumer_source_shares(pi: Any) -> list[str]:
+    if not pi.combined_consumption or pi.combined_consumption < 0:
+        return []
+    return [
+        error
+        for uid, shares in pi.cons_adapters_source_shares.items()
+        for error in _sums_to_one(f"{uid} source shares", shares)
+    ]
+
+
+def _check_charging_source_shares(pi: Any) -> list[str]:
+    errors = []
+    for uid, shares in pi.storage_adapters_charging_source_shares.items():
+        # No source with power: every share divides down to 0.
+        if any(_leaves(shares)):
+            errors += _sums_to_one(f"{uid} charging source shares", shares)
+    return errors
+
+
+def _check_adapter_ratios(pi: Any) -> list[str]:
+    return [
+        error
+        for name in ENGINE_PROPERTIES
+        if name.endswith(("_ratios", "_shares", "_share"))
+        for error in _bounded(name, getattr(pi, name))
+    ]
+
+
+#: Invariant name -> check returning violation messages for an engine.
+INVARIANTS: dict[str, Callable[[Any], list[str]]] = {
+    "gross_power_ratios": _check_gross_power_ratios,
+    "gross_power_shares": _check_gross_power_shares,
+    "export_shares": _check_export_shares,
+    "consumption_shares": _check_consumption_shares,
+    "consumer_source_shares": _check_consumer_source_shares,
+    "charging_source_shares": _check_charging_source_shares,
+    "adapter_ratios": _check_adapter_ratios,
+}
+
+
+def check_invariants(pi: Any, *, skip: tuple[str, ...] = ()) -> list[str]:
+    """Return every invariant violation of ``pi``, as ``"name: message"``."""
+    return [
+        f"{name}: {error}"
+        for name, check in INVARIANTS.items()
+        if name not in skip
+        for error in check(pi)
+    ]
+
+
+#: Every public engine property, in name order.
+ENGINE_PROPERTIES: tuple[str, ...] = tuple(
+    sorted(
+        name
+        for klass in PowerInsight.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, property) and not name.startswith("_")
+    )
+)
+
+
+def evaluation_time(cell: Cell, *, repeats: int = 3) -> float:
+    """Best time (s) of reading every engine property of a freshly built cell."""
+    best = math.inf
+    for _ in range(repeats):
+        pi = cell.build_engine()
+        start = time.perf_counter()
+        for name in ENGINE_PROPERTIES:
+            getattr(pi, name)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def superlinear_growth(
+    timings: list[tuple[Cell, float]], *, max_exponent: float = 1.5
+) -> list[str]:
+    """Flag sizes whose evaluation time grows faster than ``n ** max_exponent``.
+
+    Cells are grouped by adapter count; each size's median time is compared
+    with the previous size's, as the exponent ``log(t2 / t1) / log(n2 / n1)``.
+    """
+    by_size: dict[int, list[float]] = {}
+    for cell, seconds in timings:
+        by_size.setdefault(len(cell.topology.adapters), []).append(seconds)
+    medians = sorted((size, statistics.median(t)) for size, t in by_size.items())
+    flagged = []
+    for (n1, t1), (n2, t2) in zip(medians, medians[1:]):
+        exponent = math.log(t2 / t1) / math.log(n2 / n1)
+        if exponent > max_exponent:
+            flagged.append(
+                f"{n1} -> {n2} adapters: {t1 * 1e3:.2f} -> {t2 * 1e3:.2f} ms "
+                f"(grows as n^{exponent:.2f}, limit n^{max_exponent:g})"
+            )
+    return flagged
+
+
 def _collect(cls: type, role: str) -> list[Callable[[Any], Any]]:
     """Return the decorated methods of ``cls`` for ``role``, in source order."""
     found = []
@@ -584,6 +899,16 @@ class _ScenarioBase:
             out.append(mod)
         return out
 
+    @classmethod
+    def _fuzzes(cls) -> list[Fuzz]:
+        return [replace(fn(cls()), name=fn.__name__) for fn in _collect(cls, "fuzz")]
+
+    @classmethod
+    def _fuzz_cases(cls) -> list[_FuzzCase]:
+        return [
+            _FuzzCase(spec, cell) for spec in cls._fuzzes() for cell in spec.cells()
+        ]
+
     @classmethod
     def _expect_specs(cls) -> list[tuple[str | None, str | None, dict[str, Any]]]:
         """Every ``@expect`` map with its ``(topology, state)`` scope."""
@@ -609,6 +934,8 @@ class _ScenarioBase:
         """Every topology × every state (+ ``@modify`` variants). Declarative."""
         topos = cls._topologies()
         states = cls._states()
+        if not topos and not states and _collect(cls, "fuzz"):
+            return []  # fuzz-only scenario
         if not topos or not states:
             raise ValueError(
                 f"{cls.__name__} needs at least one @topology and one @state"
@@ -621,7 +948,19 @@ class _ScenarioBase:
 
     @classmethod
     def scenario_cells(cls) -> list[Cell]:
-        return cls._product_cells()
+        return cls._product_cells() + [case.cell for case in cls._fuzz_cases()]
+
+
+@dataclass(frozen=True)
+class _FuzzCase:
+    """One random cell and the :class:`Fuzz` that drew it."""
+
+    fuzz: Fuzz
+    cell: Cell
+
+    @property
+    def id(self) -> str:
+        return self.cell.id
 
 
 # ---------------------------------------------------------------------------
@@ -689,13 +1028,18 @@ class EngineTestScenario(_ScenarioBase):
         # empty-parameter-set skip.
         if not _collect(cls, "expect"):
             cls.test_property = None  # type: ignore[assignment]
+        # Likewise the fuzz tests without a @fuzz.
+        if not _collect(cls, "fuzz"):
+            cls.test_fuzz_invariants = None  # type: ignore[assignment]
+            cls.test_fuzz_scaling = None  # type: ignore[assignment]
 
     @classmethod
     def decl_cases(cls) -> list[_DeclCase]:
         specs = cls._expect_specs()
-        cells = cls.scenario_cells()
         if not specs:
             return []  # pure test-method scenario: nothing for @expect to check
+        # Maps pin numbers for declared cells, never for random ones.
+        cells = cls._product_cells()
         topo_names = {c.topology.name for c in cells}
         state_names = {c.state.name for c in cells}
         for topo_s, state_s, _ in specs:  # catch a mistyped scope early
@@ -738,6 +1082,26 @@ class EngineTestScenario(_ScenarioBase):
             f"got {actual!r}, expected {_decl_case.expected!r}"
         )
 
+    def test_fuzz_invariants(self, _fuzz_case: _FuzzCase, record_property) -> None:
+        cell = _fuzz_case.cell
+        pi = cell.build_engine()
+        start = time.perf_counter()
+        violations = check_invariants(pi, skip=_fuzz_case.fuzz.known_violations)
+        record_property("evaluation_ms", round((time.perf_counter() - start) * 1e3, 3))
+        assert not violations, (
+            f"cell {cell.id!r} ({len(cell.topology.adapters)} adapters, seed "
+            f"{_fuzz_case.fuzz.seed}) breaks:\n" + "\n".join(violations[:20])
+        )
+
+    def test_fuzz_scaling(self, _fuzz: Fuzz, record_property) -> None:
+        timings = [(cell, evaluation_time(cell)) for cell in _fuzz.cells()]
+        for cell, seconds in timings:
+            record_property(f"evaluation_ms[{cell.id}]", round(seconds * 1e3, 3))
+        flagged = superlinear_growth(timings, max_exponent=_fuzz.max_exponent)
+        assert not flagged, "evaluation cost grows superlinearly: " + "; ".join(
+            flagged
+        )
+
 
 # ---------------------------------------------------------------------------
 # pytest wiring — called from tests/engine/conftest.py.
@@ -757,6 +1121,15 @@ def generate_scenario_tests(metafunc: Any) -> None:
         cases = cls.decl_cases()
         metafunc.parametrize("_decl_case", cases, ids=[c.id for c in cases])
         return
+    # The built-in fuzz tests run per random cell, and once per @fuzz.
+    if "_fuzz_case" in metafunc.fixturenames:
+        cases = cls._fuzz_cases()
+        metafunc.parametrize("_fuzz_case", cases, ids=[c.id for c in cases])
+        return
+    if "_fuzz" in metafunc.fixturenames:
+        specs = cls._fuzzes()
+        metafunc.parametrize("_fuzz", specs, ids=[f.name for f in specs])
+        return
     # A bespoke test_ method runs over the cells, optionally scoped by @cells.
     if "_scenario_cell" not in metafunc.fixturenames:
         return
@@ -0,0 +1,62 @@
+"""Differential tests: every registered engine backend against the reference.
+
+Each ``EngineScenario`` of ``test_engine_property_scenarios.py`` runs in its own
+state and in random ones through the reference ``PowerInsight`` and through
+every backend in ``BACKENDS``; all result properties must agree. Throughput is
+recorded per backend here and reported side by side by the benchmark tier
+(``tests/benchmarks/test_backends.py``).
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from tests.engine import test_engine_property_scenarios
+from tests.engine.engine_property_framework import (
+    BACKENDS,
+    compare_backends,
+    differential_cases,
+    load_engine,
+    register_backend,
+    scenario_classes,
+)
+
+CASES = differential_cases(scenario_classes(test_engine_property_scenarios))
+
+
+@pytest.mark.parametrize("backend", sorted(BACKENDS))
+def test_backend_matches_reference(backend: str, record_property) -> None:
+    report = compare_backends(CASES, [backend])
+    record_property("speedup", round(report.speedup(backend), 3))
+
+    mismatches = report.mismatches[backend]
+    assert not mismatches, (
+        f"{backend}: {len(mismatches)} mismatches over {report.cases} cases\n"
+        + "\n".join(mismatches[:20])
+    )
+
+
+def test_stale_backend_is_caught(monkeypatch) -> None:
+    def stale(config):
+        # Keeps answering with the first state's engine.
+        engines = []
+
+        def load(readings):
+            if not engines:
+                engines.append(load_engine(config, readings))
+            return engines[0]
+
+        return load
+
+    monkeypatch.setitem(BACKENDS, "stale", stale)
+    report = compare_backends(CASES, ["stale"], names=("gross_power",))
+
+    [first, *_] = report.mismatches["stale"]
+    assert "-random" in first and ": gross_power: reference " in first
+
+
+def test_backend_names_are_unique() -> None:
+    with pytest.raises(ValueError, match="already registered"):
+        register_backend("reference")(lambda config: None)
+    with pytest.raises(ValueError, match="already registered"):
+        register_backend("result_table")(lambda config: None)
@@ -0,0 +1,122 @@
+"""Engine tests for the hot-path instrumentation.
+
+These import ``power_insight.py`` and ``instrumentation.py`` directly via
+importlib (HA-free), mirroring ``test_result_table.py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+
+import pytest
+
+_PACKAGE = os.path.join(
+    os.path.dirname(__file__), os.pardir, os.pardir, "custom_components", "power_insight"
+)
+
+
+def _load(name: str):
+    spec = importlib.util.spec_from_file_location(
+        name, os.path.join(_PACKAGE, f"{name}.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    # Dataclasses look their module up while the class is created.
+    previous = sys.modules.get(name)
+    sys.modules[name] = module
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        if previous is None:
+            del sys.modules[name]
+        else:
+            sys.modules[name] = previous
+    return module
+
+
+_mod = _load("power_insight")
+_instrumentation = _load("instrumentation")
+Instrumentation = _instrumentation.Instrumentation
+LATENCY_POLLS = _instrumentation.LATENCY_POLLS
+
+PowerInsight = _mod.PowerInsight
+GridAdapter = _mod.GridAdapter
+ConsumerAdapter = _mod.ConsumerAdapter
+
+GRID_POWER = "sensor.grid_power"
+CONS_POWER = "sensor.cons_power"
+
+
+def _build(stats: Instrumentation):
+    pi = PowerInsight()
+    pi.register_adapter(
+        GridAdapter(unique_id="grid", verbose_name="Grid", power_entity=GRID_POWER)
+    )
+    pi.register_adapter(
+        ConsumerAdapter(unique_id="cons", verbose_name="Consumer", power_entity=CONS_POWER)
+    )
+    pi.set_value(GRID_POWER, 1000.0)
+    pi.set_value(CONS_POWER, 800.0)
+    pi.instrumentation = stats
+    return pi
+
+
+def test_counts_one_evaluation_per_generation() -> None:
+    stats = Instrumentation()
+    pi = _build(stats)
+
+    for _ in range(3):
+        pi.results.gross_power
+    pi.set_value(GRID_POWER, 1500.0)
+    pi.results.gross_power
+
+    assert stats.properties["gross_power"].count == 2
+
+
+def test_only_sampled_ticks_are_timed() -> None:
+    stats = Instrumentation(sample_every=2)
+    pi = _build(stats)
+
+    for tick in range(4):
+        pi.set_value(GRID_POWER, 1000.0 + tick)
+        stats.begin_tick(GRID_POWER)
+        pi.results.gross_power
+        stats.write(object(), lambda: None)
+
+    gross_power = stats.properties["gross_power"]
+    assert (gross_power.count, gross_power.sampled) == (4, 2)
+    assert stats.writes["object"].sampled == 2
+
+    dump = stats.as_dict()
+    assert dump["ticks"] == 4
+    # Ticks 0 and 2 were sampled and have been closed by their successors.
+    assert [tick["evaluations"] for tick in dump["slowest_recent_ticks"]] == [1, 1]
+    assert dump["properties"]["gross_power"]["estimated_total_ms"] is not None
+
+
+def test_latency_window() -> None:
+    stats = Instrumentation(sample_every=1)
+    pi = _build(stats)
+
+    assert stats.latency(0.0).ticks_per_minute is None
+    for tick in range(20):
+        pi.set_value(GRID_POWER, 1000.0 + tick)
+        stats.begin_tick(GRID_POWER)
+        stats.write(object(), lambda: pi.results.gross_power)
+    latency = stats.latency(120.0)
+
+    # The 20th tick is still open; the 19 closed ones are timed.
+    assert latency.ticks_per_minute == pytest.approx(10)
+    assert latency.writes_per_minute == pytest.approx(10)
+    ticks = list(stats._recent)
+    assert all(0 < tick.evaluation_ns <= tick.duration_ns for tick in ticks)
+    durations = sorted(tick.evaluation_ns / 1e6 for tick in ticks)
+    assert latency.evaluation_mean_ms == pytest.approx(sum(durations) / 19)
+    assert latency.evaluation_p95_ms == durations[-1]
+
+    # Quiet since the oldest poll: no rate, no fresh evaluation time.
+    for _ in range(LATENCY_POLLS):
+        latency = stats.latency(180.0)
+    assert latency.ticks_per_minute is None
+    assert latency.evaluation_mean_ms is None
@@ -0,0 +1,112 @@
+"""Tests for the sweep mode of ``tools/mock_power_insight.py``.
+
+The tool loads the engine itself (HA-free); the sweep must read exactly what
+mocking each grid point by hand reads, memoization or not.
+"""
+
+from __future__ import annotations
+
+import csv
+import math
+
+import pytest
+
+from tools.mock_power_insight import (
+    Battery,
+    Consumer,
+    Grid,
+    MockPowerInsight,
+    Pv,
+    _flatten,
+    main,
+    parse_config,
+    parse_values,
+)
+
+
+def _engine() -> MockPowerInsight:
+    return MockPowerInsight(
+        Grid(),
+        Pv("pv1", exports_power=True, export_compensation=0.08),
+        Battery("bat1", charge_from=["grid", "pv1"]),
+        Consumer("cons1"),
+    )
+
+
+def _same(left: object, right: object) -> bool:
+    if isinstance(left, float) and isinstance(right, float):
+        return math.isclose(left, right) or (math.isnan(left) and math.isnan(right))
+    return left == right
+
+
+def test_sweep_matches_mocking_each_point() -> None:
+    ranges = {
+        "grid": [-2000.0, 0.0, 1500.0],
+        "pv1": [0.0, 4000.0],
+        "bat1": [-800.0, None, 800.0],
+        "cons1": [-1200.0],
+        "grid_price": [0.30],
+    }
+    columns = _engine().sweep(ranges)
+
+    assert "cons_adapters_source_shares[cons1][pv1]" in columns
+    assert len(columns["grid"]) == 3 * 2 * 3
+    reference = _engine()
+    for row in range(len(columns["grid"])):
+        reference.mock(**{slot: columns[slot][row] for slot in ranges})
+        expected: dict[str, object] = {}
+        for name in {column.partition("[")[0] for column in columns} - set(ranges):
+            expected.update(_flatten(name, reference._value_of(name)))
+        for column in set(columns) - set(ranges):
+            assert _same(columns[column][row], expected.get(column)), (column, row)
+
+
+def test_sweep_restores_the_engine() -> None:
+    pi = _engine()
+    pi.sweep({"pv1": [0.0, 1000.0]}, ["gross_power"])
+
+    assert type(pi) is MockPowerInsight
+    assert "_memo" not in vars(pi)
+    with pytest.raises(KeyError, match="unknown value slot"):
+        pi.sweep({"pv9": [0.0]})
+
+
+def test_parse_values() -> None:
+    assert parse_values("0..1000:250") == [0.0, 250.0, 500.0, 750.0, 1000.0]
+    assert len(parse_values("0..0.3:0.1")) == 4
+    assert parse_values("1,none, -2") == [1.0, None, -2.0]
+    with pytest.raises(ValueError, match="positive"):
+        parse_values("5..0:1")
+
+
+def test_parse_config() -> None:
+    battery = parse_config(Battery, "bat1,charge_from=grid+pv1,name=Home")
+    assert (battery.uid, battery.charge_from, battery.name) == (
+        "bat1",
+        ["grid", "pv1"],
+        "Home",
+    )
+    assert parse_config(Pv, "pv1,exports_power=true").exports_power is True
+    with pytest.raises(ValueError, match="uid"):
+        parse_config(Consumer, "name=x")
+    with pytest.raises(ValueError, match="bad Pv setting"):
+        parse_config(Pv, "pv1,lcoe=x")
+
+
+def test_cli_writes_csv(tmp_path) -> None:
+    path = tmp_path / "sweep.csv"
+    assert (
+        main(
+            [
+                "--pv", "pv1", "--consumer", "cons1",
+                "grid=0..1000:500", "pv1=0,2000", "cons1=-1200",
+                "-p", "gross_power", "-o", str(path),
+            ]
+        )
+        == 0
+    )
+
+    with path.open(encoding="utf-8") as file:
+        rows = list(csv.DictReader(file))
+    assert len(rows) == 3 * 2
+    assert list(rows[0]) == ["grid", "pv1", "cons1", "gross_power"]
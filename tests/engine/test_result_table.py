@@ -0,0 +1,178 @@
+"""Engine tests for the per-tick result table.
+
+These import ``power_insight.py`` directly via importlib (HA-free), mirroring
+``test_power_insight_calculations.py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+
+import pytest
+
+_MODULE_PATH = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    os.pardir,
+    "custom_components",
+    "power_insight",
+    "power_insight.py",
+)
+_spec = importlib.util.spec_from_file_location("power_insight", _MODULE_PATH)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+PowerInsight = _mod.PowerInsight
+GridAdapter = _mod.GridAdapter
+PvAdapter = _mod.PvAdapter
+ConsumerAdapter = _mod.ConsumerAdapter
+
+
+GRID_POWER = "sensor.grid_power"
+GRID_PRICE = "sensor.grid_price"
+CONS_POWER = "sensor.cons_power"
+
+
+def _pv(i: int) -> PvAdapter:
+    return PvAdapter(
+        unique_id=f"pv{i}",
+        verbose_name=f"PV-{i}",
+        power_entity=f"sensor.pv{i}_power",
+        power_entity_inverted=False,
+        lcoe=0.10,
+        lco2_intensity=35.0,
+        exports_power=True,
+        export_compensation=0.08,
+    )
+
+
+def _build(pv_count: int = 3):
+    """Grid + ``pv_count`` producing PVs + one consumer."""
+    pi = PowerInsight()
+    pi.register_adapter(
+        GridAdapter(
+            unique_id="grid",
+            verbose_name="Grid",
+            power_entity=GRID_POWER,
+            price_entity=GRID_PRICE,
+        )
+    )
+    for i in range(pv_count):
+        pi.register_adapter(_pv(i))
+    pi.register_adapter(
+        ConsumerAdapter(
+            unique_id="cons",
+            verbose_name="Consumer",
+            power_entity=CONS_POWER,
+        )
+    )
+    pi.set_value(GRID_POWER, 1000.0)
+    pi.set_value(GRID_PRICE, 0.30)
+    for i in range(pv_count):
+        pi.set_value(f"sensor.pv{i}_power", 500.0 * (i + 1))
+    pi.set_value(CONS_POWER, 800.0)
+    return pi
+
+
+class _CountingEngine(PowerInsight):
+    """Engine that counts evaluations of one per-adapter property."""
+
+    evaluations = 0
+
+    @property
+    def prod_adapters_consumption_power(self):
+        type(self).evaluations += 1
+        return super().prod_adapters_consumption_power
+
+
+def test_table_matches_engine() -> None:
+    pi = _build()
+    assert pi.results.gross_power == pi.gross_power
+    assert pi.results.prod_adapters_cost_saving_rates == pytest.approx(
+        pi.prod_adapters_cost_saving_rates
+    )
+
+
+def test_cells_share_one_evaluation_per_generation() -> None:
+    pi = _CountingEngine()
+    pi.register_adapter(
+        GridAdapter(unique_id="grid", verbose_name="Grid", power_entity=GRID_POWER)
+    )
+    for i in range(4):
+        pi.register_adapter(_pv(i))
+        pi.set_value(f"sensor.pv{i}_power", 1000.0)
+    pi.set_value(GRID_POWER, 0.0)
+
+    value_fn = lambda obj: obj.prod_adapters_consumption_power  # noqa: E731
+    cells = [pi.results.cell(value_fn, f"pv{i}") for i in range(4)]
+
+    _CountingEngine.evaluations = 0
+    values = [cell.value for cell in cells]
+    assert values == [1000.0] * 4
+    assert _CountingEngine.evaluations == 1
+
+    # Re-reading without an input change is free.
+    assert [cell.value for cell in cells] == values
+    assert _CountingEngine.evaluations == 1
+
+    pi.set_value("sensor.pv0_power", 2000.0)
+    assert cells[0].value == 2000.0
+    assert cells[1].value == 1000.0
+    assert _CountingEngine.evaluations == 2
+
+
+def test_unchanged_value_keeps_generation() -> None:
+    pi = _build()
+    generation = pi.generation
+    assert pi.set_value(GRID_POWER, 1000.0) is False
+    assert pi.generation == generation
+    assert pi.set_value(GRID_POWER, 1100.0) is True
+    assert pi.generation == generation + 1
+
+
+def test_invalidate_refreshes_after_adapter_edit() -> None:
+    pi = _build(pv_count=1)
+    cell = pi.results.cell(lambda obj: obj.combined_lcoe_rate)
+    before = cell.value
+    pi.get_adapter_by_uid("pv0")._lcoe = 0.20
+    assert cell.value == before  # memoized until invalidated
+    pi.invalidate()
+    # pv0 runs at 0.5 kW, so doubling its lcoe adds 0.05 EUR/h.
+    assert cell.value == pytest.approx(before + 0.05)
+
+
+def test_nested_cell_and_missing_keys() -> None:
+    pi = _build(pv_count=1)
+    cell = pi.results.cell(lambda obj: obj.cons_adapters_source_shares, "cons", "pv0")
+    assert cell.value == pytest.approx(
+        pi.cons_adapters_source_shares["cons"]["pv0"]
+    )
+    assert pi.results.cell(lambda obj: None, "cons").value is None
+    assert pi.results.cell(
+        lambda obj: obj.prod_adapters_consumption_power, "missing"
+    ).value is None
+
+
+def test_output_stage_runs_once_per_generation() -> None:
+    pi = _build(pv_count=1)
+    calls: list[float] = []
+
+    def to_kw(value: float) -> float:
+        calls.append(value)
+        return value / 1000
+
+    cell = pi.results.cell(
+        lambda obj: obj.prod_adapters_consumption_power, "pv0", output_fn=to_kw
+    )
+    assert cell.value == pytest.approx(0.5)
+    assert cell.value == pytest.approx(0.5)
+    assert len(calls) == 1
+
+    pi.set_value("sensor.pv0_power", 700.0)
+    assert cell.value == pytest.approx(0.7)
+    assert len(calls) == 2
+
+    # ``None`` results bypass the output stage.
+    assert pi.results.cell(lambda obj: None, output_fn=to_kw).value is None
+    assert len(calls) == 2
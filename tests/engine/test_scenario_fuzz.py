@@ -0,0 +1,143 @@
+"""Random large topologies, checked by invariants and timed for scaling.
+
+Each ``@fuzz`` scenario draws one random topology per size and a few plausible
+states for it (see :class:`~tests.engine.scenario_framework.Fuzz`). The
+framework generates ``test_fuzz_invariants`` per cell — shares summing to 1,
+ratios in [0, 1] — and ``test_fuzz_scaling``, which fails when the evaluation
+time of the full property surface grows faster than ``n ** 1.5`` in the
+adapter count. The seeds are fixed: a failure reproduces with the cell id.
+
+Known engine defects are declared as ``known_violations`` and pinned below as
+strict xfails, so fixing one shows up as an XPASS to clean up:
+
+* ``adapter_ratios`` — the ``storage_adapters_*`` export and consumption maps
+  normalise the export over the batteries alone, so a battery exporting next to
+  a PV system reads an export ratio above 1.
+* ``consumption_shares`` / ``consumer_source_shares`` — charging is not taken
+  out of the consumption shares of its sources (the grid's not at all, the
+  PV systems' over-counted per battery; see the ``BUG (multi-battery)`` note
+  in ``power_insight.py``), so they no longer sum to 1 while batteries charge.
+"""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from tests.engine.scenario_framework import (
+    INVARIANTS,
+    Adapter,
+    Cell,
+    EngineTestScenario,
+    Fuzz,
+    State,
+    Topology,
+    check_invariants,
+    fuzz,
+    random_state,
+    random_topology,
+    superlinear_growth,
+)
+
+STORAGE_RATIOS = ("adapter_ratios",)
+CHARGING_SHARES = ("consumption_shares", "consumer_source_shares")
+
+
+class TestRandomIdleBatteries(EngineTestScenario):
+    """Batteries idle or discharging: the other invariants hold exactly."""
+
+    @fuzz
+    def idle(self):
+        return Fuzz(seed=20240611, charging=False, known_violations=STORAGE_RATIOS)
+
+    def test_adapter_exports_add_up_to_the_grid_export(self, power_insight):
+        exports = power_insight.prod_adapters_export_power
+        assert sum(exports.values()) == pytest.approx(
+            power_insight.combined_grid_export
+        )
+
+
+class TestRandomCharging(EngineTestScenario):
+    """Batteries charging from their configured sources, too."""
+
+    @fuzz
+    def charging(self):
+        return Fuzz(
+            seed=4217,
+            sizes=(16, 64),
+            known_violations=STORAGE_RATIOS + CHARGING_SHARES,
+        )
+
+
+def _violated(spec: Fuzz, invariants: tuple[str, ...]) -> list[str]:
+    others = tuple(name for name in INVARIANTS if name not in invariants)
+    return [
+        violation
+        for cell in spec.cells()
+        for violation in check_invariants(cell.build_engine(), skip=others)
+    ]
+
+
+@pytest.mark.xfail(strict=True, reason="storage ratios normalise over batteries only")
+def test_storage_ratios_are_bounded():
+    spec = Fuzz(seed=20240611, charging=False, sizes=(16, 64), name="idle")
+    assert not _violated(spec, STORAGE_RATIOS)
+
+
+@pytest.mark.xfail(strict=True, reason="charging stays in the consumption shares")
+def test_consumption_shares_sum_to_one_while_charging():
+    spec = Fuzz(seed=4217, sizes=(16, 64), name="charging")
+    assert not _violated(spec, CHARGING_SHARES)
+
+
+# ===========================================================================
+# The generator and the scaling check themselves.
+# ===========================================================================
+
+
+def test_random_cells_are_reproducible():
+    first = Fuzz(seed=7, sizes=(8,), name="f").cells()
+    second = Fuzz(seed=7, sizes=(8,), name="f").cells()
+
+    assert [c.id for c in first] == ["f_n8-random0", "f_n8-random1", "f_n8-random2"]
+    assert [c.state.readings for c in first] == [c.state.readings for c in second]
+    assert all(len(c.topology.adapters) == 8 for c in first)
+
+
+def test_random_state_balances_the_grid():
+    rng = random.Random(3)
+    for _ in range(50):
+        topo = random_topology(rng, 12)
+        readings = random_state(rng, topo).readings
+        power = {
+            a.uid: -readings[a.uid] if a.inverted else readings[a.uid]
+            for a in topo.adapters
+        }
+        consumers = [a.uid for a in topo.adapters if a.kind == "consumer"]
+        # Grid + production + discharge - charging covers at least the consumers.
+        supplied = sum(p for uid, p in power.items() if uid not in consumers)
+        assert supplied >= -sum(power[uid] for uid in consumers) - 1e-6
+
+
+def test_plain_cells_satisfy_every_invariant():
+    topo = Topology(
+        Adapter.grid(),
+        Adapter.pv("pv1", exports=True),
+        Adapter.battery("bat1", charge_from=("grid",)),
+        Adapter.consumer("cons1"),
+    )
+    cell = Cell(topo, State(grid=-500, pv1=2000, bat1=0, cons1=-600, price=0.30))
+    assert check_invariants(cell.build_engine()) == []
+
+
+def test_superlinear_growth_is_flagged():
+    def cell(size: int) -> Cell:
+        return Cell(random_topology(random.Random(size), size), State())
+
+    linear = [(cell(16), 0.001), (cell(64), 0.004)]
+    quadratic = [(cell(16), 0.001), (cell(64), 0.016)]
+
+    assert superlinear_growth(linear) == []
+    [flag] = superlinear_growth(quadratic)
+    assert "16 -> 64 adapters" in flag and "n^2.00" in flag
@@ -0,0 +1,60 @@
+"""Engine tests for the memory estimate behind the diagnostics.
+
+These import ``memory.py`` directly via importlib (HA-free), mirroring
+``test_result_table.py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import os
+import sys
+
+_PATH = os.path.join(
+    os.path.dirname(__file__),
+    os.pardir,
+    os.pardir,
+    "custom_components",
+    "power_insight",
+    "memory.py",
+)
+_spec = importlib.util.spec_from_file_location("memory", _PATH)
+_mod = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(_mod)
+
+SizeEstimator = _mod.SizeEstimator
+
+
+class _Owner:
+    """Stands in for an object owned elsewhere (e.g. the HA core)."""
+
+    def __init__(self) -> None:
+        self.payload = list(range(1000))
+
+
+class _Node:
+    def __init__(self, shared: list, owner: _Owner) -> None:
+        self.shared = shared
+        self.owner = owner
+        self.own = [0.5] * 10
+
+
+def test_shared_objects_are_counted_once() -> None:
+    shared = list(range(100))
+    first, second = _Node(shared, _Owner()), _Node(shared, _Owner())
+    estimator = SizeEstimator((_Owner,))
+
+    first_bytes = estimator.add(first)
+    second_bytes = estimator.add(second)
+
+    assert first_bytes - second_bytes >= sys.getsizeof(shared)
+    assert estimator.add(first, second) == 0
+
+
+def test_walk_stops_at_boundary_types_but_not_at_roots() -> None:
+    owner = _Owner()
+    node = _Node([], owner)
+
+    assert SizeEstimator((_Owner,)).add(node) < sys.getsizeof(owner.payload)
+    assert SizeEstimator((_Owner,)).add(owner) > sys.getsizeof(owner.payload)
+    assert SizeEstimator(exclude=(owner,)).add(node) < sys.getsizeof(owner.payload)
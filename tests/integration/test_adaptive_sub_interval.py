@@ -0,0 +1,195 @@
+"""Tests for the adaptive max_sub_interval of accumulating sensors."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from custom_components.power_insight.entity import BaseEventIntegrationSensorEntity
+from custom_components.power_insight.power_insight import PowerInsight
+from .conftest import (
+    BASE_OPTIONS,
+    DOMAIN,
+    FULL_OPTIONS,
+    make_grid_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+class _Accumulator(BaseEventIntegrationSensorEntity):
+    """Minimal concrete accumulator for exercising the timer policy."""
+
+    @property
+    def integration_value(self) -> float | None:
+        return None
+
+
+def _adaptive() -> _Accumulator:
+    return _Accumulator(
+        [],
+        PowerInsight(),
+        max_sub_interval=timedelta(minutes=16),
+        min_sub_interval=timedelta(minutes=1),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Interval policy (no hass needed)
+# ---------------------------------------------------------------------------
+
+def test_fixed_mode_never_adapts() -> None:
+    sensor = _Accumulator([], PowerInsight())
+    assert not sensor.adaptive_sub_interval
+    sensor._adapt_sub_interval(0.0, 0.0)
+    sensor._adapt_sub_interval(1.0, 5.0)
+    assert sensor.effective_max_sub_interval == timedelta(minutes=1)
+
+
+def test_stable_rate_doubles_up_to_upper_bound() -> None:
+    sensor = _adaptive()
+    assert sensor.effective_max_sub_interval == timedelta(minutes=1)
+    for expected in (2, 4, 8, 16, 16):
+        sensor._adapt_sub_interval(0.30, 0.30)
+        assert sensor.effective_max_sub_interval == timedelta(minutes=expected)
+
+
+def test_zero_rate_jumps_to_upper_bound() -> None:
+    sensor = _adaptive()
+    sensor._adapt_sub_interval(0.0, 0.0)
+    assert sensor.effective_max_sub_interval == timedelta(minutes=16)
+
+
+def test_volatile_rate_or_unavailable_resets_to_lower_bound() -> None:
+    sensor = _adaptive()
+    sensor._adapt_sub_interval(0.0, 0.0)
+    sensor._adapt_sub_interval(0.30, 0.60)
+    assert sensor.effective_max_sub_interval == timedelta(minutes=1)
+
+    sensor._adapt_sub_interval(0.0, 0.0)
+    sensor._adapt_sub_interval(0.30, None)
+    assert sensor.effective_max_sub_interval == timedelta(minutes=1)
+
+
+def test_inverted_bounds_are_clamped() -> None:
+    sensor = _Accumulator(
+        [],
+        PowerInsight(),
+        max_sub_interval=timedelta(seconds=30),
+        min_sub_interval=timedelta(minutes=5),
+    )
+    assert sensor.effective_max_sub_interval == timedelta(seconds=30)
+
+
+# ---------------------------------------------------------------------------
+# Options flow + diagnostics
+# ---------------------------------------------------------------------------
+
+async def test_options_flow_saves_accumulation_section(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=BASE_OPTIONS,
+        subentries_data=[make_grid_subentry_data()],
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            "preset": "minimal",
+            "debug_power_entities": False,
+            "accumulation": {
+                "adaptive_sub_interval": True,
+                "min_sub_interval": 30,
+                "max_sub_interval": 600,
+            },
+        },
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options["adaptive_sub_interval"] is True
+    assert entry.options["min_sub_interval"] == 30
+    assert entry.options["max_sub_interval"] == 600
+
+
+async def test_options_flow_rejects_inverted_bounds(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=BASE_OPTIONS,
+        subentries_data=[make_grid_subentry_data()],
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            "preset": "minimal",
+            "debug_power_entities": False,
+            "accumulation": {
+                "adaptive_sub_interval": True,
+                "min_sub_interval": 600,
+                "max_sub_interval": 30,
+            },
+        },
+    )
+    assert result["type"] == FlowResultType.FORM
+    assert result["errors"]["base"] == "invalid_sub_interval_bounds"
+
+
+async def test_options_flow_ignores_bounds_while_fixed(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=BASE_OPTIONS,
+        subentries_data=[make_grid_subentry_data()],
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            "preset": "minimal",
+            "debug_power_entities": True,
+            "accumulation": {
+                "adaptive_sub_interval": False,
+                "min_sub_interval": 600,
+                "max_sub_interval": 30,
+            },
+        },
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options["debug_power_entities"] is True
+    assert entry.options["adaptive_sub_interval"] is False
+
+
+async def test_diagnostics_report_effective_interval(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={
+            **FULL_OPTIONS,
+            "adaptive_sub_interval": True,
+            "min_sub_interval": 20,
+            "max_sub_interval": 300,
+        },
+        subentries_data=[make_grid_subentry_data()],
+    )
+    await setup_integration(hass, entry)
+
+    diag = await async_get_config_entry_diagnostics(hass, entry)
+    timers = diag["integration_timers"]
+    assert timers
+    for timer in timers.values():
+        assert timer["adaptive"] is True
+        assert 20 <= timer["effective_max_sub_interval_s"] <= 300
@@ -0,0 +1,236 @@
+"""Tests for the recorder history backfill of accumulated totals."""
+from __future__ import annotations
+
+import asyncio
+import copy
+from datetime import datetime, timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import async_get_platforms
+import homeassistant.util.dt as dt_util
+from freezegun import freeze_time
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight.backfill import async_backfill
+from .conftest import (
+    DOMAIN,
+    GRID_SUB_ID,
+    make_grid_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+TOTAL_SUFFIX = f"{GRID_SUB_ID}_total_import_cost"
+
+
+class _FakeHistory:
+    """Stand-in history source: a constant grid import and price."""
+
+    def __init__(self, samples: list[tuple[datetime, str, float | None]]) -> None:
+        self.samples = samples
+        self.windows: list[tuple[datetime, datetime]] = []
+
+    async def async_read_chunk(self, entity_ids, start, end):
+        self.windows.append((start, end))
+        return [s for s in self.samples if start <= s[0] < end and s[1] in entity_ids]
+
+
+class _GatedHistory(_FakeHistory):
+    """History source whose reads wait until ``gate`` is set."""
+
+    def __init__(self, samples) -> None:
+        super().__init__(samples)
+        self.gate = asyncio.Event()
+
+    async def async_read_chunk(self, entity_ids, start, end):
+        await self.gate.wait()
+        return await super().async_read_chunk(entity_ids, start, end)
+
+
+def _entry(method: str = "trapezoidal") -> MockConfigEntry:
+    grid = copy.deepcopy(make_grid_subentry_data())
+    grid["data"]["adapter"]["config"][
+        "grid_electricity_price_entity"
+    ] = "sensor.grid_price"
+    return MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={
+            "schema": 2,
+            "scopes": {"grid": ["calculate_cost_rates", "accumulate_cost_rates"]},
+            "integration_method": method,
+        },
+        subentries_data=[grid],
+    )
+
+
+def _accumulator(hass: HomeAssistant, suffix: str):
+    for platform in async_get_platforms(hass, DOMAIN):
+        for entity in platform.entities.values():
+            if entity.unique_id.endswith(suffix):
+                return entity
+    raise AssertionError(f"sensor *{suffix} not found")
+
+
+def _constant_import(start: datetime, hours: int) -> list:
+    samples = [(start, "sensor.grid_price", 0.30)]
+    for minute in range(0, hours * 60, 10):
+        samples.append((start + timedelta(minutes=minute), "sensor.grid_power", 1000.0))
+    return samples
+
+
+async def test_backfill_seeds_new_accumulator(hass: HomeAssistant) -> None:
+    entry = _entry()
+    await setup_integration(hass, entry)
+    sensor = _accumulator(hass, TOTAL_SUFFIX)
+
+    start = dt_util.utcnow() - timedelta(hours=2)
+    end = start + timedelta(hours=2)
+    totals = await async_backfill(
+        hass,
+        entry,
+        [sensor],
+        start=start,
+        end=end,
+        source=_FakeHistory(_constant_import(start, 2)),
+    )
+
+    # 1 kW import at 0.30 EUR/kWh for 2 h = 0.60 EUR.
+    assert float(totals[sensor.unique_id]) == pytest.approx(0.60)
+    assert float(hass.states.get(sensor.entity_id).state) == pytest.approx(0.60)
+
+
+async def test_backfill_streams_in_chunks(hass: HomeAssistant) -> None:
+    entry = _entry()
+    await setup_integration(hass, entry)
+    sensor = _accumulator(hass, TOTAL_SUFFIX)
+
+    start = dt_util.utcnow() - timedelta(days=3)
+    end = start + timedelta(days=2, hours=12)
+    source = _FakeHistory(_constant_import(start, 60))
+    totals = await async_backfill(
+        hass, entry, [sensor], start=start, end=end, source=source
+    )
+
+    assert source.windows == [
+        (start, start + timedelta(days=1)),
+        (start + timedelta(days=1), start + timedelta(days=2)),
+        (start + timedelta(days=2), end),
+    ]
+    # The rate carries across chunk boundaries: 60 h * 0.30 EUR/h.
+    assert float(totals[sensor.unique_id]) == pytest.approx(18.0)
+
+
+@pytest.mark.parametrize(
+    ("method", "slices_off"),
+    # Trapezoids overshoot every 10 min slice of the parabola by h^3/12 * f'';
+    # Simpson only the first, which has no earlier sample yet.
+    [("trapezoidal", 12), ("simpson", 1)],
+)
+async def test_backfill_uses_the_sensor_method(
+    hass: HomeAssistant, method: str, slices_off: int
+) -> None:
+    entry = _entry(method)
+    await setup_integration(hass, entry)
+    sensor = _accumulator(hass, TOTAL_SUFFIX)
+
+    start = dt_util.utcnow() - timedelta(hours=3)
+    # Import 1 + t^2 kW (t in hours) for 2 h, sampled every 10 minutes.
+    samples = [(start, "sensor.grid_price", 0.30)] + [
+        (start + timedelta(minutes=m), "sensor.grid_power", 1000.0 * (1 + (m / 60) ** 2))
+        for m in range(0, 121, 10)
+    ]
+    end = start + timedelta(minutes=121)
+    totals = await async_backfill(
+        hass, entry, [sensor], start=start, end=end, source=_FakeHistory(samples)
+    )
+
+    # 0.30 EUR/kWh * (2 + 8/3) kWh, then the last 5 kW held for one minute.
+    exact = 0.30 * (2 + 8 / 3) + 0.30 * 5 / 60
+    overshoot = (1 / 6) ** 3 / 12 * 0.60
+    assert float(totals[sensor.unique_id]) == pytest.approx(
+        exact + slices_off * overshoot, abs=1e-6
+    )
+
+
+async def test_backfill_with_no_history_seeds_zero(hass: HomeAssistant) -> None:
+    entry = _entry()
+    await setup_integration(hass, entry)
+    sensor = _accumulator(hass, TOTAL_SUFFIX)
+
+    end = dt_util.utcnow()
+    totals = await async_backfill(
+        hass,
+        entry,
+        [sensor],
+        start=end - timedelta(hours=1),
+        end=end,
+        source=_FakeHistory([]),
+    )
+    assert totals[sensor.unique_id] == 0
+
+
+async def test_backfill_keeps_the_live_total(hass: HomeAssistant) -> None:
+    entry = _entry()
+    t0 = dt_util.utcnow()
+    with freeze_time(t0) as frozen:
+        hass.states.async_set("sensor.grid_power", "1000", {"unit_of_measurement": "W"})
+        hass.states.async_set(
+            "sensor.grid_price", "0.30", {"unit_of_measurement": "EUR/kWh"}
+        )
+        await setup_integration(hass, entry)
+        sensor = _accumulator(hass, TOTAL_SUFFIX)
+
+        start = t0 - timedelta(hours=2)
+        source = _GatedHistory(_constant_import(start, 2))
+        backfill = entry.async_create_background_task(
+            hass,
+            async_backfill(hass, entry, [sensor], start=start, end=t0, source=source),
+            "test_backfill",
+        )
+        await hass.async_block_till_done(wait_background_tasks=False)
+
+        # The live sensor integrates one hour while the history is still read.
+        for moment in (t0, t0 + timedelta(hours=1)):
+            frozen.move_to(moment)
+            hass.states.async_set(
+                "sensor.grid_power", "1000", {"unit_of_measurement": "W"}
+            )
+            for _ in range(4):
+                await hass.async_block_till_done(wait_background_tasks=False)
+        assert float(hass.states.get(sensor.entity_id).state) == pytest.approx(
+            0.30, abs=1e-3
+        )
+
+        source.gate.set()
+        await backfill
+
+    # 2 h backfilled + 1 h live at 0.30 EUR/h.
+    assert float(hass.states.get(sensor.entity_id).state) == pytest.approx(
+        0.90, abs=1e-3
+    )
+
+
+async def test_unload_cancels_the_pending_read(hass: HomeAssistant) -> None:
+    entry = _entry()
+    await setup_integration(hass, entry)
+    sensor = _accumulator(hass, TOTAL_SUFFIX)
+
+    end = dt_util.utcnow()
+    source = _GatedHistory([])
+    backfill = entry.async_create_background_task(
+        hass,
+        async_backfill(
+            hass, entry, [sensor], start=end - timedelta(hours=1), end=end, source=source
+        ),
+        "test_backfill",
+    )
+    await hass.async_block_till_done(wait_background_tasks=False)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert backfill.cancelled()
+    assert not source.gate.is_set()
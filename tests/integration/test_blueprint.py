@@ -0,0 +1,75 @@
+"""Tests for the cached sensor blueprint behind the platform setup."""
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight import sensor as sensor_module
+from custom_components.power_insight.const import DATA_BLUEPRINTS
+from .conftest import DOMAIN, setup_integration
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def test_blueprint_matches_created_entities(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    await setup_integration(hass, mock_config_entry)
+
+    blueprint = hass.data[DATA_BLUEPRINTS][mock_config_entry.entry_id].current
+    uids = {
+        e.unique_id
+        for e in er.async_entries_for_config_entry(
+            er.async_get(hass), mock_config_entry.entry_id
+        )
+    }
+    assert blueprint.unique_ids == uids
+
+
+async def test_reload_reuses_compiled_blueprint(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    with patch.object(
+        sensor_module,
+        "_compile_blueprint",
+        wraps=sensor_module._compile_blueprint,
+    ) as compile_mock:
+        await setup_integration(hass, mock_config_entry)
+        await hass.config_entries.async_reload(mock_config_entry.entry_id)
+        await hass.async_block_till_done()
+        assert compile_mock.call_count == 1
+
+        # An option change needs a new blueprint; toggling back does not.
+        original = dict(mock_config_entry.options)
+        hass.config_entries.async_update_entry(
+            mock_config_entry, options={**original, "scopes": {}}
+        )
+        await hass.async_block_till_done()
+        hass.config_entries.async_update_entry(mock_config_entry, options=original)
+        await hass.async_block_till_done()
+        assert compile_mock.call_count == 2
+
+
+async def test_first_setup_reconciles_whole_registry(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Without a previous blueprint, stale entities are still disabled."""
+    mock_config_entry.add_to_hass(hass)
+    ent_reg = er.async_get(hass)
+    stale = ent_reg.async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{mock_config_entry.entry_id}_no_longer_wanted",
+        config_entry=mock_config_entry,
+    )
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert (
+        ent_reg.async_get(stale.entity_id).disabled_by
+        is er.RegistryEntryDisabler.INTEGRATION
+    )
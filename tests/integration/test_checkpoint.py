@@ -0,0 +1,213 @@
+"""Tests for the per-entry accumulator checkpoint store."""
+from __future__ import annotations
+
+import copy
+from datetime import timedelta
+from decimal import Decimal
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant, State
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
+
+from custom_components.power_insight.checkpoint import (
+    DELTA_SAVE_DELAY,
+    CheckpointStore,
+)
+from .conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    GRID_SUB_ID,
+    make_grid_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+ENTRY_ID = "checkpoint_entry"
+TOTAL_SUFFIX = f"{GRID_SUB_ID}_total_import_cost"
+
+
+def _grid_with_price() -> dict:
+    grid = copy.deepcopy(make_grid_subentry_data())
+    grid["data"]["adapter"]["config"][
+        "grid_electricity_price_entity"
+    ] = "sensor.grid_price"
+    return grid
+
+
+def _entry() -> MockConfigEntry:
+    return MockConfigEntry(
+        domain=DOMAIN,
+        entry_id=ENTRY_ID,
+        title="My PowerInsight",
+        options=FULL_OPTIONS,
+        subentries_data=[_grid_with_price()],
+    )
+
+
+def _entity_id(hass: HomeAssistant, entry: MockConfigEntry, suffix: str) -> str:
+    ent_reg = er.async_get(hass)
+    for ent in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+        if ent.unique_id and ent.unique_id.endswith(suffix):
+            return ent.entity_id
+    raise AssertionError(f"sensor *{suffix} not found")
+
+
+# ---------------------------------------------------------------------------
+# Store round trip
+# ---------------------------------------------------------------------------
+
+async def test_checkpoint_round_trip(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    store = CheckpointStore(hass, ENTRY_ID)
+    await store.async_load()
+    store.record("a", Decimal("1.25"), Decimal("1.25"))
+    store.record("b", None, Decimal("3"))
+    await store.async_shutdown()
+
+    saved = hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint"]["data"]
+    assert saved["seq"] == 1
+    assert saved["values"]["a"] == ["1.25", "1.25"]
+    # The delta log is reset once folded into the checkpoint.
+    assert hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint_delta"]["data"] == {
+        "seq": 1,
+        "values": {},
+    }
+
+    reloaded = CheckpointStore(hass, ENTRY_ID)
+    await reloaded.async_load()
+    assert reloaded.get("a") == (Decimal("1.25"), Decimal("1.25"))
+    assert reloaded.get("b") == (None, Decimal("3"))
+    assert reloaded.get("missing") is None
+    await reloaded.async_shutdown()
+
+
+async def test_delta_applies_only_after_its_checkpoint(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{ENTRY_ID}.checkpoint",
+        "data": {"seq": 2, "values": {"a": ["1", "1"], "b": ["5", "5"]}},
+    }
+    hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint_delta"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{ENTRY_ID}.checkpoint_delta",
+        "data": {"seq": 2, "values": {"a": ["2", "2"]}},
+    }
+    store = CheckpointStore(hass, ENTRY_ID)
+    await store.async_load()
+    assert store.get("a") == (Decimal("2"), Decimal("2"))
+    assert store.get("b") == (Decimal("5"), Decimal("5"))
+    await store.async_shutdown()
+
+    # A delta left over from before the newest checkpoint is ignored.
+    hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint_delta"]["data"] = {
+        "seq": 1,
+        "values": {"a": ["9", "9"]},
+    }
+    hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint"]["data"]["values"]["a"] = ["1", "1"]
+    store = CheckpointStore(hass, ENTRY_ID)
+    await store.async_load()
+    assert store.get("a") == (Decimal("1"), Decimal("1"))
+    await store.async_shutdown()
+
+
+async def test_delta_is_written_under_continuous_load(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    store = CheckpointStore(hass, ENTRY_ID)
+    await store.async_load()
+    key = f"{DOMAIN}.{ENTRY_ID}.checkpoint_delta"
+    start = dt_util.utcnow()
+
+    # A step every 5 s: rescheduling the write per step would postpone it forever.
+    for second in range(0, DELTA_SAVE_DELAY + 1, 5):
+        async_fire_time_changed(hass, start + timedelta(seconds=second))
+        await hass.async_block_till_done()
+        store.record("a", Decimal(second), Decimal(second))
+
+    # Written one delay after the first step, with the steps up to then.
+    last = str(DELTA_SAVE_DELAY - 5)
+    assert hass_storage[key]["data"]["values"] == {"a": [last, last]}
+    await store.async_shutdown()
+
+
+# ---------------------------------------------------------------------------
+# Sensors
+# ---------------------------------------------------------------------------
+
+async def test_sensor_restores_from_checkpoint(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint"] = {
+        "version": 1,
+        "key": f"{DOMAIN}.{ENTRY_ID}.checkpoint",
+        "data": {
+            "seq": 1,
+            "values": {f"{ENTRY_ID}_{TOTAL_SUFFIX}": ["12.5", "12.5"]},
+        },
+    }
+    entry = _entry()
+    await setup_integration(hass, entry)
+
+    state = hass.states.get(_entity_id(hass, entry, TOTAL_SUFFIX))
+    assert float(state.state) == pytest.approx(12.5)
+
+
+async def test_set_value_is_checkpointed_on_unload(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    entry = _entry()
+    await setup_integration(hass, entry)
+
+    await hass.services.async_call(
+        DOMAIN,
+        "set_value",
+        {"value": 42.0},
+        target={"entity_id": _entity_id(hass, entry, TOTAL_SUFFIX)},
+        blocking=True,
+    )
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    values = hass_storage[f"{DOMAIN}.{ENTRY_ID}.checkpoint"]["data"]["values"]
+    assert values[f"{ENTRY_ID}_{TOTAL_SUFFIX}"] == ["42.0", "42.0"]
+
+
+async def test_sensor_without_checkpoint_restores_from_restore_state(
+    hass: HomeAssistant,
+) -> None:
+    """Without a checkpoint the sensor falls back to the RestoreEntity data."""
+    entry = _entry()
+    entry.add_to_hass(hass)
+    registered = er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{ENTRY_ID}_{TOTAL_SUFFIX}",
+        config_entry=entry,
+        suggested_object_id="grid_total_import_cost",
+    )
+    mock_restore_cache_with_extra_data(
+        hass,
+        [(
+            State(registered.entity_id, "7.5"),
+            {
+                "native_value": 7.5,
+                "native_unit_of_measurement": "EUR",
+                "last_valid_state": "7.5",
+            },
+        )],
+    )
+
+    await setup_integration(hass, entry)
+
+    assert float(hass.states.get(registered.entity_id).state) == pytest.approx(7.5)
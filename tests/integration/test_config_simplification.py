@@ -3,7 +3,7 @@ from __future__ import annotations
 
 import pytest
 
-from custom_components.power_insight.config_flow import (
+from custom_components.power_insight.flow_helpers import (
     BATTERY_FIELDS,
     PV_SYSTEM_FIELDS,
     PRESET_SELECTIONS,
@@ -8,11 +8,11 @@ from homeassistant.core import HomeAssistant
 from homeassistant.helpers import entity_registry as er
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.power_insight.config_flow import (
+from custom_components.power_insight.flow_helpers import (
     build_schema,
     PV_SYSTEM_FIELDS,
 )
-from custom_components.power_insight.sensor import _resolve_currency_unit
+from custom_components.power_insight.units import UnitResolver, resolve_currency_unit
 from .conftest import (
     DOMAIN,
     FULL_OPTIONS,
@@ -35,23 +35,23 @@ def _unit(hass: HomeAssistant, entry: MockConfigEntry, suffix: str) -> str | Non
 
 
 # ---------------------------------------------------------------------------
-# _resolve_currency_unit (pure helper)
+# resolve_currency_unit (pure helper)
 # ---------------------------------------------------------------------------
 
-def test_resolve_currency_unit_substitutes() -> None:
+def testresolve_currency_unit_substitutes() -> None:
     hass = types.SimpleNamespace(config=types.SimpleNamespace(currency="GBP"))
-    assert _resolve_currency_unit("EUR/h", hass) == "GBP/h"
-    assert _resolve_currency_unit("EUR/kWh", hass) == "GBP/kWh"
-    assert _resolve_currency_unit("EUR", hass) == "GBP"
+    assert resolve_currency_unit("EUR/h", hass) == "GBP/h"
+    assert resolve_currency_unit("EUR/kWh", hass) == "GBP/kWh"
+    assert resolve_currency_unit("EUR", hass) == "GBP"
     # Non-currency units are untouched.
-    assert _resolve_currency_unit("W", hass) == "W"
+    assert resolve_currency_unit("W", hass) == "W"
 
 
-def test_resolve_currency_unit_falls_back_to_eur() -> None:
+def testresolve_currency_unit_falls_back_to_eur() -> None:
     # No hass / no configured currency keeps the literal placeholder.
-    assert _resolve_currency_unit("EUR/h", None) == "EUR/h"
+    assert resolve_currency_unit("EUR/h", None) == "EUR/h"
     hass = types.SimpleNamespace(config=types.SimpleNamespace(currency=None))
-    assert _resolve_currency_unit("EUR/h", hass) == "EUR/h"
+    assert resolve_currency_unit("EUR/h", hass) == "EUR/h"
 
 
 # ---------------------------------------------------------------------------
@@ -114,3 +114,42 @@ def test_money_selectors_default_currency() -> None:
     assert _selector_for(schema, "lifetime_cost").config[
         "unit_of_measurement"
     ] == "EUR"
+
+
+# ---------------------------------------------------------------------------
+# UnitResolver (per-entry cache)
+# ---------------------------------------------------------------------------
+
+async def test_unit_resolver_refreshes_on_currency_change(hass: HomeAssistant) -> None:
+    await hass.config.async_update(currency="GBP")
+    resolver = UnitResolver(hass)
+    unsub = resolver.async_start()
+    assert resolver.resolve("EUR/h") == "GBP/h"
+
+    # Other core config changes keep the cache.
+    await hass.config.async_update(time_zone="Europe/London")
+    await hass.async_block_till_done()
+    assert resolver._units == {"EUR/h": "GBP/h"}
+
+    await hass.config.async_update(currency="USD")
+    await hass.async_block_till_done()
+    assert resolver.resolve("EUR/h") == "USD/h"
+    unsub()
+
+
+async def test_sensor_units_follow_a_currency_change(hass: HomeAssistant) -> None:
+    """A currency change republishes money units without a reload or new value."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=FULL_OPTIONS,
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "-50", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    assert _unit(hass, entry, f"{PV_SUB_ID}_operating_cost_rate") == "EUR/h"
+
+    await hass.config.async_update(currency="USD")
+    await hass.async_block_till_done()
+    assert _unit(hass, entry, f"{PV_SUB_ID}_operating_cost_rate") == "USD/h"
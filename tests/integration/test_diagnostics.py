@@ -0,0 +1,82 @@
+"""Tests for the performance sections of the config entry diagnostics."""
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight.diagnostics import (
+    async_get_config_entry_diagnostics,
+)
+from .conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def test_diagnostics_report_hot_path_counters(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=FULL_OPTIONS,
+        subentries_data=[make_grid_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "1000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+
+    hass.states.async_set("sensor.grid_power", "1200", {"unit_of_measurement": "W"})
+    for _ in range(4):
+        await hass.async_block_till_done()
+
+    performance = (await async_get_config_entry_diagnostics(hass, entry))["performance"]
+    assert performance["ticks"] == 1
+    assert performance["counters"]["source_state_changed"] == 1
+    assert performance["writes_by_class"]["PowerInsightAdapterSensor"]["count"] > 0
+    assert performance["properties"]
+    assert performance["slowest_recent_ticks"] == []
+
+
+async def test_diagnostics_estimate_live_memory(hass: HomeAssistant) -> None:
+    small = MockConfigEntry(
+        domain=DOMAIN,
+        title="Small",
+        options=FULL_OPTIONS,
+        subentries_data=[make_grid_subentry_data()],
+    )
+    large = MockConfigEntry(
+        domain=DOMAIN,
+        title="Large",
+        options=FULL_OPTIONS,
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "2000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, small)
+    await setup_integration(hass, large)
+
+    memory = {}
+    for entry in (small, large):
+        memory[entry.title] = (await async_get_config_entry_diagnostics(hass, entry))[
+            "memory"
+        ]
+        entity_count = len(
+            er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        )
+        assert memory[entry.title]["sensors"] == entity_count
+        assert memory[entry.title]["event_trackers_bytes"] > 0
+        assert memory[entry.title]["total_bytes"] == sum(
+            memory[entry.title][part]
+            for part in ("power_insight_bytes", "event_trackers_bytes", "sensors_bytes")
+        )
+
+    # Each entry is measured on its own: the other entry's objects are excluded.
+    for part in ("power_insight_bytes", "sensors_bytes"):
+        assert memory["Small"][part] < memory["Large"][part]
+    # Whole sensors are a few KiB each, not the whole core.
+    assert 1_000 < memory["Large"]["bytes_per_sensor"] < 100_000
@@ -0,0 +1,117 @@
+"""Tests for the grouped consumer source-share sensor."""
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight.flow_helpers import (
+    scope_leaves_to_ui_defaults,
+    scope_ui_to_leaves,
+)
+from custom_components.power_insight.sensor import PowerInsightSourceSharesSensor
+from .conftest import (
+    BASE_OPTIONS,
+    CONS_SUB_ID,
+    DOMAIN,
+    PV_SUB_ID,
+    make_consumer_subentry_data,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+PV2_SUB_ID = "01PV0000000000000000000002"
+
+
+async def _setup(
+    hass: HomeAssistant, consumer_leaves: list[str], *extra_subentries: dict
+) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={
+            **BASE_OPTIONS,
+            "scopes": {**BASE_OPTIONS["scopes"], "consumer": consumer_leaves},
+        },
+        subentries_data=[
+            make_grid_subentry_data(),
+            make_pv_subentry_data(),
+            make_consumer_subentry_data(),
+            *extra_subentries,
+        ],
+    )
+    hass.states.async_set("sensor.grid_power", "1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv2_power", "0", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.consumer_power", "500", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    return entry
+
+
+def _consumer_unique_ids(hass: HomeAssistant, entry: MockConfigEntry) -> set[str]:
+    prefix = f"{entry.entry_id}_{CONS_SUB_ID}_"
+    return {
+        e.unique_id.removeprefix(prefix)
+        for e in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if e.unique_id.startswith(prefix) and e.disabled_by is None
+    }
+
+
+async def test_grouped_sensor_replaces_per_source_entities(hass: HomeAssistant) -> None:
+    entry = await _setup(
+        hass, ["enable_power_source_shares", "group_power_source_shares"]
+    )
+
+    assert _consumer_unique_ids(hass, entry) == {"local_power_share"}
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{CONS_SUB_ID}_local_power_share"
+    )
+    state = hass.states.get(entity_id)
+    # Half of the home's 2000 W comes from the PV system.
+    assert float(state.state) == pytest.approx(50)
+    assert state.attributes["source_shares"] == {"Grid": 50.0, "Solar PV": 50.0}
+    # Changes every tick: kept out of the recorder.
+    assert "source_shares" in PowerInsightSourceSharesSensor._unrecorded_attributes
+
+
+async def test_same_named_sources_are_kept_apart(hass: HomeAssistant) -> None:
+    second_pv = make_pv_subentry_data(PV2_SUB_ID, "sensor.pv2_power")
+    entry = await _setup(
+        hass,
+        ["enable_power_source_shares", "group_power_source_shares"],
+        second_pv,
+    )
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{CONS_SUB_ID}_local_power_share"
+    )
+    shares = hass.states.get(entity_id).attributes["source_shares"]
+    assert len(shares) == 3
+    assert shares["Grid"] == pytest.approx(50)
+    assert sorted(name for name in shares if name.startswith("Solar PV (")) == [
+        f"Solar PV ({uid})" for uid in sorted((PV_SUB_ID, PV2_SUB_ID))
+    ]
+
+
+async def test_per_source_entities_by_default(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, ["enable_power_source_shares"])
+
+    assert _consumer_unique_ids(hass, entry) == {
+        "power_share_from_Grid",
+        "power_share_from_Solar PV",
+    }
+
+
+def test_group_option_round_trips_through_the_form() -> None:
+    leaves = scope_ui_to_leaves(
+        "consumer",
+        {"power_source_shares": True, "group_power_source_shares": True},
+    )
+    assert leaves == ["enable_power_source_shares", "group_power_source_shares"]
+    assert scope_leaves_to_ui_defaults("consumer", set(leaves))[
+        "group_power_source_shares"
+    ] is True
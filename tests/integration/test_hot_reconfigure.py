@@ -0,0 +1,123 @@
+"""Tests for applying settings-only reconfigurations without a reload."""
+from __future__ import annotations
+
+import copy
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    PV_SUB_ID,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def _setup(hass: HomeAssistant, **options) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={**FULL_OPTIONS, **options},
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "-1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "2000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    return entry
+
+
+def _update_pv_config(hass: HomeAssistant, entry: MockConfigEntry, **changes) -> None:
+    subentry = entry.subentries[PV_SUB_ID]
+    data = copy.deepcopy(dict(subentry.data))
+    data["adapter"]["config"].update(changes)
+    hass.config_entries.async_update_subentry(entry, subentry, data=data)
+
+
+def _state(hass: HomeAssistant, entry: MockConfigEntry, suffix: str) -> float:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{suffix}"
+    )
+    return float(hass.states.get(entity_id).state)
+
+
+async def test_export_compensation_is_applied_in_place(hass: HomeAssistant) -> None:
+    entry = await _setup(hass)
+    engine = entry.runtime_data.power_insight
+    suffix = f"{PV_SUB_ID}_export_compensation_rate"
+    # 1 kW exported at 0.08 EUR/kWh.
+    assert _state(hass, entry, suffix) == pytest.approx(0.08)
+
+    _update_pv_config(hass, entry, export_compensation=0.10)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.power_insight is engine  # no reload
+    assert _state(hass, entry, suffix) == pytest.approx(0.10)
+
+
+async def test_hot_update_keeps_the_latency_sensors(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, latency_entities=True)
+    engine = entry.runtime_data.power_insight
+
+    _update_pv_config(hass, entry, export_compensation=0.10)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.power_insight is engine  # no reload
+    assert er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_tick_rate"
+    ) is not None
+
+
+async def test_correction_factor_rescales_totals_in_place(hass: HomeAssistant) -> None:
+    entry = await _setup(hass)
+    engine = entry.runtime_data.power_insight
+    per_adapter = f"{PV_SUB_ID}_total_levelized_operating_cost"
+    per_adapter_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{per_adapter}"
+    )
+    await hass.services.async_call(
+        DOMAIN,
+        "set_value",
+        {"value": 10.0},
+        target={"entity_id": per_adapter_id},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+
+    _update_pv_config(hass, entry, correction_factor=1.5)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.power_insight is engine
+    assert _state(hass, entry, per_adapter) == pytest.approx(15.0, abs=1e-3)
+    assert _state(
+        hass, entry, "combined_total_levelized_operating_cost"
+    ) == pytest.approx(15.0, abs=1e-3)
+
+
+async def test_change_to_the_sensor_set_reloads(hass: HomeAssistant) -> None:
+    entry = await _setup(hass)
+    engine = entry.runtime_data.power_insight
+
+    # Without export the export sensors disappear: not a settings-only change.
+    _update_pv_config(hass, entry, exports_power=False)
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.power_insight is not engine
+
+
+async def test_options_change_reloads(hass: HomeAssistant) -> None:
+    entry = await _setup(hass)
+    engine = entry.runtime_data.power_insight
+
+    hass.config_entries.async_update_entry(
+        entry, options={**FULL_OPTIONS, "debug_power_entities": True}
+    )
+    await hass.async_block_till_done()
+
+    assert entry.runtime_data.power_insight is not engine
@@ -0,0 +1,118 @@
+"""Tests for the accumulator integration methods (incl. Simpson / spline)."""
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from decimal import Decimal
+import math
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight.entity import (
+    INTEGRATION_METHODS,
+    BaseEventIntegrationSensorEntity,
+    _IntegrationMethod,
+)
+from custom_components.power_insight.power_insight import PowerInsight
+from .conftest import BASE_OPTIONS, DOMAIN, make_grid_subentry_data
+
+T0 = datetime(2026, 6, 21, 6, 0, tzinfo=UTC)
+
+
+class _Accumulator(BaseEventIntegrationSensorEntity):
+    """Accumulator fed from a plain attribute, with timers and writes stubbed."""
+
+    def __init__(self, method: str) -> None:
+        super().__init__(
+            [], PowerInsight(), max_sub_interval=None, integration_method=method
+        )
+        self.rate: float | None = None
+
+    @property
+    def integration_value(self) -> float | None:
+        return self.rate
+
+    def async_write_ha_state(self) -> None:
+        pass
+
+
+def _integrate(method: str, samples: list[tuple[float, float]]) -> float:
+    """Feed ``(hours, rate)`` samples through an accumulator; return the total."""
+    sensor = _Accumulator(method)
+    for hours, rate in samples:
+        sensor.rate = rate
+        sensor._handle_integration_event(T0 + timedelta(hours=hours))
+    return float(sensor._state)
+
+
+def _pv_curve(hours: float) -> float:
+    """A clear-sky PV production profile (kW) over a 12 h day."""
+    return 5 * math.sin(math.pi * hours / 12)
+
+
+def test_simpson_is_exact_for_quadratic_with_uneven_spacing() -> None:
+    method = _IntegrationMethod.from_name("simpson")
+    # y = t² sampled at t = 0, 1, 3: integral over [1, 3] is 26/3.
+    history = [(Decimal(0), Decimal(0)), (Decimal(1), Decimal(1))]
+    area = method.calculate_area_with_history(
+        history, Decimal(2), Decimal(1), Decimal(9)
+    )
+    assert float(area) == pytest.approx(26 / 3)
+
+
+def test_spline_is_exact_for_linear_rates() -> None:
+    method = _IntegrationMethod.from_name("spline")
+    history = [(Decimal(t), Decimal(2 * t + 1)) for t in (0, 1, 2)]
+    area = method.calculate_area_with_history(
+        history, Decimal(1), Decimal(5), Decimal(7)
+    )
+    assert area == Decimal(6)
+
+
+@pytest.mark.parametrize("method", ["simpson", "spline"])
+def test_higher_order_beats_trapezoidal_on_pv_curve(method: str) -> None:
+    # Hourly samples of a curved production profile.
+    samples = [(h, _pv_curve(h)) for h in range(13)]
+    exact = 5 * 24 / math.pi
+    trapezoid_error = abs(_integrate("trapezoidal", samples) - exact)
+    method_error = abs(_integrate(method, samples) - exact)
+    assert method_error < trapezoid_error / 2
+
+
+@pytest.mark.parametrize("method", INTEGRATION_METHODS)
+def test_constant_rate_is_exact_for_every_method(method: str) -> None:
+    samples = [(h * 0.5, 2.0) for h in range(5)]
+    assert _integrate(method, samples) == pytest.approx(4.0)
+
+
+def test_unavailable_value_restarts_history() -> None:
+    sensor = _Accumulator("spline")
+    for hours, rate in [(0, 1.0), (1, 2.0), (2, None), (3, 4.0)]:
+        sensor.rate = rate
+        sensor._handle_integration_event(T0 + timedelta(hours=hours))
+    assert len(sensor._history) == 1
+
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_options_flow_saves_integration_method(hass: HomeAssistant) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=BASE_OPTIONS,
+        subentries_data=[make_grid_subentry_data()],
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={
+            "preset": "minimal",
+            "debug_power_entities": False,
+            "accumulation": {"integration_method": "simpson"},
+        },
+    )
+    assert result["type"] == FlowResultType.CREATE_ENTRY
+    assert entry.options["integration_method"] == "simpson"
@@ -0,0 +1,91 @@
+"""Tests for the optional latency diagnostic sensors."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from .conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+KEYS = ("tick_rate", "evaluation_time_mean", "evaluation_time_p95", "write_rate")
+
+
+async def _setup(hass: HomeAssistant, latency: bool) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={**FULL_OPTIONS, "latency_entities": latency},
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "-1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "2000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    return entry
+
+
+def _entity_id(hass: HomeAssistant, entry: MockConfigEntry, key: str) -> str | None:
+    return er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{key}"
+    )
+
+
+async def _poll(hass: HomeAssistant, minutes: int) -> None:
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=minutes))
+    await hass.async_block_till_done()
+
+
+async def test_latency_sensors_report_the_window(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, latency=True)
+    ent_reg = er.async_get(hass)
+    entity_ids = {key: _entity_id(hass, entry, key) for key in KEYS}
+    for entity_id in entity_ids.values():
+        assert ent_reg.async_get(entity_id).entity_category is EntityCategory.DIAGNOSTIC
+        assert hass.states.get(entity_id).state == "unknown"
+
+    for watts in range(1100, 1600, 100):
+        hass.states.async_set(
+            "sensor.grid_power", f"-{watts}", {"unit_of_measurement": "W"}
+        )
+        for _ in range(4):
+            await hass.async_block_till_done()
+    await _poll(hass, 1)
+
+    state = {key: hass.states.get(entity_id) for key, entity_id in entity_ids.items()}
+    assert float(state["tick_rate"].state) > 0
+    assert float(state["write_rate"].state) > 0
+    assert float(state["evaluation_time_mean"].state) > 0
+    assert float(state["evaluation_time_p95"].state) > 0
+    assert state["evaluation_time_p95"].attributes["unit_of_measurement"] == "ms"
+
+
+async def test_latency_sensors_do_not_count_themselves(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, latency=True)
+    stats = entry.runtime_data.power_insight.instrumentation
+
+    await _poll(hass, 1)
+    await _poll(hass, 2)
+
+    assert float(hass.states.get(_entity_id(hass, entry, "tick_rate")).state) == 0
+    assert "PowerInsightLatencySensor" not in stats.writes
+
+
+async def test_latency_sensors_are_off_by_default(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, latency=False)
+
+    assert all(_entity_id(hass, entry, key) is None for key in KEYS)
@@ -0,0 +1,90 @@
+"""Tests for the lazily refreshed distribution sensors."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from .conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    PV_SUB_ID,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def _setup(hass: HomeAssistant, lazy: bool) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={**FULL_OPTIONS, "lazy_distribution_sensors": lazy},
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "-1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "2000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    return entry
+
+
+async def _export_more(hass: HomeAssistant) -> None:
+    """Export 1500 W of the 2000 W produced (was 1000 W)."""
+    hass.states.async_set("sensor.grid_power", "-1500", {"unit_of_measurement": "W"})
+    # engine -> custom event -> coalesced sensor write: flush a few times.
+    for _ in range(4):
+        await hass.async_block_till_done()
+
+
+def _state(hass: HomeAssistant, entry: MockConfigEntry, key: str) -> float:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{PV_SUB_ID}_{key}"
+    )
+    return float(hass.states.get(entity_id).state)
+
+
+async def test_distribution_sensors_refresh_on_the_lazy_cadence(
+    hass: HomeAssistant,
+) -> None:
+    entry = await _setup(hass, lazy=True)
+    assert _state(hass, entry, "self_consumption_power") == pytest.approx(1000)
+
+    await _export_more(hass)
+    # Money sensors stay on the hot path; distribution sensors wait.
+    assert _state(hass, entry, "export_compensation_rate") == pytest.approx(0.12)
+    assert _state(hass, entry, "self_consumption_power") == pytest.approx(1000)
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(minutes=5, seconds=1))
+    await hass.async_block_till_done()
+    assert _state(hass, entry, "self_consumption_power") == pytest.approx(500)
+
+
+async def test_update_entity_refreshes_a_lazy_sensor(hass: HomeAssistant) -> None:
+    await async_setup_component(hass, "homeassistant", {})
+    entry = await _setup(hass, lazy=True)
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{PV_SUB_ID}_self_consumption_power"
+    )
+
+    await _export_more(hass)
+    await hass.services.async_call(
+        "homeassistant", "update_entity", {"entity_id": entity_id}, blocking=True
+    )
+    assert float(hass.states.get(entity_id).state) == pytest.approx(500)
+
+
+async def test_distribution_sensors_are_eager_by_default(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, lazy=False)
+
+    await _export_more(hass)
+    assert _state(hass, entry, "self_consumption_power") == pytest.approx(500)
@@ -0,0 +1,108 @@
+"""Tests for the in-memory levelized ledger behind the combined totals."""
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.power_insight.const import CONF_RETIRED_ADAPTERS
+from custom_components.power_insight.ledger import LevelizedLedger
+from .conftest import (
+    DOMAIN,
+    PV_SUB_ID,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+KEY = "total_levelized_operating_cost"
+
+
+def _retired(total: float) -> list[dict]:
+    return [{"subentry_id": "old", "title": "Old PV", "totals": {KEY: total}}]
+
+
+# ---------------------------------------------------------------------------
+# LevelizedLedger
+# ---------------------------------------------------------------------------
+
+def test_running_sum_tracks_updates_and_removals() -> None:
+    ledger = LevelizedLedger(MockConfigEntry(domain=DOMAIN))
+    calls: list[None] = []
+    ledger.async_add_listener(KEY, lambda: calls.append(None))
+
+    ledger.update(KEY, "a", Decimal("1.5"))
+    ledger.update(KEY, "b", Decimal("2"))
+    ledger.update(KEY, "a", Decimal("2.5"))
+    assert ledger.total(KEY) == pytest.approx(4.5)
+
+    ledger.update(KEY, "b", Decimal("2"))  # unchanged: no notification
+    assert len(calls) == 3
+
+    ledger.remove(KEY, "a")
+    assert ledger.total(KEY) == pytest.approx(2.0)
+    assert ledger.total("other_key") == 0.0
+
+
+async def test_retired_total_is_cached_until_the_list_changes(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_RETIRED_ADAPTERS: _retired(5.0)})
+    entry.add_to_hass(hass)
+    ledger = LevelizedLedger(entry)
+    assert ledger.total(KEY) == pytest.approx(5.0)
+
+    # In-place edits are not seen; updates always replace the list.
+    entry.data[CONF_RETIRED_ADAPTERS][0]["totals"][KEY] = 9.0
+    assert ledger.retired_total(KEY) == pytest.approx(5.0)
+
+    hass.config_entries.async_update_entry(
+        entry, data={CONF_RETIRED_ADAPTERS: _retired(7.0)}
+    )
+    assert ledger.retired_total(KEY) == pytest.approx(7.0)
+
+
+# ---------------------------------------------------------------------------
+# Sensors
+# ---------------------------------------------------------------------------
+
+@pytest.mark.usefixtures("enable_custom_integrations")
+async def test_combined_sensor_follows_per_adapter_set_value(
+    hass: HomeAssistant,
+) -> None:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={
+            "schema": 2,
+            "scopes": {
+                "combined": ["accumulate_levelized_cost_rates"],
+                "pv_system": ["accumulate_levelized_cost_rates"],
+            },
+        },
+        data={CONF_RETIRED_ADAPTERS: _retired(10.0)},
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    await setup_integration(hass, entry)
+
+    ent_reg = er.async_get(hass)
+    per_adapter = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{PV_SUB_ID}_{KEY}"
+    )
+    combined = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_combined_{KEY}"
+    )
+
+    # No source event: the ledger push alone refreshes the combined total.
+    await hass.services.async_call(
+        DOMAIN,
+        "set_value",
+        {"value": 2.5},
+        target={"entity_id": per_adapter},
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    assert float(hass.states.get(combined).state) == pytest.approx(12.5)
@@ -0,0 +1,97 @@
+"""Tests for the ``power_insight.profile`` service."""
+from __future__ import annotations
+
+import cProfile
+import os
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import (
+    DOMAIN,
+    FULL_OPTIONS,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def _setup(hass: HomeAssistant) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options=FULL_OPTIONS,
+        subentries_data=[make_grid_subentry_data(), make_pv_subentry_data()],
+    )
+    hass.states.async_set("sensor.grid_power", "-1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "2000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    return entry
+
+
+async def test_profile_writes_pstats_and_summarizes(hass: HomeAssistant) -> None:
+    entry = await _setup(hass)
+    for i in range(5):
+        hass.loop.call_later(
+            0.1 * (i + 1),
+            hass.states.async_set,
+            "sensor.pv_power",
+            str(2100 + i),
+            {"unit_of_measurement": "W"},
+        )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "profile",
+        {"config_entry_id": entry.entry_id, "duration": 1},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert os.path.isfile(response["file"])
+    assert response["file"].startswith(hass.config.config_dir)
+    assert response["counters"]["ticks"] == 5
+    assert response["top_properties"]
+    callbacks = [row["function"] for row in response["top_callbacks"]]
+    assert any("_flush_write" in function for function in callbacks)
+    assert not any(function.startswith("instrumentation.py") for function in callbacks)
+    os.remove(response["file"])
+
+
+async def test_profile_rejects_unknown_entry(hass: HomeAssistant) -> None:
+    await _setup(hass)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "profile",
+            {"config_entry_id": "missing", "duration": 1},
+            blocking=True,
+            return_response=True,
+        )
+
+
+async def test_profile_while_another_profiler_is_active(hass: HomeAssistant) -> None:
+    entry = await _setup(hass)
+    data = {"config_entry_id": entry.entry_id, "duration": 1}
+
+    other = cProfile.Profile()
+    other.enable()
+    try:
+        with pytest.raises(HomeAssistantError) as err:
+            await hass.services.async_call(
+                DOMAIN, "profile", data, blocking=True, return_response=True
+            )
+    finally:
+        other.disable()
+    assert err.value.translation_key == "profiler_busy"
+
+    # The failed run does not leave the service marked as busy.
+    response = await hass.services.async_call(
+        DOMAIN, "profile", data, blocking=True, return_response=True
+    )
+    os.remove(response["file"])
@@ -0,0 +1,104 @@
+"""Tests for the optional result-table snapshot sensor."""
+from __future__ import annotations
+
+import pytest
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from .conftest import (
+    CONS_SUB_ID,
+    DOMAIN,
+    FULL_OPTIONS,
+    PV_SUB_ID,
+    make_consumer_subentry_data,
+    make_grid_subentry_data,
+    make_pv_subentry_data,
+    setup_integration,
+)
+
+pytestmark = pytest.mark.usefixtures("enable_custom_integrations")
+
+
+async def _setup(
+    hass: HomeAssistant, snapshot: bool, *extra_subentries: dict
+) -> MockConfigEntry:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="My PowerInsight",
+        options={**FULL_OPTIONS, "snapshot_entity": snapshot},
+        subentries_data=[
+            make_grid_subentry_data(),
+            make_pv_subentry_data(),
+            *extra_subentries,
+        ],
+    )
+    hass.states.async_set("sensor.grid_power", "-1000", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.pv_power", "2000", {"unit_of_measurement": "W"})
+    await setup_integration(hass, entry)
+    return entry
+
+
+def _snapshot_id(hass: HomeAssistant, entry: MockConfigEntry) -> str | None:
+    return er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_snapshot"
+    )
+
+
+def _entity_state(hass: HomeAssistant, entry: MockConfigEntry, suffix: str) -> float:
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_{suffix}"
+    )
+    return float(hass.states.get(entity_id).state)
+
+
+async def test_snapshot_mirrors_the_measurement_sensors(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, snapshot=True)
+    state = hass.states.get(_snapshot_id(hass, entry))
+
+    assert float(state.state) == pytest.approx(2000)
+    results = state.attributes["results"]
+    assert results["combined"]["combined_export_ratio"] == pytest.approx(50)
+    pv = results["Solar PV"]
+    assert pv["self_consumption_power"] == pytest.approx(
+        _entity_state(hass, entry, f"{PV_SUB_ID}_self_consumption_power")
+    )
+    assert pv["export_compensation_rate"] == pytest.approx(0.08)
+    # Accumulated totals have their own entities and are not mirrored.
+    assert "total_levelized_operating_cost" not in pv
+
+
+async def test_snapshot_follows_source_changes(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, snapshot=True)
+    entity_id = _snapshot_id(hass, entry)
+
+    hass.states.async_set("sensor.grid_power", "-1500", {"unit_of_measurement": "W"})
+    for _ in range(4):
+        await hass.async_block_till_done()
+
+    pv = hass.states.get(entity_id).attributes["results"]["Solar PV"]
+    assert pv["self_consumption_power"] == pytest.approx(500)
+
+
+async def test_same_named_devices_are_kept_apart(hass: HomeAssistant) -> None:
+    cons2_sub_id = "01CONS0000000000000000002A"
+    hass.states.async_set("sensor.consumer_power", "400", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.consumer2_power", "600", {"unit_of_measurement": "W"})
+    entry = await _setup(
+        hass,
+        True,
+        make_consumer_subentry_data(),
+        make_consumer_subentry_data(cons2_sub_id, "sensor.consumer2_power"),
+    )
+
+    results = hass.states.get(_snapshot_id(hass, entry)).attributes["results"]
+    assert "Consumer" not in results
+    first = results[f"Consumer ({CONS_SUB_ID})"]
+    assert first
+    assert results[f"Consumer ({cons2_sub_id})"].keys() == first.keys()
+
+
+async def test_snapshot_is_off_by_default(hass: HomeAssistant) -> None:
+    entry = await _setup(hass, snapshot=False)
+
+    assert _snapshot_id(hass, entry) is None
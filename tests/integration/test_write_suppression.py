@@ -0,0 +1,81 @@
+"""Tests for display-precision-aware write suppression of accumulators."""
+from __future__ import annotations
+
+from decimal import Decimal
+from unittest.mock import patch
+
+from custom_components.power_insight import entity as entity_module
+from custom_components.power_insight.entity import (
+    MAX_WRITE_STALENESS,
+    BaseEventIntegrationSensorEntity,
+)
+from custom_components.power_insight.power_insight import PowerInsight
+
+
+class _Accumulator(BaseEventIntegrationSensorEntity):
+    """Accumulator that counts state writes instead of talking to HA."""
+
+    _attr_suggested_display_precision = 2
+
+    def __init__(self) -> None:
+        super().__init__([], PowerInsight())
+        self.hass = object()
+        self.writes = 0
+
+    @property
+    def integration_value(self) -> float | None:
+        return None
+
+    def async_write_ha_state(self) -> None:
+        self.writes += 1
+
+
+def test_unchanged_display_skips_write() -> None:
+    sensor = _Accumulator()
+    sensor._state = Decimal("1.001")
+    sensor._write_state()
+    assert sensor.writes == 1
+
+    sensor._state += Decimal("0.001")  # still shows 1.00
+    sensor._write_if_display_changed()
+    assert sensor.writes == 1
+
+    sensor._state = Decimal("1.011")  # shows 1.01
+    sensor._write_if_display_changed()
+    assert sensor.writes == 2
+
+
+def test_staleness_bound_forces_write() -> None:
+    sensor = _Accumulator()
+    sensor._state = Decimal("1")
+    with patch.object(entity_module, "monotonic", return_value=1000.0):
+        sensor._write_state()
+    later = 1000.0 + MAX_WRITE_STALENESS.total_seconds()
+    with patch.object(entity_module, "monotonic", return_value=later):
+        sensor._write_if_display_changed()
+    assert sensor.writes == 2
+
+
+def test_held_back_write_is_flushed() -> None:
+    sensor = _Accumulator()
+    sensor._state = Decimal("1")
+    sensor._write_state()
+    sensor._flush_suppressed_write()
+    assert sensor.writes == 1  # nothing held back
+
+    sensor._state += Decimal("0.0001")
+    sensor._write_if_display_changed()
+    assert sensor.writes == 1
+    sensor._flush_suppressed_write()
+    assert sensor.writes == 2
+    assert not sensor._write_suppressed
+
+
+def test_no_precision_writes_every_change() -> None:
+    sensor = _Accumulator()
+    sensor._attr_suggested_display_precision = None
+    sensor._state = Decimal("1")
+    sensor._write_state()
+    sensor._state += Decimal("0.0001")
+    sensor._write_if_display_changed()
+    assert sensor.writes == 2
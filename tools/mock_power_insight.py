@@ -39,6 +39,23 @@ Import it and drive it yourself (run Python from the repo root)::
     pi.gross_power
     pi.print_all()
 
+Sweeps — every property over a grid of inputs — are columnar (one list per
+column, one row per grid point)::
+
+    columns = pi.sweep({"pv1": range(0, 8001, 100), "bat1": [-800, 0, 800]})
+    write_columns(columns, "sweep.csv")   # or .parquet, with pyarrow installed
+
+or from the command line, with the topology as ``--grid`` / ``--pv`` /
+``--battery`` / ``--consumer`` specs (``uid,key=value,...``; lists joined with
+``+``) and one ``SLOT=VALUES`` per swept or fixed slot, where VALUES is
+``START..STOP:STEP`` (inclusive), a comma list or a single value::
+
+    python -m tools.mock_power_insight \\
+        --pv pv1,exports_power=true,export_compensation=0.08 \\
+        --battery bat1,charge_from=grid+pv1 --consumer cons1 \\
+        grid=-5000..5000:500 pv1=0..8000:100 bat1=-3000..3000:500 \\
+        cons1=-1200 grid_price=0.30 -o sweep.csv
+
 Sign convention (watts):
     grid      +import    / -export
     pv        +produce   / -standby
@@ -48,9 +65,15 @@ Sign convention (watts):
 
 from __future__ import annotations
 
+import argparse
+import csv
 import importlib.util
+import itertools
 import os
-from dataclasses import dataclass, field
+import sys
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import MISSING, dataclass, field, fields
 
 # ---------------------------------------------------------------------------
 # Load the pure-Python engine directly, bypassing all Home Assistant imports.
@@ -263,6 +286,66 @@ class MockPowerInsight(PowerInsight):
         """Slot name -> value for every slot mocked so far."""
         return dict(self._values)
 
+    def sweep(
+        self,
+        ranges: Mapping[str, Iterable[float | None]],
+        names: Iterable[str] | None = None,
+    ) -> dict[str, list]:
+        """Evaluate properties over the Cartesian grid of *ranges*; return columns.
+
+        *ranges* maps value slots to the values they take (a one-element list
+        pins a slot). The grid is walked with the last slot varying fastest,
+        and each point re-mocks only the slots that changed since the previous
+        one. *names* defaults to every property but the structural helpers.
+
+        Columns are the slots, then one per scalar property and one per leaf of
+        each per-adapter map (``name[uid]``, ``name[uid][source]``). A leaf
+        missing at some points is ``None`` there; a raising property reads as
+        its ``<raised ...>`` text, as in :meth:`print`.
+        """
+        slots = list(ranges)
+        unknown = [slot for slot in slots if slot not in self._slots]
+        if unknown:
+            raise KeyError(
+                f"unknown value slot(s) {unknown}; known: {sorted(self._slots)}"
+            )
+        if names is None:
+            names = [n for n in _engine_properties() if n not in _HELPER_PROPS]
+        names = list(names)
+
+        columns: dict[str, list] = {slot: [] for slot in slots}
+        # Properties read each other many times over; memoize them per point.
+        cls = self.__class__
+        self.__class__ = _memoizing(cls)
+        try:
+            self._sweep(slots, ranges, names, columns)
+        finally:
+            self.__class__ = cls
+            self.__dict__.pop("_memo", None)
+        return columns
+
+    def _sweep(self, slots, ranges, names, columns) -> None:
+        previous: tuple = ()
+        for row, point in enumerate(itertools.product(*ranges.values())):
+            self.mock(
+                **{
+                    slot: value
+                    for i, (slot, value) in enumerate(zip(slots, point))
+                    if not previous or previous[i] != value
+                }
+            )
+            previous = point
+            for slot, value in zip(slots, point):
+                columns[slot].append(value)
+            for name in names:
+                for column, value in _flatten(name, self._value_of(name)):
+                    if column not in columns:
+                        columns[column] = [None] * row
+                    columns[column].append(value)
+            for values in columns.values():
+                if len(values) == row:
+                    values.append(None)
+
     # -- printing helpers ---------------------------------------------------
 
     def _value_of(self, name: str) -> object:
@@ -375,3 +458,220 @@ def _fmt(value: object) -> str:
     if isinstance(value, float):
         return f"{value:.6g}"
     return repr(value)
+
+
+_memoizing_classes: dict[type, type] = {}
+
+
+def _memoizing(cls: type) -> type:
+    """Return a subclass of *cls* whose engine properties are cached.
+
+    The cache is keyed on ``generation``, like the integration's
+    ``ResultTable``, but also serves the engine's reads of its own properties,
+    which is where a single evaluation spends most of its time.
+    """
+    if cls not in _memoizing_classes:
+        namespace = {
+            name: property(_memo_getter(name, getattr(cls, name).fget))
+            for name in _engine_properties()
+        }
+        _memoizing_classes[cls] = type(f"Memoizing{cls.__name__}", (cls,), namespace)
+    return _memoizing_classes[cls]
+
+
+def _memo_getter(name: str, fget):
+    def get(self):
+        memo = self.__dict__.get("_memo")
+        if memo is None or memo[0] != self.generation:
+            memo = self._memo = (self.generation, {})
+        values = memo[1]
+        if name not in values:
+            values[name] = fget(self)
+        return values[name]
+
+    return get
+
+
+def _flatten(name: str, value: object) -> Iterator[tuple[str, object]]:
+    """Yield ``(column, value)`` for a scalar, or each leaf of a nested map."""
+    if isinstance(value, dict):
+        for key, inner in value.items():
+            yield from _flatten(f"{name}[{key}]", inner)
+    else:
+        yield name, value
+
+
+# ---------------------------------------------------------------------------
+# Columnar output and the sweep command line.
+# ---------------------------------------------------------------------------
+
+
+def write_columns(columns: Mapping[str, list], path: str) -> None:
+    """Write sweep *columns* to *path*: CSV, Parquet (``.parquet``) or ``-``.
+
+    ``-`` writes CSV to stdout. Parquet needs ``pyarrow``; columns that mix
+    numbers with ``<raised ...>`` texts are stored as strings there.
+    """
+    if path.endswith(".parquet"):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as err:
+            raise ImportError("writing Parquet needs pyarrow (pip install pyarrow)") from err
+        pq.write_table(
+            pa.table({name: _uniform(values) for name, values in columns.items()}),
+            path,
+        )
+        return
+
+    def write(file) -> None:
+        writer = csv.writer(file)
+        writer.writerow(columns)
+        writer.writerows(
+            ["" if value is None else value for value in row]
+            for row in zip(*columns.values())
+        )
+
+    if path == "-":
+        write(sys.stdout)
+    else:
+        with open(path, "w", newline="", encoding="utf-8") as file:
+            write(file)
+
+
+def _uniform(values: list) -> list:
+    if any(isinstance(v, str) for v in values) and not all(
+        v is None or isinstance(v, str) for v in values
+    ):
+        return [None if v is None else str(v) for v in values]
+    return values
+
+
+def parse_values(spec: str) -> list[float | None]:
+    """Parse ``START..STOP:STEP`` (inclusive), ``a,b,c`` or one value.
+
+    ``none`` stands for an unavailable sensor.
+    """
+    if ".." in spec:
+        bounds, _, step_text = spec.partition(":")
+        start_text, _, stop_text = bounds.partition("..")
+        start, stop = float(start_text), float(stop_text)
+        step = float(step_text) if step_text else 0.0
+        if step <= 0 or stop < start:
+            raise ValueError(
+                f"range {spec!r} needs START <= STOP and a positive :STEP"
+            )
+        # Count the points instead of accumulating the step: no float drift.
+        count = int(round((stop - start) / step)) + 1
+        return [start + i * step for i in range(count)]
+    return [
+        None if item.strip().lower() == "none" else float(item)
+        for item in spec.split(",")
+    ]
+
+
+def parse_config(cls: type, spec: str) -> Grid | Pv | Battery | Consumer:
+    """Build an adapter config from ``uid,key=value,...`` (no uid for Grid)."""
+    parts = [part for part in spec.split(",") if part] if spec else []
+    kwargs: dict[str, object] = {}
+    if cls is not Grid:
+        if not parts or "=" in parts[0]:
+            raise ValueError(f"{cls.__name__} spec {spec!r} must start with its uid")
+        kwargs["uid"] = parts.pop(0)
+    types = {f.name: f for f in fields(cls)}
+    for part in parts:
+        key, sep, text = part.partition("=")
+        if not sep or key not in types or key == "uid":
+            raise ValueError(
+                f"bad {cls.__name__} setting {part!r}; "
+                f"known: {sorted(k for k in types if k != 'uid')}"
+            )
+        try:
+            kwargs[key] = _coerce(types[key], text)
+        except ValueError:
+            raise ValueError(f"bad {cls.__name__} setting {part!r}") from None
+    return cls(**kwargs)
+
+
+def _coerce(config_field, text: str) -> object:
+    # Annotations are strings here (``from __future__ import annotations``).
+    annotation = str(config_field.type)
+    if text.lower() == "none" and "None" in annotation:
+        return None
+    if annotation.startswith("bool"):
+        return text.lower() in ("1", "true", "yes", "on")
+    if annotation.startswith("list") or config_field.default_factory is not MISSING:
+        return [item for item in text.split("+") if item]
+    if annotation.startswith("float"):
+        return float(text)
+    return text
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Sweep the engine over a grid of input values (see the module docstring)."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tools.mock_power_insight",
+        description="Evaluate every engine property over a Cartesian grid of "
+        "input values and write the results as columns.",
+    )
+    parser.add_argument("--grid", default="", metavar="SPEC", help="grid settings")
+    for name in ("pv", "battery", "consumer"):
+        parser.add_argument(
+            f"--{name}", action="append", default=[], metavar="SPEC",
+            help=f"add a {name} adapter: uid[,key=value,...]",
+        )
+    parser.add_argument(
+        "values", nargs="+", metavar="SLOT=VALUES",
+        help="START..STOP:STEP, a comma list or one value per slot",
+    )
+    parser.add_argument(
+        "-p", "--property", action="append", dest="names", metavar="NAME",
+        help="evaluate only these properties (repeatable)",
+    )
+    parser.add_argument(
+        "--all", action="store_true", help="include the structural helpers"
+    )
+    parser.add_argument(
+        "-o", "--output", default="-", help="CSV or .parquet file; - for stdout"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        pi = MockPowerInsight(
+            parse_config(Grid, args.grid),
+            *(parse_config(Pv, spec) for spec in args.pv),
+            *(parse_config(Battery, spec) for spec in args.battery),
+            *(parse_config(Consumer, spec) for spec in args.consumer),
+        )
+        ranges: dict[str, list[float | None]] = {}
+        for item in args.values:
+            slot, sep, spec = item.partition("=")
+            if not sep:
+                raise ValueError(f"expected SLOT=VALUES, got {item!r}")
+            try:
+                ranges[slot] = parse_values(spec)
+            except ValueError as err:
+                raise ValueError(f"{item!r}: {err}") from None
+    except ValueError as err:
+        parser.error(str(err))
+
+    names = args.names
+    if names is None and args.all:
+        names = _engine_properties()
+    start = time.perf_counter()
+    try:
+        columns = pi.sweep(ranges, names)
+    except KeyError as err:
+        parser.error(err.args[0])
+    elapsed = time.perf_counter() - start
+    write_columns(columns, args.output)
+    points = len(next(iter(columns.values())))
+    print(
+        f"{points} points x {len(columns)} columns in {elapsed:.2f} s",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())